@@ -1,6 +1,6 @@
 import logging
 
-from fastapi.responses import JSONResponse
+from app.utils.codec import FastJSONResponse
 
 from app.schemas.http.categories import CategoriesHttpRequest, CategoriesHttpResponse
 from app.service.category_pipeline import run_category_pipeline
@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 @log_flow
 async def categorize_controller(
     req: CategoriesHttpRequest
-) -> JSONResponse:
+) -> FastJSONResponse:
     """
     이미지를 카테고리별로 분류하는 컨트롤러입니다.
 
@@ -22,7 +22,7 @@ async def categorize_controller(
         request: FastAPI 요청 객체
 
     Returns:
-        JSONResponse: 카테고리별 이미지 그룹 정보를 포함한 응답
+        FastJSONResponse: 카테고리별 이미지 그룹 정보를 포함한 응답
 
     """
     try:
@@ -38,18 +38,18 @@ async def categorize_controller(
             "category_count": len(response.data or []) if response.data else 0
         })
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
-            content=response.model_dump()
+            content=response
         )
     
     except Exception as e:
         logger.exception(f"[INTERNAL_ERROR] quality Http 컨트롤러 예외 발생: {e}")
         status_code = 500
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
             content=CategoriesHttpResponse(
                 message=get_message_by_status(status_code),
                 data=None
-            ).model_dump()
+            )
         )
\ No newline at end of file
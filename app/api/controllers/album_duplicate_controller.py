@@ -1,6 +1,6 @@
 import logging
 
-from fastapi.responses import JSONResponse
+from app.utils.codec import FastJSONResponse
 
 # from app.core.cache import get_cached_embeddings_parallel
 from app.schemas.http.duplicate import DuplicateHttpRequest, DuplicateHttpResponse
@@ -11,7 +11,7 @@ from app.utils.status_message import get_message_by_status
 logger = logging.getLogger(__name__)
 
 @log_flow
-async def duplicate_controller(req: DuplicateHttpRequest) -> JSONResponse:
+async def duplicate_controller(req: DuplicateHttpRequest) -> FastJSONResponse:
     """
     중복 이미지를 검색하는 컨트롤러입니다.
 
@@ -19,7 +19,7 @@ async def duplicate_controller(req: DuplicateHttpRequest) -> JSONResponse:
         req: 이미지 파일명 목록을 포함한 요청 객체
 
     Returns:
-        JSONResponse: 중복 이미지 그룹 정보를 포함한 응답
+        FastJSONResponse: 중복 이미지 그룹 정보를 포함한 응답
             {
                 "message": "success",
                 "data": List[List[str]]  # 중복 이미지 그룹 리스트
@@ -40,18 +40,18 @@ async def duplicate_controller(req: DuplicateHttpRequest) -> JSONResponse:
             "duplicate_count": len(response.data.duplicate_images or []) if response.data else 0
         })
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
-            content=response.model_dump()
+            content=response
         )
     
     except Exception as e:
         logger.exception(f"[INTERNAL_ERROR] Duplicate Http 컨트롤러 예외 발생: {e}")
         status_code = 500
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
             content=DuplicateHttpResponse(
                 message=get_message_by_status(status_code),
                 data=None
-            ).model_dump()
+            )
         )
\ No newline at end of file
@@ -1,5 +1,5 @@
 import logging
-from fastapi.responses import JSONResponse
+from app.utils.codec import FastJSONResponse
 
 from app.schemas.http.embedding import EmbeddingHttpRequest, EmbeddingHttpResponse
 from app.service.embedding_pipeline import run_embedding_pipeline
@@ -9,7 +9,7 @@ from app.utils.status_message import get_message_by_status
 logger = logging.getLogger(__name__)
 
 @log_flow
-async def embed_controller(req: EmbeddingHttpRequest) -> JSONResponse:
+async def embed_controller(req: EmbeddingHttpRequest) -> FastJSONResponse:
     """
     클라이언트로부터 이미지 파일명을 받아 GPU 서버에 전달하고,
     임베딩 결과를 받아 캐싱하는 컨트롤러입니다.
@@ -24,18 +24,18 @@ async def embed_controller(req: EmbeddingHttpRequest) -> JSONResponse:
             "invalid_images": len(response.data.invalid_images or []) if response.data else 0
         })
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
-            content=response.model_dump()
+            content=response
         )
 
     except Exception as e:
         logger.exception(f"[INTERNAL_ERROR] Embedding Http 컨트롤러 예외 발생: {3}")
         status_code = 500
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
             content=EmbeddingHttpResponse(
                 message=get_message_by_status(status_code),
                 data=None
-            ).model_dump()
+            )
         )
@@ -1,5 +1,5 @@
 import logging
-from fastapi.responses import JSONResponse
+from app.utils.codec import FastJSONResponse
 
 from app.schemas.http.people import PeopleHttpRequest, PeopleHttpResponse
 from app.service.people_pipeline import run_people_clustering_pipeline
@@ -9,7 +9,7 @@ from app.utils.status_message import get_message_by_status
 logger = logging.getLogger(__name__)
 
 @log_flow
-async def people_controller(req: PeopleHttpRequest) -> JSONResponse:
+async def people_controller(req: PeopleHttpRequest) -> FastJSONResponse:
     """
     클라이언트로부터 이미지 파일명을 받아 GPU 서버에 전달하고,
     클러스터링 결과를 받아 응답합니다.
@@ -38,18 +38,18 @@ async def people_controller(req: PeopleHttpRequest) -> JSONResponse:
             "cluster_count": len(response.data or [])
         })
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
-            content=response.model_dump()
+            content=response
         )
 
     except Exception as e:
         logger.exception(f"[INTERNAL_ERROR] people_controller 예외 발생: {e}")
         status_code = 500
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
             content=PeopleHttpResponse(
                 message=get_message_by_status(status_code),
                 data=None
-            ).model_dump()
+            )
         )
@@ -1,6 +1,6 @@
 import logging
 
-from fastapi.responses import JSONResponse
+from app.utils.codec import FastJSONResponse
 
 from app.schemas.http.quality import QualityHttpRequest, QualityHttpResponse
 from app.service.quality_pipeline import run_quality_pipeline
@@ -12,7 +12,7 @@ THRESHOLD = 80  # 저품질 이미지 판별을 위한 임계값
 
 
 @log_flow
-async def quality_controller(req: QualityHttpRequest) -> JSONResponse:
+async def quality_controller(req: QualityHttpRequest) -> FastJSONResponse:
     """
     저품질 이미지를 검색하는 컨트롤러입니다.
 
@@ -21,7 +21,7 @@ async def quality_controller(req: QualityHttpRequest) -> JSONResponse:
         request: FastAPI 요청 객체
 
     Returns:
-        JSONResponse: 저품질 이미지 목록을 포함한 응답
+        FastJSONResponse: 저품질 이미지 목록을 포함한 응답
 
     """
     try:
@@ -40,18 +40,18 @@ async def quality_controller(req: QualityHttpRequest) -> JSONResponse:
             },
         )
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
-            content=response_model.model_dump(),
+            content=response_model,
         )
     
     except Exception as e:
         logger.exception(f"[INTERNAL_ERROR] quality Http 컨트롤러 예외 발생: {e}")
         status_code = 500
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
             content=QualityHttpResponse(
                 message=get_message_by_status(status_code),
                 data=None
-            ).model_dump()
+            )
         )
\ No newline at end of file
@@ -1,6 +1,6 @@
 import logging
 
-from fastapi.responses import JSONResponse
+from app.utils.codec import FastJSONResponse
 
 from app.schemas.http.score import ScoreHttpRequest, ScoreHttpResponse
 from app.service.highlight_pipeline import run_highlight_pipeline
@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 
 
 @log_flow
-async def highlight_scoring_controller(req: ScoreHttpRequest) -> JSONResponse:
+async def highlight_scoring_controller(req: ScoreHttpRequest) -> FastJSONResponse:
     """
     각 카테고리별 이미지 점수를 계산하는 컨트롤러입니다.
 
@@ -19,7 +19,7 @@ async def highlight_scoring_controller(req: ScoreHttpRequest) -> JSONResponse:
         req: 카테고리별 이미지 목록을 포함한 요청 객체
 
     Returns:
-        JSONResponse: 카테고리별 이미지 점수 정보를 포함한 응답
+        FastJSONResponse: 카테고리별 이미지 점수 정보를 포함한 응답
             {
                 "message": "success",
                 "data": List[Dict[str, Any]]  # 카테고리별 이미지 점수 리스트
@@ -44,18 +44,18 @@ async def highlight_scoring_controller(req: ScoreHttpRequest) -> JSONResponse:
             },
         )
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
-            content=response_model.dict(),
+            content=response_model,
         )
     
     except Exception as e:
         logger.exception(f"[INTERNAL_ERROR] Score Http 컨트롤러 예외 발생: {3}")
         status_code = 500
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
             content=ScoreHttpResponse(
                 message=get_message_by_status(status_code),
                 data=None
-            ).model_dump()
+            )
         )        
@@ -2,7 +2,6 @@
 
 import os
 import asyncio
-import httpx
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from loguru import logger
@@ -10,11 +9,15 @@ from loguru import logger
 import torch
 
 from app.config.redis import init_redis
+from app.core.cache import REDIS_CACHE_TTL, EMBEDDING_FALLBACK_NAMESPACE
+from app.core.cache_invalidation import get_invalidation_bus
+from app.core.shared_cache import init_shared_embedding_store
+from app.core.gpu_client import GpuClient, create_gpu_client
 from app.config.settings import (
     IMAGE_MODE, MODEL_NAME, MODEL_BASE_PATH,
     CATEGORY_FEATURES_FILENAME, QUALITY_FEATURES_FILENAME,
 )
-from app.config.kafka_config import KAFKA_GROUP_ID_MAP
+from app.config.kafka_config import KAFKA_CONSOLIDATED_GROUP, KAFKA_GROUP_ID_MAP
 from app.model.aesthetic_regressor import load_aesthetic_regressor
 from app.utils.image_loader import get_image_loader, S3ImageLoader, GCSImageLoader
 
@@ -33,12 +36,16 @@ class AppConfig:
         self.quality_fields = None
         self.redis = None
         self.redis_semaphore = None
-        self.gpu_client: Optional[httpx.AsyncClient] = None
+        self.shared_embedding_store = None
+        self.gpu_client: Optional[GpuClient] = None
         self.kafka_bootstrap_servers: Optional[str] = None
         self.kafka_tasks: list[asyncio.Task] = []
+        self.backfill_task: Optional[asyncio.Task] = None
 
     async def initialize(self):
-        from app.kafka.consumer import run_kafka_consumer, ALL_TOPICS
+        from app.kafka.consumer import (
+            run_kafka_consumer, run_consolidated_kafka_consumer, ALL_TOPICS,
+        )
 
         self.loop = asyncio.get_running_loop()
         self.executor = ThreadPoolExecutor(max_workers=8)
@@ -75,6 +82,7 @@ class AppConfig:
 
         self.redis = init_redis()
         self.redis_semaphore = asyncio.Semaphore(80)
+        self.shared_embedding_store = init_shared_embedding_store(REDIS_CACHE_TTL)
         
         try:
             if await self.redis.ping():
@@ -82,23 +90,39 @@ class AppConfig:
         except Exception as e:
             logger.error(f"Redis 연결 실패: {e}")
 
-        gpu_server_base_url = os.getenv("GPU_SERVER_BASE_URL")
-        if not gpu_server_base_url:
-            raise EnvironmentError("GPU_SERVER_BASE_URL이 .env 파일에 없습니다.")
+        # 다른 워커가 삭제·재임베딩한 이미지를 이 워커의 메모리 캐시에서 제거
+        get_invalidation_bus().start()
 
-        self.gpu_client = httpx.AsyncClient(
-            base_url=gpu_server_base_url,
-            timeout=60.0,
-            headers={"Content-Type": "application/json"},
-        )
+        # 모델 전환 중이면 fallback 네임스페이스(또는 다른 모델의 레거시 키)를 현재 네임스페이스로 재임베딩
+        from app.service.embedding_backfill import get_embedding_backfiller
+        get_embedding_backfiller().start()
+        if EMBEDDING_FALLBACK_NAMESPACE is not None:
+            self.backfill_task = asyncio.create_task(
+                get_embedding_backfiller().backfill_namespace(EMBEDDING_FALLBACK_NAMESPACE)
+            )
 
-        # Kafka 컨슈머 루프 등록 (두 그룹 모두 실행)
-        for topic in ALL_TOPICS:
-            group_id = KAFKA_GROUP_ID_MAP[topic]
-            task = asyncio.create_task(run_kafka_consumer(topic, group_id))
+        self.gpu_client = create_gpu_client()
+
+        # Kafka 컨슈머 루프 등록
+        if KAFKA_CONSOLIDATED_GROUP:
+            task = asyncio.create_task(run_consolidated_kafka_consumer(KAFKA_CONSOLIDATED_GROUP))
             self.kafka_tasks.append(task)
+        else:
+            for topic in ALL_TOPICS:
+                group_id = KAFKA_GROUP_ID_MAP[topic]
+                task = asyncio.create_task(run_kafka_consumer(topic, group_id))
+                self.kafka_tasks.append(task)
 
     async def cleanup(self):
+        from app.service.embedding_backfill import get_embedding_backfiller
+        if self.backfill_task is not None:
+            self.backfill_task.cancel()
+            try:
+                await self.backfill_task
+            except asyncio.CancelledError:
+                pass
+        await get_embedding_backfiller().stop()
+
         for task in self.kafka_tasks:
             task.cancel()
             try:
@@ -116,6 +140,14 @@ class AppConfig:
         if IMAGE_MODE == IMAGE_MODE.S3 and isinstance(self.image_loader, S3ImageLoader):
             await self.image_loader.close_client()
 
+        await get_invalidation_bus().stop()
+
+        if self.gpu_client is not None:
+            await self.gpu_client.aclose()
+
+        if self.shared_embedding_store is not None:
+            self.shared_embedding_store.close()
+
     def get_executor(self):
         return self.executor
 
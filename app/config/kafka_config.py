@@ -14,6 +14,27 @@ KAFKA_GROUP_ID_MAP = {
     "album.ai.people.request": os.getenv("KAFKA_GROUP_PEOPLE"),
 }
 
+# 설정하면 토픽별 컨슈머 대신 모든 요청 토픽을 구독하는 하나의 컨슈머를 이 그룹으로 실행합니다.
+KAFKA_CONSOLIDATED_GROUP = os.getenv("KAFKA_CONSOLIDATED_GROUP")
+# 통합 컨슈머가 공유하는 트랜잭션 프로듀서 수 (동시에 커밋할 수 있는 파티션 배치 수)
+KAFKA_PRODUCER_POOL_SIZE = int(os.getenv("KAFKA_PRODUCER_POOL_SIZE", "4"))
+
+# 폴링 한 번에 가져올 레코드 수 범위 (처리 시간에 따라 이 범위에서 조정)
+KAFKA_MAX_POLL_RECORDS = int(os.getenv("KAFKA_MAX_POLL_RECORDS", "100"))
+KAFKA_MIN_POLL_RECORDS = int(os.getenv("KAFKA_MIN_POLL_RECORDS", "1"))
+# 유휴 상태에서 늘어나는 폴링 타임아웃 범위(ms)
+KAFKA_POLL_TIMEOUT_MIN_MS = int(os.getenv("KAFKA_POLL_TIMEOUT_MIN_MS", "200"))
+KAFKA_POLL_TIMEOUT_MAX_MS = int(os.getenv("KAFKA_POLL_TIMEOUT_MAX_MS", "2000"))
+# 컨슈머당 동시에 처리 중일 수 있는 최대 메시지 수 (초과하면 파티션 pause)
+KAFKA_MAX_INFLIGHT_MESSAGES = int(os.getenv("KAFKA_MAX_INFLIGHT_MESSAGES", "200"))
+# 배치 하나의 목표 처리 시간(초), max_poll_interval(기본 300초)보다 충분히 작게 설정
+KAFKA_TARGET_BATCH_SECONDS = float(os.getenv("KAFKA_TARGET_BATCH_SECONDS", "30"))
+# 커밋하지 못한 메시지를 다시 읽기 전 대기 시간 범위(ms), 연속 실패마다 두 배로 늘림
+KAFKA_RETRY_BACKOFF_MIN_MS = int(os.getenv("KAFKA_RETRY_BACKOFF_MIN_MS", "500"))
+KAFKA_RETRY_BACKOFF_MAX_MS = int(os.getenv("KAFKA_RETRY_BACKOFF_MAX_MS", "30000"))
+# 파티션을 회수당할 때 처리 중인 배치가 끝나기를 기다리는 최대 시간(초), 지나면 취소
+KAFKA_REVOKE_DRAIN_SECONDS = float(os.getenv("KAFKA_REVOKE_DRAIN_SECONDS", "10"))
+
 KAFKA_REQUEST_TOPICS = [
     "album.ai.embedding.request",
     "album.ai.duplicate.request",
@@ -23,6 +44,17 @@ KAFKA_REQUEST_TOPICS = [
     "album.ai.people.request",
 ]
 
+# 파티션 배치 안에서 동시에 처리할 최대 메시지 수 (1이면 순차 처리)
+KAFKA_HANDLER_CONCURRENCY = int(os.getenv("KAFKA_HANDLER_CONCURRENCY", "4"))
+KAFKA_HANDLER_CONCURRENCY_MAP = {
+    "album.ai.category.request": int(os.getenv("KAFKA_CONCURRENCY_CATEGORY", str(KAFKA_HANDLER_CONCURRENCY))),
+    "album.ai.duplicate.request": int(os.getenv("KAFKA_CONCURRENCY_DUPLICATE", "2")),
+    "album.ai.quality.request": int(os.getenv("KAFKA_CONCURRENCY_QUALITY", "2")),
+    "album.ai.score.request": int(os.getenv("KAFKA_CONCURRENCY_SCORE", str(KAFKA_HANDLER_CONCURRENCY))),
+    "album.ai.embedding.request": int(os.getenv("KAFKA_CONCURRENCY_EMBEDDING", "16")),
+    "album.ai.people.request": int(os.getenv("KAFKA_CONCURRENCY_PEOPLE", "2")),
+}
+
 KAFKA_RESPONSE_TOPIC_MAP = {
     req: req.replace("request", "response")
     for req in KAFKA_REQUEST_TOPICS
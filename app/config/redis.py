@@ -29,7 +29,8 @@ def init_redis() -> Redis:
         port=REDIS_PORT,
         db=REDIS_DB,
         max_connections=100,
-        decode_responses=True,
+        # 임베딩을 바이너리(float32/float16)로 저장하므로 bytes 모드로 연결합니다.
+        decode_responses=False,
     )
 
     retry_strategy = Retry(
@@ -0,0 +1,238 @@
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import torch
+from dotenv import load_dotenv
+
+from app.core.cache import get_cached_embedding_matrix
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+ALBUM_MATRIX_CACHE_MAX_BYTES = int(
+    os.getenv("ALBUM_MATRIX_CACHE_MAX_BYTES", str(256 * 1024 * 1024))
+)
+ALBUM_MATRIX_CACHE_TTL = int(os.getenv("ALBUM_MATRIX_CACHE_TTL", "600"))
+
+
+def image_list_digest(image_refs: list[str]) -> str:
+    """
+    순서가 있는 이미지 목록의 해시를 계산합니다.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for ref in image_refs:
+        hasher.update(ref.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def normalize_embeddings(image_features: torch.Tensor) -> torch.Tensor:
+    """
+    [N, D] 임베딩 행렬을 행 단위로 L2 정규화합니다.
+    """
+    return image_features / image_features.norm(dim=-1, keepdim=True)
+
+
+@dataclass
+class AlbumEmbeddingMatrix:
+    """
+    앨범 단위로 캐싱되는 L2 정규화된 임베딩 행렬입니다.
+
+    Attributes:
+        image_refs: 행 순서와 같은 이미지 목록
+        positions: 이미지 → 행 인덱스
+        matrix: [N, D] L2 정규화된 임베딩 행렬
+        digest: image_refs의 해시
+        expires_at: 만료 시각 (time.monotonic 기준)
+
+    """
+
+    image_refs: list[str]
+    positions: dict[str, int]
+    matrix: torch.Tensor
+    digest: str
+    expires_at: float
+
+    @property
+    def nbytes(self) -> int:
+        return self.matrix.element_size() * self.matrix.nelement()
+
+
+class AlbumMatrixCache:
+    """
+    albumId별로 정규화된 [N, D] 임베딩 행렬과 이미지 인덱스를 보관하는 LRU 캐시입니다.
+
+    요청한 이미지 목록의 해시가 같으면 캐싱된 행렬을 그대로 반환하고, 캐싱된 행렬이
+    요청 이미지를 모두 포함하면 해당 행만 모아서 반환합니다. 새 사진이 임베딩되면
+    `append`로 행을 추가합니다.
+    """
+
+    def __init__(self, max_bytes: int, ttl: int) -> None:
+        """
+        Args:
+            max_bytes: 보관할 행렬의 최대 총 바이트 수
+            ttl: 항목 유효 시간(초)
+
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[int, AlbumEmbeddingMatrix] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, album_id: int, image_refs: list[str]) -> Optional[torch.Tensor]:
+        entry = self._entries.get(album_id)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self.invalidate(album_id)
+            return None
+
+        self._entries.move_to_end(album_id)
+
+        if entry.digest == image_list_digest(image_refs):
+            return entry.matrix
+
+        try:
+            indices = [entry.positions[ref] for ref in image_refs]
+        except KeyError:
+            return None
+
+        return entry.matrix[torch.tensor(indices, dtype=torch.long)]
+
+    def put(self, album_id: int, image_refs: list[str], matrix: torch.Tensor) -> None:
+        """
+        정규화된 행렬을 앨범 항목으로 저장합니다.
+        """
+        entry = AlbumEmbeddingMatrix(
+            image_refs=list(image_refs),
+            positions={ref: i for i, ref in enumerate(image_refs)},
+            matrix=matrix,
+            digest=image_list_digest(image_refs),
+            expires_at=time.monotonic() + self.ttl,
+        )
+        self._store(album_id, entry)
+
+    def append(self, album_id: int, image_refs: list[str], vectors: torch.Tensor) -> None:
+        """
+        이미 캐싱된 앨범에 새로 임베딩된 이미지의 행을 추가합니다.
+
+        캐싱된 앨범이 없으면 아무것도 하지 않습니다. 이미 있는 이미지는 행을 교체합니다.
+
+        Args:
+            album_id: 앨범 ID
+            image_refs: 새로 임베딩된 이미지 목록
+            vectors: [M, D] 정규화되지 않은 임베딩
+
+        """
+        entry = self._entries.get(album_id)
+        if entry is None or not image_refs:
+            return
+
+        vectors = normalize_embeddings(vectors.to(torch.float32))
+        if vectors.size(-1) != entry.matrix.size(-1):
+            self.invalidate(album_id)
+            return
+
+        matrix = entry.matrix.clone()
+        refs = list(entry.image_refs)
+        positions = dict(entry.positions)
+        new_rows = []
+        for ref, vector in zip(image_refs, vectors):
+            if ref in positions:
+                matrix[positions[ref]] = vector
+                continue
+            positions[ref] = len(refs)
+            refs.append(ref)
+            new_rows.append(vector)
+
+        if new_rows:
+            matrix = torch.cat([matrix, torch.stack(new_rows)], dim=0)
+
+        self._store(album_id, AlbumEmbeddingMatrix(
+            image_refs=refs,
+            positions=positions,
+            matrix=matrix,
+            digest=image_list_digest(refs),
+            expires_at=time.monotonic() + self.ttl,
+        ))
+
+    def invalidate(self, album_id: int) -> None:
+        entry = self._entries.pop(album_id, None)
+        if entry is not None:
+            self._bytes -= entry.nbytes
+
+    def discard_refs(self, image_refs: list[str]) -> None:
+        """
+        주어진 이미지 중 하나라도 포함한 앨범 항목을 제거합니다. (삭제·재임베딩된 이미지)
+        """
+        refs = set(image_refs)
+        stale = [
+            album_id for album_id, entry in self._entries.items()
+            if not refs.isdisjoint(entry.positions)
+        ]
+        for album_id in stale:
+            self.invalidate(album_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _store(self, album_id: int, entry: AlbumEmbeddingMatrix) -> None:
+        self.invalidate(album_id)
+        if entry.nbytes > self.max_bytes:
+            return
+
+        self._entries[album_id] = entry
+        self._bytes += entry.nbytes
+
+        while self._bytes > self.max_bytes:
+            oldest_album_id = next(iter(self._entries))
+            self.invalidate(oldest_album_id)
+
+
+_album_matrix_cache = AlbumMatrixCache(ALBUM_MATRIX_CACHE_MAX_BYTES, ALBUM_MATRIX_CACHE_TTL)
+
+
+def get_album_matrix_cache() -> AlbumMatrixCache:
+    return _album_matrix_cache
+
+
+async def get_album_embedding_matrix(
+    album_id: Optional[int], image_refs: list[str]
+) -> tuple[Optional[torch.Tensor], list[str]]:
+    """
+    앨범의 L2 정규화된 [N, D] 임베딩 행렬을 조회합니다.
+
+    albumId가 있으면 앨범 행렬 캐시를 먼저 확인하고, 없으면 임베딩 캐시에서 읽어
+    정규화한 뒤 앨범 행렬 캐시에 저장합니다. 반환된 행렬은 공유되므로 in-place로
+    수정하면 안 됩니다.
+
+    Args:
+        album_id: Kafka 요청의 albumId (HTTP 요청은 None)
+        image_refs: 이미지 목록
+
+    Returns:
+        Tuple[torch.Tensor | None, list[str]]: 정규화된 [N, D] 행렬, 누락 키 목록
+
+    """
+    if album_id is not None:
+        matrix = _album_matrix_cache.get(album_id, image_refs)
+        if matrix is not None:
+            logger.debug(f"[ALBUM_MATRIX HIT] album_id={album_id}, images={len(image_refs)}")
+            return matrix, []
+
+    image_features, missing_keys = await get_cached_embedding_matrix(image_refs)
+    if image_features is None or missing_keys:
+        return image_features, missing_keys
+
+    matrix = normalize_embeddings(image_features)
+    if album_id is not None:
+        _album_matrix_cache.put(album_id, image_refs, matrix)
+
+    return matrix, missing_keys
@@ -1,13 +1,28 @@
 import json, logging
+from collections import OrderedDict
 from typing import Any
 import traceback
 import os
 import asyncio
+import struct
+import time
+import warnings
+from datetime import datetime
 from dotenv import load_dotenv
 
+import numpy as np
 import torch
 
 from app.config.redis import get_redis
+from app.config.settings import MODEL_NAME
+from app.core.metrics import (
+    LOCAL_EMBEDDING_CACHE_BYTES,
+    LOCAL_EMBEDDING_CACHE_EVICTIONS,
+    LOCAL_EMBEDDING_CACHE_HITS,
+    LOCAL_EMBEDDING_CACHE_MISSES,
+)
+from app.core.shared_cache import get_shared_embedding_store
+from app.model.aesthetic_regressor import MODEL_DIMENSIONS
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -22,24 +37,346 @@ except ValueError as e:
 except Exception as e:
     raise EnvironmentError("REDIS_CACHE_TTL이 정수로 지정되어야 합니다.")
 
+REDIS_EMBEDDING_DTYPE = os.getenv("REDIS_EMBEDDING_DTYPE", "float32")
+EMBEDDING_VERSION = os.getenv("EMBEDDING_VERSION", "1")
+EMBEDDING_KEY_PREFIX = "emb"
+# 모델 전환 중 새 네임스페이스가 채워질 때까지 읽을 이전 네임스페이스 (예: ViT-B/32, 1)
+EMBEDDING_FALLBACK_MODEL = os.getenv("EMBEDDING_FALLBACK_MODEL")
+EMBEDDING_FALLBACK_VERSION = os.getenv("EMBEDDING_FALLBACK_VERSION", EMBEDDING_VERSION)
+# 네임스페이스 도입 전 키(이미지 ref 그대로)를 읽을지 여부와 그 값을 만든 모델
+# 이전 배포의 캐시를 옮기는 동안만 켜고, EMBEDDING_LEGACY_READ_UNTIL(YYYY-MM-DD)이 지나면 읽지 않음
+EMBEDDING_READ_LEGACY_KEYS = os.getenv("EMBEDDING_READ_LEGACY_KEYS", "false").lower() == "true"
+EMBEDDING_LEGACY_MODEL = os.getenv("EMBEDDING_LEGACY_MODEL", MODEL_NAME.value)
+EMBEDDING_LEGACY_READ_UNTIL = os.getenv("EMBEDDING_LEGACY_READ_UNTIL")
+# 전체 삭제 후 레거시 키를 다시 읽지 않도록 남기는 표시 (emb:* 스위프 대상이 아님)
+EMBEDDING_LEGACY_DISABLED_KEY = f"{EMBEDDING_KEY_PREFIX}-legacy-disabled"
+REDIS_MGET_CHUNK_SIZE = int(os.getenv("REDIS_MGET_CHUNK_SIZE", "256"))
+LOCAL_EMBEDDING_CACHE_MAX_BYTES = int(
+    os.getenv("LOCAL_EMBEDDING_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+
+# 임베딩 바이너리 포맷: [magic(2) | version(1) | dtype(1) | dim(4)] + little-endian raw bytes
+EMBEDDING_MAGIC = b"OE"
+EMBEDDING_FORMAT_VERSION = 1
+EMBEDDING_HEADER = struct.Struct("<2sBBI")
+
+_DTYPE_TO_CODE = {"float32": 0, "float16": 1}
+_CODE_TO_DTYPE = {0: np.dtype("<f4"), 1: np.dtype("<f2")}
+
+if REDIS_EMBEDDING_DTYPE not in _DTYPE_TO_CODE:
+    raise EnvironmentError(
+        f"잘못된 REDIS_EMBEDDING_DTYPE: {REDIS_EMBEDDING_DTYPE}. 선택 가능한 값: {list(_DTYPE_TO_CODE)}"
+    )
+
+
+def embedding_namespace(
+    model_name: str = MODEL_NAME.value, version: str = EMBEDDING_VERSION
+) -> str:
+    """
+    모델 이름과 임베딩 버전으로 구성된 캐시 키 네임스페이스를 반환합니다.
+
+    예: ViT-B/32, 버전 1 → "emb:ViT-B-32:v1"
+    """
+    return f"{EMBEDDING_KEY_PREFIX}:{model_name.replace('/', '-')}:v{version}"
+
+
+EMBEDDING_NAMESPACE = embedding_namespace()
+EMBEDDING_DIM = MODEL_DIMENSIONS[MODEL_NAME.value]
+EMBEDDING_FALLBACK_NAMESPACE = (
+    embedding_namespace(EMBEDDING_FALLBACK_MODEL, EMBEDDING_FALLBACK_VERSION)
+    if EMBEDDING_FALLBACK_MODEL
+    else None
+)
+if EMBEDDING_FALLBACK_NAMESPACE == EMBEDDING_NAMESPACE:
+    EMBEDDING_FALLBACK_NAMESPACE = None
+
+_legacy_read_deadline = (
+    datetime.fromisoformat(EMBEDDING_LEGACY_READ_UNTIL).timestamp()
+    if EMBEDDING_LEGACY_READ_UNTIL
+    else float("inf")
+)
+_legacy_reads_enabled = EMBEDDING_READ_LEGACY_KEYS
+
+
+def embedding_key(image_ref: str, namespace: str | None = EMBEDDING_NAMESPACE) -> str:
+    """
+    이미지 ref에 대한 네임스페이스 캐시 키를 반환합니다. (namespace가 None이면 레거시 키)
+    """
+    if namespace is None:
+        return image_ref
+    return f"{namespace}:{image_ref}"
+
+
+def encode_embedding(value: Any, dtype: str = REDIS_EMBEDDING_DTYPE) -> bytes:
+    """
+    임베딩 벡터를 버전 헤더가 붙은 바이너리 포맷으로 인코딩합니다.
+
+    Args:
+        value: 1차원 임베딩 (torch.Tensor, np.ndarray 또는 list[float])
+        dtype: 저장 dtype ("float32" 또는 "float16")
+
+    Returns:
+        bytes: 헤더 + little-endian raw 벡터 바이트
+
+    """
+    if isinstance(value, torch.Tensor):
+        value = value.detach().cpu().numpy()
+
+    np_dtype = _CODE_TO_DTYPE[_DTYPE_TO_CODE[dtype]]
+    array = np.ascontiguousarray(value, dtype=np_dtype).reshape(-1)
+
+    header = EMBEDDING_HEADER.pack(
+        EMBEDDING_MAGIC, EMBEDDING_FORMAT_VERSION, _DTYPE_TO_CODE[dtype], array.size
+    )
+    return header + array.tobytes()
+
+
+def _decode_embedding_array(raw: bytes) -> np.ndarray:
+    """
+    Redis 값을 1차원 numpy 배열로 디코딩합니다. (float16 포맷은 float16 그대로 반환)
+    """
+    if raw[:2] != EMBEDDING_MAGIC:
+        # 레거시 JSON 포맷
+        return np.asarray(json.loads(raw), dtype=np.float32)
+
+    _, version, dtype_code, dim = EMBEDDING_HEADER.unpack_from(raw)
+    if version != EMBEDDING_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 임베딩 포맷 버전: {version}")
+
+    return np.frombuffer(
+        raw, dtype=_CODE_TO_DTYPE[dtype_code], count=dim, offset=EMBEDDING_HEADER.size
+    )
+
+
+def decode_embedding(raw: bytes) -> torch.Tensor:
+    """
+    Redis 값을 float32 텐서로 디코딩합니다.
+
+    float32 포맷은 복사 없이 Redis 응답 버퍼를 그대로 참조하므로 반환된 텐서를
+    in-place로 수정하면 안 됩니다. 마이그레이션 기간 동안 기존 JSON 값도 읽습니다.
+
+    Args:
+        raw: Redis에서 읽은 값
+
+    Returns:
+        torch.Tensor: shape (D,) float32 임베딩
+
+    """
+    array = _decode_embedding_array(raw)
+    if array.dtype != np.float32:
+        array = array.astype(np.float32)
+
+    # Redis 응답(bytes)은 읽기 전용 버퍼이므로 torch가 경고를 출력합니다. 캐시 텐서는 읽기 전용으로만 사용합니다.
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="The given NumPy array is not writable")
+        return torch.from_numpy(array)
+
+
+def _decode_raws(keys: list[str], raws: list[bytes | None]) -> list[np.ndarray | None]:
+    arrays: list[np.ndarray | None] = []
+    for key, raw in zip(keys, raws):
+        if raw is None:
+            arrays.append(None)
+            continue
+        try:
+            arrays.append(_decode_embedding_array(raw))
+        except Exception as e:
+            logger.error(f"[Redis DECODE ERROR] key='{key}' failed: {e}")
+            arrays.append(None)
+
+    return arrays
+
+
+def _stack_embedding_arrays(
+    keys: list[str], arrays: list[np.ndarray | None], dim: int | None = None
+) -> tuple[torch.Tensor | None, list[str]]:
+    if dim is None:
+        dim = next((a.size for a in arrays if a is not None), None)
+    if dim is None or all(a is None for a in arrays):
+        return None, list(keys)
+
+    matrix = np.zeros((len(keys), dim), dtype=np.float32)
+    missing_keys: list[str] = []
+    for i, (key, array) in enumerate(zip(keys, arrays)):
+        if array is None or array.size != dim:
+            missing_keys.append(key)
+            continue
+        matrix[i] = array
+
+    return torch.from_numpy(matrix), missing_keys
+
+
+def decode_embedding_batch(
+    keys: list[str], raws: list[bytes | None]
+) -> tuple[torch.Tensor | None, list[str]]:
+    """
+    여러 Redis 값을 하나의 [N, D] float32 행렬로 바로 디코딩합니다.
+
+    Args:
+        keys: 조회한 키 목록 (N개)
+        raws: 키 순서와 같은 Redis 값 목록 (없으면 None)
+
+    Returns:
+        Tuple[torch.Tensor | None, list[str]]: [N, D] 임베딩 행렬(누락된 행은 0), 누락 키 목록
+
+    """
+    return _stack_embedding_arrays(keys, _decode_raws(keys, raws))
+
+
+class LocalEmbeddingCache:
+    """
+    Redis 앞단에 위치하는 프로세스 내 임베딩 LRU 캐시입니다.
+
+    디코딩된 float32 벡터를 읽기 전용 numpy 배열로 보관하며, 바이트 예산을
+    넘으면 가장 오래 사용되지 않은 항목부터 제거합니다. TTL은 Redis와 같은
+    `REDIS_CACHE_TTL`을 사용합니다.
+    """
+
+    def __init__(self, max_bytes: int, ttl: int) -> None:
+        """
+        Args:
+            max_bytes: 보관할 벡터의 최대 총 바이트 수
+            ttl: 항목 유효 시간(초)
+
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[np.ndarray, float]] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: str) -> np.ndarray | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            LOCAL_EMBEDDING_CACHE_MISSES.inc()
+            return None
+
+        array, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            LOCAL_EMBEDDING_CACHE_EVICTIONS.inc()
+            LOCAL_EMBEDDING_CACHE_MISSES.inc()
+            return None
+
+        self._entries.move_to_end(key)
+        LOCAL_EMBEDDING_CACHE_HITS.inc()
+        return array
+
+    def put(self, key: str, array: np.ndarray) -> None:
+        if self.max_bytes <= 0:
+            return
+
+        array = np.array(array, dtype=np.float32).reshape(-1)
+        array.flags.writeable = False
+        if array.nbytes > self.max_bytes:
+            return
+
+        self._remove(key)
+        self._entries[key] = (array, time.monotonic() + self.ttl)
+        self._bytes += array.nbytes
+
+        while self._bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            LOCAL_EMBEDDING_CACHE_EVICTIONS.inc()
+
+        LOCAL_EMBEDDING_CACHE_BYTES.set(self._bytes)
+
+    def pop(self, key: str) -> None:
+        self._remove(key)
+        LOCAL_EMBEDDING_CACHE_BYTES.set(self._bytes)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+        LOCAL_EMBEDDING_CACHE_BYTES.set(0)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[0].nbytes
+
+
+_local_cache = LocalEmbeddingCache(LOCAL_EMBEDDING_CACHE_MAX_BYTES, REDIS_CACHE_TTL)
+
+
+def get_local_embedding_cache() -> LocalEmbeddingCache:
+    return _local_cache
+
+
+def _read_memory_tiers(key: str) -> np.ndarray | None:
+    """
+    프로세스 내 캐시 → 워커 공유 캐시 순서로 조회합니다.
+    """
+    array = _local_cache.get(key)
+    if array is not None:
+        return array
+
+    shared = get_shared_embedding_store()
+    if shared is not None:
+        array = shared.get(key)
+        if array is not None:
+            _local_cache.put(key, array)
+
+    return array
+
+
+def _fill_memory_tiers(items: dict[str, np.ndarray]) -> None:
+    """
+    Redis에서 읽거나 Redis에 쓴 벡터를 프로세스 내 캐시와 워커 공유 캐시에 반영합니다.
+    """
+    if not items:
+        return
+
+    for key, array in items.items():
+        _local_cache.put(key, array)
+
+    shared = get_shared_embedding_store()
+    if shared is not None:
+        shared.put_many(items)
+
+
 async def get_cached_embedding(key: str) -> Any | None:
+    matrix, missing_keys = await get_cached_embedding_matrix([key])
+    if matrix is None or missing_keys:
+        logger.warning(f"[Redis GET] key='{key}' not found")
+        return None
+
+    return matrix[0]
+
+
+async def get_existing_embedding_refs(
+    keys: list[str], chunk_size: int = REDIS_MGET_CHUNK_SIZE
+) -> set[str]:
+    """
+    현재 네임스페이스에 임베딩이 이미 있는 이미지 ref를 반환합니다.
+
+    메모리 계층을 먼저 확인하고, 나머지는 파이프라인 EXISTS로 확인합니다.
+    """
     from app.config.app_config import get_config
     redis = get_redis()
     semaphore = get_config().redis_semaphore
 
-    try:
-        async with semaphore:
-            value = await redis.get(key)
+    existing = {key for key in keys if _read_memory_tiers(embedding_key(key)) is not None}
+    remaining = [key for key in keys if key not in existing]
 
-        if value is None:
-            logger.warning(f"[Redis GET] key='{key}' not found")
-            return None
+    for i in range(0, len(remaining), chunk_size):
+        chunk = remaining[i : i + chunk_size]
+        try:
+            async with semaphore:
+                async with redis.pipeline(transaction=False) as pipe:
+                    for key in chunk:
+                        pipe.exists(embedding_key(key))
+                    results = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            logger.error(f"[Redis EXISTS ERROR] {len(chunk)}개 키 확인 실패: {e}")
+            continue
 
-        return torch.tensor(json.loads(value))
-    
-    except Exception as e:
-        logger.error(f"[Redis GET ERROR] key='{key}' failed: {e}", exc_info=True)
-        return None
+        existing.update(
+            key for key, result in zip(chunk, results)
+            if not isinstance(result, Exception) and result
+        )
+
+    return existing
 
 
 async def set_cached_embedding(key: str, value: Any) -> None:
@@ -47,75 +384,370 @@ async def set_cached_embedding(key: str, value: Any) -> None:
     redis = get_redis()
     semaphore = get_config().redis_semaphore
 
+    redis_key = embedding_key(key)
     try:
-        if isinstance(value, torch.Tensor):
-            value = value.cpu().float().tolist()
+        payload = encode_embedding(value)
 
         ttl = int(REDIS_CACHE_TTL)
         async with semaphore:
-            result = await redis.set(key, json.dumps(value), ex=ttl)
+            result = await redis.set(redis_key, payload, ex=ttl)
 
         if not result:
             raise RuntimeError(f"Redis SET failed for key='{key}' (result=False)")
 
+        _fill_memory_tiers({redis_key: _decode_embedding_array(payload)})
+
     except Exception as e:
         logger.error(f"[Redis SET ERROR] key='{key}' failed: {e}", exc_info=True)
         raise
 
+    await _publish_invalidation(EMBEDDING_NAMESPACE, [key])
+
+
+async def set_cached_embeddings_bulk(items: dict[str, Any]) -> list[str]:
+    """
+    여러 임베딩을 하나의 파이프라인(transaction 없음)으로 SET EX 저장합니다.
+
+    Args:
+        items: 이미지 ref → 임베딩 딕셔너리
+
+    Returns:
+        list[str]: 저장에 실패한 이미지 ref 목록
+
+    """
+    from app.config.app_config import get_config
+    redis = get_redis()
+    semaphore = get_config().redis_semaphore
+
+    failed_keys: list[str] = []
+    payloads: dict[str, bytes] = {}
+    for key, value in items.items():
+        try:
+            payloads[key] = encode_embedding(value)
+        except Exception as e:
+            logger.error(f"[Redis ENCODE ERROR] key='{key}' failed: {e}")
+            failed_keys.append(key)
+
+    if not payloads:
+        return failed_keys
+
+    ttl = int(REDIS_CACHE_TTL)
+    try:
+        async with semaphore:
+            async with redis.pipeline(transaction=False) as pipe:
+                for key, payload in payloads.items():
+                    pipe.set(embedding_key(key), payload, ex=ttl)
+                results = await pipe.execute(raise_on_error=False)
+
+    except Exception as e:
+        logger.error(
+            f"[Redis BULK SET ERROR] {len(payloads)}개 키 저장 실패: {e}", exc_info=True
+        )
+        return failed_keys + list(payloads)
+
+    stored: dict[str, np.ndarray] = {}
+    for (key, payload), result in zip(payloads.items(), results):
+        if isinstance(result, Exception) or not result:
+            logger.error(f"[Redis SET ERROR] key='{key}' failed: {result}")
+            failed_keys.append(key)
+            continue
+        stored[key] = _decode_embedding_array(payload)
+
+    _fill_memory_tiers({embedding_key(key): array for key, array in stored.items()})
+    await _publish_invalidation(EMBEDDING_NAMESPACE, list(stored))
+
+    return failed_keys
+
 
 async def del_embedding_cache(key: str) -> None:
     from app.config.app_config import get_config
     redis = get_redis()
     semaphore = get_config().redis_semaphore
 
+    redis_key = embedding_key(key)
+    evict_memory_tiers(EMBEDDING_NAMESPACE, [key])
+    shared = get_shared_embedding_store()
+    if shared is not None:
+        shared.delete(redis_key)
+
     try:
         async with semaphore:
-            await redis.delete(key)
+            # 레거시 키가 남아 있으면 다음 조회에서 현재 네임스페이스로 다시 복사되므로 함께 삭제
+            await redis.unlink(redis_key, embedding_key(key, None))
 
     except Exception as e:
         logger.error(f"[Redis DEL ERROR] key='{key}' failed: {e}", exc_info=True)
 
-async def clear_embedding_cache() -> None:
+    await _publish_invalidation(EMBEDDING_NAMESPACE, [key])
+
+
+def evict_memory_tiers(namespace: str | None, refs: list[str] | None) -> None:
+    """
+    이 워커의 프로세스 내 캐시와 앨범 행렬 캐시에서 항목을 제거합니다.
+
+    워커 공유 캐시(mmap)는 모든 워커가 함께 쓰므로 변경한 워커가 직접 갱신합니다.
+
+    Args:
+        namespace: 제거할 임베딩 네임스페이스 (refs가 None이면 무시)
+        refs: 제거할 이미지 ref 목록 (None이면 전체)
+
+    """
+    from app.core.album_cache import get_album_matrix_cache
+    album_cache = get_album_matrix_cache()
+
+    if refs is None:
+        album_cache.clear()
+        _local_cache.clear()
+        return
+
+    for ref in refs:
+        _local_cache.pop(embedding_key(ref, namespace))
+    album_cache.discard_refs(refs)
+
+
+async def _publish_invalidation(namespace: str, refs: list[str] | None) -> None:
+    from app.core.cache_invalidation import get_invalidation_bus
+    await get_invalidation_bus().publish(namespace, refs)
+
+
+def _clear_memory_tiers() -> None:
+    evict_memory_tiers(None, None)
+    shared = get_shared_embedding_store()
+    if shared is not None:
+        shared.clear()
+
+
+async def drop_embedding_namespace(namespace: str) -> "asyncio.Future[int]":
+    """
+    한 네임스페이스(예: 모델 변경 전 "emb:ViT-B-32:v1")의 키 삭제를 스위퍼에 예약합니다.
+
+    SCAN/UNLINK 삭제가 끝날 때까지 기다리지 않고 바로 반환합니다.
+
+    Returns:
+        asyncio.Future[int]: 삭제가 끝나면 삭제된 키 수를 결과로 갖는 Future
+
+    """
+    from app.core.cache_sweeper import get_cache_sweeper
+
+    if namespace == EMBEDDING_NAMESPACE:
+        _clear_memory_tiers()
+        await _publish_invalidation(namespace, None)
+
+    return get_cache_sweeper().schedule(f"{namespace}:*")
+
+
+async def clear_embedding_cache() -> "asyncio.Future[int]":
+    """
+    모든 임베딩 네임스페이스의 키 삭제를 스위퍼에 예약합니다.
+
+    KEYS/DEL과 달리 Redis를 블로킹하지 않으며, 삭제는 스위퍼 큐에서 순서대로 실행됩니다.
+    메모리 계층은 바로 비우고, Redis 삭제는 기다리지 않고 바로 반환합니다.
+    레거시 키(이미지 ref 그대로)는 패턴으로 골라낼 수 없으므로, 대신 모든 워커가 레거시 키를
+    더 읽지 않도록 표시를 남깁니다.
+
+    Returns:
+        asyncio.Future[int]: 삭제가 끝나면 삭제된 키 수를 결과로 갖는 Future
+
+    """
+    from app.config.app_config import get_config
+    from app.core.cache_sweeper import get_cache_sweeper
+
+    if _legacy_reads_enabled:
+        _disable_legacy_reads()
+        try:
+            async with get_config().redis_semaphore:
+                await get_redis().set(EMBEDDING_LEGACY_DISABLED_KEY, b"1")
+        except Exception as e:
+            logger.error(f"[Redis SET ERROR] 레거시 키 읽기 중단 표시 실패: {e}")
+
+    _clear_memory_tiers()
+    await _publish_invalidation(EMBEDDING_NAMESPACE, None)
+    return get_cache_sweeper().schedule(f"{EMBEDDING_KEY_PREFIX}:*")
+
+
+async def _mget_chunk(keys: list[str]) -> list[bytes | None]:
     from app.config.app_config import get_config
     redis = get_redis()
     semaphore = get_config().redis_semaphore
 
     try:
         async with semaphore:
-            keys = await redis.keys("*")
+            return await redis.mget(keys)
 
-        if keys:
-            await redis.delete(*keys)
-    
     except Exception as e:
-        logger.error("[Redis CLEAR ERROR] 캐시 삭제 실패", exc_info=True)
+        logger.error(
+            f"[Redis MGET ERROR] {len(keys)}개 키 조회 실패: {type(e).__name__}: {e}",
+            extra={"traceback": traceback.format_exception_only(type(e), e)}
+        )
+        return [None] * len(keys)
 
-async def get_cached_embeddings_parallel(keys: list[str]) -> tuple[list[Any | None], list[str]]:
+
+async def _fetch_namespace(
+    refs: list[str], namespace: str, chunk_size: int
+) -> list[np.ndarray | None]:
     """
-    비동기로 여러 키를 Redis에서 조회합니다. 실패한 키도 기록합니다.
+    한 네임스페이스에서 메모리 계층 → Redis MGET 순서로 임베딩 배열을 조회합니다.
     """
+    redis_keys = [embedding_key(ref, namespace) for ref in refs]
 
-    results = await asyncio.gather(
-        *(get_cached_embedding(key) for key in keys),
-        return_exceptions=True
-    )
+    # 1. 프로세스 내 캐시 → 워커 공유 캐시 조회
+    arrays: list[np.ndarray | None] = [_read_memory_tiers(key) for key in redis_keys]
+    miss_indices = [i for i, array in enumerate(arrays) if array is None]
 
-    final_results = []
-    missing_keys = []
+    # 2. 나머지만 Redis MGET
+    if miss_indices:
+        miss_keys = [redis_keys[i] for i in miss_indices]
+        chunks = [miss_keys[i : i + chunk_size] for i in range(0, len(miss_keys), chunk_size)]
+        chunk_results = await asyncio.gather(*(_mget_chunk(chunk) for chunk in chunks))
+        raws = [raw for chunk_result in chunk_results for raw in chunk_result]
 
-    for key, result in zip(keys, results):
-        if isinstance(result, Exception):
-            missing_keys.append(key)
-            logger.warning(
-                f"[Redis ERROR] key='{key}' 조회 실패: {type(result).__name__}: {result}",
-                extra={"traceback": traceback.format_exception_only(type(result), result)}
+        fetched: dict[str, np.ndarray] = {}
+        for i, key, array in zip(miss_indices, miss_keys, _decode_raws(miss_keys, raws)):
+            if array is not None:
+                fetched[key] = array
+            arrays[i] = array
+        _fill_memory_tiers(fetched)
+
+    return arrays
+
+
+def _disable_legacy_reads() -> None:
+    global _legacy_reads_enabled
+    if _legacy_reads_enabled:
+        logger.info("[Redis LEGACY] 레거시 키 읽기를 중단합니다.")
+    _legacy_reads_enabled = False
+
+
+def _should_read_legacy_keys() -> bool:
+    if _legacy_reads_enabled and time.time() >= _legacy_read_deadline:
+        _disable_legacy_reads()
+    return _legacy_reads_enabled
+
+
+async def _read_legacy_keys(
+    keys: list[str], arrays: list[np.ndarray | None], chunk_size: int
+) -> None:
+    """
+    아직 없는 임베딩을 네임스페이스 도입 전 키(이미지 ref 그대로, JSON 또는 바이너리)에서 읽어
+    arrays를 채웁니다.
+
+    레거시 값이 현재 모델(EMBEDDING_LEGACY_MODEL)로 만든 것이면 현재 네임스페이스로
+    복사해 다음 조회부터는 레거시 키를 읽지 않습니다. 다른 모델이면 fallback과 같이
+    차원이 같을 때만 사용하고 재임베딩 대상으로 등록합니다.
+
+    첫 MGET에 중단 표시 키(EMBEDDING_LEGACY_DISABLED_KEY)를 함께 조회해, 다른 워커가
+    캐시를 전체 삭제했으면 추가 왕복 없이 레거시 읽기를 멈춥니다.
+    """
+    miss_indices = [
+        i for i, array in enumerate(arrays)
+        if array is None or array.size != EMBEDDING_DIM
+    ]
+    if not miss_indices:
+        return
+
+    miss_refs = [keys[i] for i in miss_indices]
+    chunks = [miss_refs[i : i + chunk_size] for i in range(0, len(miss_refs), chunk_size)]
+    chunks[0] = [EMBEDDING_LEGACY_DISABLED_KEY] + chunks[0]
+    chunk_results = await asyncio.gather(*(_mget_chunk(chunk) for chunk in chunks))
+    disabled, *raws = [raw for chunk_result in chunk_results for raw in chunk_result]
+    if disabled is not None:
+        _disable_legacy_reads()
+        return
+
+    found: dict[str, np.ndarray] = {}
+    for i, ref, array in zip(miss_indices, miss_refs, _decode_raws(miss_refs, raws)):
+        if array is None or array.size != EMBEDDING_DIM:
+            continue
+        arrays[i] = array
+        found[ref] = array
+
+    if not found:
+        return
+
+    logger.info(f"[Redis LEGACY HIT] {len(found)}개 키를 레거시 키에서 읽었습니다.")
+    if EMBEDDING_LEGACY_MODEL == MODEL_NAME.value:
+        await set_cached_embeddings_bulk(found)
+    else:
+        from app.service.embedding_backfill import get_embedding_backfiller
+        get_embedding_backfiller().enqueue(list(found))
+
+
+async def get_cached_embedding_matrix(
+    keys: list[str], chunk_size: int = REDIS_MGET_CHUNK_SIZE
+) -> tuple[torch.Tensor | None, list[str]]:
+    """
+    여러 키를 MGET 청크로 나누어 동시에 조회하고 [N, D] 행렬로 디코딩합니다.
+
+    현재 네임스페이스에 없는 키는 fallback 네임스페이스(EMBEDDING_FALLBACK_MODEL)에서
+    찾습니다. fallback 벡터는 현재 모델과 차원이 같을 때만 사용하고 백그라운드 재임베딩
+    대상으로 등록하며, 차원이 다르면 누락으로 처리합니다. 그래도 없는
+    키는 네임스페이스 도입 전 레거시 키에서 찾습니다. (EMBEDDING_READ_LEGACY_KEYS,
+    EMBEDDING_LEGACY_READ_UNTIL까지)
+
+    Args:
+        keys: 조회할 이미지 ref 목록
+        chunk_size: MGET 한 번에 조회할 키 수
+
+    Returns:
+        Tuple[torch.Tensor | None, list[str]]: [N, D] 임베딩 행렬(누락된 행은 0), 누락 키 목록
+
+    """
+    if not keys:
+        return None, []
+
+    arrays = await _fetch_namespace(keys, EMBEDDING_NAMESPACE, chunk_size)
+
+    if EMBEDDING_FALLBACK_NAMESPACE is not None:
+        miss_indices = [
+            i for i, array in enumerate(arrays)
+            if array is None or array.size != EMBEDDING_DIM
+        ]
+        if miss_indices:
+            miss_refs = [keys[i] for i in miss_indices]
+            fallback_arrays = await _fetch_namespace(
+                miss_refs, EMBEDDING_FALLBACK_NAMESPACE, chunk_size
             )
-            final_results.append(None)
-        elif result is None:
-            missing_keys.append(key)
-            logger.info(f"[Redis MISS] key='{key}' not found in cache.")
-            final_results.append(None)
-        else:
-            final_results.append(result)
 
-    return final_results, missing_keys
\ No newline at end of file
+            backfill_refs = []
+            for i, ref, array in zip(miss_indices, miss_refs, fallback_arrays):
+                # 차원이 다른 fallback 벡터(예: ViT-B/32 → ViT-L/14)는 누락으로 처리
+                if array is None or array.size != EMBEDDING_DIM:
+                    continue
+                arrays[i] = array
+                backfill_refs.append(ref)
+
+            if backfill_refs:
+                from app.service.embedding_backfill import get_embedding_backfiller
+                get_embedding_backfiller().enqueue(backfill_refs)
+
+    if _should_read_legacy_keys():
+        await _read_legacy_keys(keys, arrays, chunk_size)
+
+    matrix, missing_keys = _stack_embedding_arrays(keys, arrays, EMBEDDING_DIM)
+
+    if missing_keys:
+        logger.info(
+            f"[Redis MISS] {len(missing_keys)}/{len(keys)}개 키가 캐시에 없습니다.",
+            extra={"missing_keys": missing_keys[:20]}
+        )
+
+    return matrix, missing_keys
+
+
+async def get_cached_embeddings_parallel(keys: list[str]) -> tuple[list[Any | None], list[str]]:
+    """
+    비동기로 여러 키를 Redis에서 조회합니다. 실패한 키도 기록합니다.
+
+    내부적으로 `get_cached_embedding_matrix`의 [N, D] 행렬을 행 단위로 나누어 반환합니다.
+    """
+    matrix, missing_keys = await get_cached_embedding_matrix(keys)
+    if matrix is None:
+        return [None] * len(keys), missing_keys
+
+    missing = set(missing_keys)
+    final_results = [
+        None if key in missing else row
+        for key, row in zip(keys, matrix.unbind(0))
+    ]
+
+    return final_results, missing_keys
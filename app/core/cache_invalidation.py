@@ -0,0 +1,147 @@
+"""
+gunicorn 워커 간 임베딩 메모리 캐시 무효화 모듈입니다.
+
+프로세스 내 LRU(LocalEmbeddingCache)와 앨범 행렬 캐시(AlbumMatrixCache)는 워커마다
+따로 있으므로, 한 워커가 임베딩을 삭제하거나 다시 저장하면 Redis pub/sub 채널로
+이미지 ref를 알리고 다른 워커는 해당 항목을 메모리 계층에서 제거합니다.
+
+구독이 끊긴 동안의 메시지는 받을 수 없으므로, 다시 구독하면 메모리 계층 전체를 비웁니다.
+"""
+
+import asyncio
+import logging
+import os
+import uuid
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from app.config.redis import get_redis
+from app.utils.codec import json_dumps, json_loads
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+EMBEDDING_INVALIDATION_CHANNEL = os.getenv(
+    "EMBEDDING_INVALIDATION_CHANNEL", "emb-invalidate"
+)
+# 구독 연결이 끊겼을 때 재연결 대기 시간 범위(초)
+INVALIDATION_RECONNECT_MIN = 0.5
+INVALIDATION_RECONNECT_MAX = 30.0
+
+
+class EmbeddingInvalidationBus:
+    """
+    임베딩 무효화 메시지를 발행하고 다른 워커의 메시지를 받아 메모리 계층에 반영합니다.
+
+    메시지 형식: {"sender": 워커 ID, "namespace": 네임스페이스, "refs": [ref, ...] | null}
+    refs가 null이면 메모리 계층 전체를 비웁니다. 자기 자신이 보낸 메시지는 무시합니다.
+    """
+
+    def __init__(self, channel: str = EMBEDDING_INVALIDATION_CHANNEL) -> None:
+        """
+        Args:
+            channel: 무효화 메시지를 주고받을 Redis pub/sub 채널
+
+        """
+        self.channel = channel
+        self.sender_id = uuid.uuid4().hex
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"[CACHE_INVALIDATION] 구독 시작: channel='{self.channel}'")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            logger.info("[CACHE_INVALIDATION] 구독 종료")
+        self._task = None
+
+    async def publish(self, namespace: str, refs: Optional[list[str]]) -> None:
+        """
+        다른 워커에 무효화 메시지를 발행합니다. 실패는 로그만 남깁니다.
+
+        Args:
+            namespace: 무효화할 임베딩 네임스페이스
+            refs: 무효화할 이미지 ref 목록 (None이면 전체)
+
+        """
+        if refs is not None and not refs:
+            return
+
+        from app.config.app_config import get_config
+        redis = get_redis()
+        semaphore = get_config().redis_semaphore
+
+        payload = json_dumps(
+            {"sender": self.sender_id, "namespace": namespace, "refs": refs}
+        )
+        try:
+            async with semaphore:
+                await redis.publish(self.channel, payload)
+        except Exception as e:
+            logger.error(f"[CACHE_INVALIDATION PUBLISH ERROR] {e}")
+
+    def handle(self, raw: bytes) -> None:
+        """
+        수신한 무효화 메시지를 이 워커의 메모리 계층에 반영합니다.
+        """
+        from app.core.cache import evict_memory_tiers
+
+        message = json_loads(raw)
+        if message.get("sender") == self.sender_id:
+            return
+        evict_memory_tiers(message["namespace"], message.get("refs"))
+
+    async def _run(self) -> None:
+        from app.core.cache import evict_memory_tiers
+
+        delay = INVALIDATION_RECONNECT_MIN
+        while True:
+            pubsub = get_redis().pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                # 구독 전이나 끊긴 동안 놓친 메시지가 있을 수 있으므로 전체 무효화
+                evict_memory_tiers(None, None)
+                delay = INVALIDATION_RECONNECT_MIN
+
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is None:
+                        continue
+                    try:
+                        self.handle(message["data"])
+                    except Exception as e:
+                        logger.error(f"[CACHE_INVALIDATION] 잘못된 메시지 무시: {e}")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"[CACHE_INVALIDATION] 구독 실패, {delay:.1f}초 후 재연결: {e}"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, INVALIDATION_RECONNECT_MAX)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+
+_invalidation_bus: Optional[EmbeddingInvalidationBus] = None
+
+
+def get_invalidation_bus() -> EmbeddingInvalidationBus:
+    global _invalidation_bus
+    if _invalidation_bus is None:
+        _invalidation_bus = EmbeddingInvalidationBus()
+    return _invalidation_bus
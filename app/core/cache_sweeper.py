@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from app.config.redis import get_redis
+from app.core.metrics import (
+    CACHE_SWEEP_IN_PROGRESS,
+    CACHE_SWEEP_KEYS_SCANNED,
+    CACHE_SWEEP_KEYS_UNLINKED,
+)
+from app.core.task_queue import SerialTaskQueue
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+CACHE_SWEEP_BATCH_SIZE = int(os.getenv("CACHE_SWEEP_BATCH_SIZE", "500"))
+CACHE_SWEEP_MAX_KEYS_PER_SEC = int(os.getenv("CACHE_SWEEP_MAX_KEYS_PER_SEC", "20000"))
+
+
+class EmbeddingCacheSweeper:
+    """
+    Redis 키를 SCAN 커서로 순회하며 UNLINK로 삭제하는 백그라운드 스위퍼입니다.
+
+    KEYS/DEL처럼 Redis를 오래 블로킹하지 않도록 한 번에 `batch_size`개씩만
+    조회·삭제하고, 초당 삭제 키 수를 `max_keys_per_sec`로 제한합니다.
+    여러 스위프 요청은 SerialTaskQueue로 순서대로 실행됩니다.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = CACHE_SWEEP_BATCH_SIZE,
+        max_keys_per_sec: int = CACHE_SWEEP_MAX_KEYS_PER_SEC,
+    ) -> None:
+        """
+        Args:
+            batch_size: SCAN COUNT 힌트이자 UNLINK 한 번에 삭제할 최대 키 수
+            max_keys_per_sec: 초당 최대 삭제 키 수 (0 이하이면 제한 없음)
+
+        """
+        self.batch_size = batch_size
+        self.max_keys_per_sec = max_keys_per_sec
+        self._queue = SerialTaskQueue()
+        # 호출자가 Future를 버려도 작업이 GC되지 않도록 완료 전까지 참조 유지
+        self._pending: set["asyncio.Future[int]"] = set()
+
+    def schedule(self, pattern: str) -> "asyncio.Future[int]":
+        """
+        패턴에 맞는 키 삭제를 백그라운드로 예약하고 바로 반환합니다.
+
+        Args:
+            pattern: SCAN MATCH 패턴 (예: "emb:ViT-B-32:v1:*")
+
+        Returns:
+            asyncio.Future[int]: 삭제된 키 수를 결과로 갖는 Future
+                (기다리지 않아도 삭제는 진행되며, 실패는 로그로 남습니다)
+
+        """
+        self._queue.start()
+        future = asyncio.ensure_future(
+            self._queue.enqueue(lambda: self.sweep(pattern))
+        )
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        future.add_done_callback(self._log_result(pattern))
+        return future
+
+    @property
+    def pending(self) -> int:
+        """
+        예약되었지만 아직 끝나지 않은 스위프 수
+        """
+        return len(self._pending)
+
+    @staticmethod
+    def _log_result(pattern: str):
+        def callback(future: "asyncio.Future[int]") -> None:
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is not None:
+                logger.error(f"[CACHE_SWEEP ERROR] pattern='{pattern}' 실패: {error}")
+        return callback
+
+    async def sweep(self, pattern: str) -> int:
+        """
+        패턴에 맞는 키를 SCAN/UNLINK로 삭제하고 삭제된 키 수를 반환합니다.
+        """
+        from app.config.app_config import get_config
+        redis = get_redis()
+        semaphore = get_config().redis_semaphore
+
+        logger.info(f"[CACHE_SWEEP] 시작: pattern='{pattern}'")
+        CACHE_SWEEP_IN_PROGRESS.labels(pattern).set(1)
+        started_at = time.monotonic()
+        cursor = 0
+        unlinked = 0
+
+        try:
+            while True:
+                async with semaphore:
+                    cursor, keys = await redis.scan(
+                        cursor=cursor, match=pattern, count=self.batch_size
+                    )
+                CACHE_SWEEP_KEYS_SCANNED.labels(pattern).inc(len(keys))
+
+                if keys:
+                    async with semaphore:
+                        removed = await redis.unlink(*keys)
+                    unlinked += removed
+                    CACHE_SWEEP_KEYS_UNLINKED.labels(pattern).inc(removed)
+
+                if cursor == 0:
+                    break
+
+                await self._throttle(unlinked, started_at)
+
+        finally:
+            CACHE_SWEEP_IN_PROGRESS.labels(pattern).set(0)
+
+        logger.info(
+            f"[CACHE_SWEEP] 완료: pattern='{pattern}', 삭제 키 수={unlinked}, "
+            f"소요 시간={time.monotonic() - started_at:.1f}s"
+        )
+        return unlinked
+
+    async def _throttle(self, unlinked: int, started_at: float) -> None:
+        if self.max_keys_per_sec <= 0:
+            # 제한이 없어도 다른 요청이 Redis와 이벤트 루프를 쓸 수 있도록 양보
+            await asyncio.sleep(0)
+            return
+
+        expected_elapsed = unlinked / self.max_keys_per_sec
+        delay = expected_elapsed - (time.monotonic() - started_at)
+        await asyncio.sleep(max(delay, 0))
+
+
+_cache_sweeper: Optional[EmbeddingCacheSweeper] = None
+
+
+def get_cache_sweeper() -> EmbeddingCacheSweeper:
+    global _cache_sweeper
+    if _cache_sweeper is None:
+        _cache_sweeper = EmbeddingCacheSweeper()
+    return _cache_sweeper
@@ -0,0 +1,128 @@
+import logging
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Optional
+
+from app.core.metrics import GPU_CIRCUIT_OPENED, GPU_CIRCUIT_REJECTED, GPU_CIRCUIT_STATE
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """
+    서킷이 열려 있어 요청을 보내지 않고 즉시 실패할 때 발생하는 예외입니다.
+    """
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(f"'{name}' 서킷이 열려 있습니다. {retry_after:.1f}초 후 재시도 가능")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitState(IntEnum):
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 `failure_threshold`회에 도달하면 `recovery_timeout`초 동안 요청을 차단하는 서킷 브레이커입니다.
+
+    차단 시간이 지나면 HALF_OPEN 상태에서 한 요청만 통과시키고, 성공하면 닫고
+    실패하면 다시 엽니다. 상태는 `gpu_circuit_state{endpoint}` 메트릭으로 노출됩니다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, recovery_timeout: float) -> None:
+        """
+        Args:
+            name: 서킷 이름 (메트릭 라벨로 사용)
+            failure_threshold: 서킷을 여는 연속 실패 횟수
+            recovery_timeout: 서킷을 연 뒤 시험 요청을 허용하기까지의 시간(초)
+
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        GPU_CIRCUIT_STATE.labels(name).set(CircuitState.CLOSED)
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def before_request(self) -> None:
+        """
+        요청 전에 호출합니다. 서킷이 열려 있으면 CircuitOpenError를 발생시킵니다.
+        """
+        if self._state == CircuitState.OPEN:
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed < self.recovery_timeout:
+                GPU_CIRCUIT_REJECTED.labels(self.name).inc()
+                raise CircuitOpenError(self.name, self.recovery_timeout - elapsed)
+            self._set_state(CircuitState.HALF_OPEN)
+
+        if self._state == CircuitState.HALF_OPEN:
+            if self._probe_in_flight:
+                GPU_CIRCUIT_REJECTED.labels(self.name).inc()
+                raise CircuitOpenError(self.name, self.recovery_timeout)
+            self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probe_in_flight = False
+        if self._state != CircuitState.CLOSED:
+            logger.info(f"[CIRCUIT] '{self.name}' 서킷 닫힘")
+            self._set_state(CircuitState.CLOSED)
+
+    def release_probe(self) -> None:
+        """
+        결과를 알 수 없이 끝난 요청(취소 등) 뒤에 호출합니다. 실패로 세지 않고 시험 요청 자리만 반환합니다.
+        """
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+        if self._state == CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != CircuitState.OPEN:
+                logger.warning(f"[CIRCUIT] '{self.name}' 서킷 열림 (연속 실패 {self._failures}회)")
+                GPU_CIRCUIT_OPENED.labels(self.name).inc()
+            self._opened_at = time.monotonic()
+            self._set_state(CircuitState.OPEN)
+
+    def _set_state(self, state: CircuitState) -> None:
+        self._state = state
+        GPU_CIRCUIT_STATE.labels(self.name).set(state)
+
+
+class LatencyTracker:
+    """
+    최근 요청 처리 시간을 보관하고 백분위수를 계산합니다. (헤지 요청 지연 시간 계산용)
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20) -> None:
+        """
+        Args:
+            window: 보관할 최근 처리 시간 수
+            min_samples: 백분위수를 계산하기 위한 최소 표본 수
+
+        """
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        q 백분위수(0~1)를 반환합니다. 표본이 부족하면 None입니다.
+        """
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
@@ -0,0 +1,76 @@
+"""
+GPU 서버 `/clip/embedding` 스트리밍 응답의 프레임 포맷 모듈입니다.
+
+프레임 = [frame_len(4)] + [ref_len(2) | ref(utf-8) | 임베딩 바이너리 포맷]
+frame_len이 0인 프레임이 스트림 종료 표시이며, 종료 표시 없이 끝난 스트림은
+중간에 끊긴 것으로 보고 실패 처리합니다. 응답에 없는 ref는 임베딩 실패로 처리합니다.
+
+GPU 서버는 `iter_embedding_frames`로 응답 본문을 만들고, 서비스 서버는
+`iter_frame_payloads`로 받는 대로 디코딩합니다.
+"""
+
+import struct
+from typing import AsyncIterator, Iterable, Iterator
+
+EMBEDDING_STREAM_MEDIA_TYPE = "application/x-ongi-embedding-stream"
+FRAME_LENGTH = struct.Struct("<I")
+REF_LENGTH = struct.Struct("<H")
+END_OF_STREAM = FRAME_LENGTH.pack(0)
+
+
+def encode_frame(image_ref: str, payload: bytes) -> bytes:
+    """
+    ref와 임베딩 바이너리(encode_embedding 결과)를 프레임 하나로 인코딩합니다.
+    """
+    ref = image_ref.encode("utf-8")
+    body = REF_LENGTH.pack(len(ref)) + ref + payload
+    return FRAME_LENGTH.pack(len(body)) + body
+
+
+def iter_embedding_frames(items: Iterable[tuple[str, bytes]]) -> Iterator[bytes]:
+    """
+    (ref, 임베딩 바이너리) 목록을 스트리밍 응답 본문 조각으로 만듭니다. (GPU 서버용)
+
+    예: StreamingResponse(iter_embedding_frames(items), media_type=EMBEDDING_STREAM_MEDIA_TYPE)
+    """
+    for image_ref, payload in items:
+        yield encode_frame(image_ref, payload)
+    yield END_OF_STREAM
+
+
+async def iter_frame_payloads(
+    byte_stream: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[str, bytes]]:
+    """
+    길이 접두사가 붙은 프레임 스트림을 (ref, 임베딩 바이너리)로 나눕니다.
+
+    Raises:
+        ValueError: 종료 프레임 없이 스트림이 끝난 경우
+
+    """
+    buffer = bytearray()
+    async for piece in byte_stream:
+        buffer += piece
+        offset = 0
+        while len(buffer) - offset >= FRAME_LENGTH.size:
+            (frame_len,) = FRAME_LENGTH.unpack_from(buffer, offset)
+            if frame_len == 0:
+                return
+
+            end = offset + FRAME_LENGTH.size + frame_len
+            if len(buffer) < end:
+                break
+
+            start = offset + FRAME_LENGTH.size
+            (ref_len,) = REF_LENGTH.unpack_from(buffer, start)
+            ref_end = start + REF_LENGTH.size + ref_len
+            ref = bytes(buffer[start + REF_LENGTH.size:ref_end]).decode("utf-8")
+            yield ref, bytes(buffer[ref_end:end])
+            offset = end
+
+        del buffer[:offset]
+
+    # 프레임 경계에서 끊긴 경우에도 종료 프레임이 없으면 일부 결과만 받은 것
+    raise ValueError(
+        f"GPU 스트리밍 응답이 종료 프레임 없이 끝났습니다 ({len(buffer)} bytes 남음)"
+    )
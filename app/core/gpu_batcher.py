@@ -0,0 +1,265 @@
+import asyncio
+import logging
+import os
+import pickle
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+from app.core.cache import decode_embedding, set_cached_embeddings_bulk
+from app.core.embedding_stream import EMBEDDING_STREAM_MEDIA_TYPE, iter_frame_payloads
+from app.core.metrics import GPU_EMBEDDING_BATCH_REQUESTS, GPU_EMBEDDING_BATCH_SIZE
+from app.utils.codec import json_dumps
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# GPU 서버로 한 번에 보낼 최대 이미지 수
+GPU_EMBEDDING_MAX_BATCH_SIZE = int(os.getenv("GPU_EMBEDDING_MAX_BATCH_SIZE", "256"))
+# 배치를 채우기 위해 첫 요청 이후 기다리는 최대 시간(초)
+GPU_EMBEDDING_MAX_WAIT = float(os.getenv("GPU_EMBEDDING_MAX_WAIT_MS", "20")) / 1000
+# 동시에 GPU 서버로 보낼 최대 배치 수
+GPU_EMBEDDING_MAX_INFLIGHT_BATCHES = int(os.getenv("GPU_EMBEDDING_MAX_INFLIGHT_BATCHES", "2"))
+# 스트리밍 응답에서 Redis에 한 번에 저장할 임베딩 수
+GPU_EMBEDDING_STREAM_CACHE_CHUNK = int(os.getenv("GPU_EMBEDDING_STREAM_CACHE_CHUNK", "64"))
+# 스트리밍을 지원하지 않는 GPU 서버의 pickle 응답 허용 여부 (GPU 서버 전환 기간에만 명시적으로 켬)
+GPU_EMBEDDING_ALLOW_PICKLE = os.getenv("GPU_EMBEDDING_ALLOW_PICKLE", "false").lower() == "true"
+
+# (GPU 서버 상태 코드, ref → 임베딩, 캐시 저장에 실패한 ref)
+EmbeddingResult = tuple[int, dict[str, Any], list[str]]
+
+
+class GpuEmbeddingBatcher:
+    """
+    여러 요청의 이미지 목록을 모아 `/clip/embedding`을 배치 단위로 호출하고 결과를 캐시에 저장하는 마이크로 배처입니다.
+
+    대기 중인 이미지가 `max_batch_size`에 도달하거나 첫 요청 이후 `max_wait`가 지나면
+    배치를 보냅니다. 이미 `max_inflight_batches`개 배치가 처리 중이면 시간이 지나도
+    보내지 않고 계속 모으다가 앞선 배치가 끝나는 즉시 보내므로, GPU가 바쁠수록 배치가
+    커지고 한가할 때는 대기 시간이 `max_wait`를 넘지 않습니다. 가득 찬 배치도 GPU 서버
+    호출은 `max_inflight_batches`개 슬롯 안에서만 실행합니다. 응답은 요청별로 나누어
+    돌려줍니다.
+
+    GPU 서버가 스트리밍 응답을 보내면 프레임을 받는 대로 디코딩하고
+    `GPU_EMBEDDING_STREAM_CACHE_CHUNK`개씩 Redis에 저장하므로 네트워크 수신,
+    디코딩, 캐시 저장이 겹쳐서 진행됩니다.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = GPU_EMBEDDING_MAX_BATCH_SIZE,
+        max_wait: float = GPU_EMBEDDING_MAX_WAIT,
+        max_inflight_batches: int = GPU_EMBEDDING_MAX_INFLIGHT_BATCHES,
+    ) -> None:
+        """
+        Args:
+            max_batch_size: 배치당 최대 이미지 수
+            max_wait: 첫 요청 이후 배치를 보내기까지 기다리는 최대 시간(초)
+            max_inflight_batches: 동시에 처리 중일 수 있는 최대 배치 수
+
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_inflight_batches = max_inflight_batches
+        self._pending: list[tuple[list[str], asyncio.Future[EmbeddingResult]]] = []
+        self._pending_size = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: set[asyncio.Task] = set()
+        self._slots = asyncio.Semaphore(max_inflight_batches)
+
+    async def embed(self, image_refs: list[str]) -> EmbeddingResult:
+        """
+        이미지 임베딩을 요청하고 결과를 캐시에 저장합니다.
+
+        Args:
+            image_refs: 이미지 ref 목록
+
+        Returns:
+            Tuple[int, dict[str, Any], list[str]]: GPU 서버 상태 코드, ref → 임베딩
+                (상태 코드가 200이 아니면 빈 dict), 캐시 저장에 실패한 ref 목록
+
+        """
+        futures = [
+            self._enqueue(image_refs[i:i + self.max_batch_size])
+            for i in range(0, len(image_refs), self.max_batch_size)
+        ]
+        results = await asyncio.gather(*futures)
+
+        status_code = next((status for status, _, _ in results if status != 200), 200)
+        embeddings: dict[str, Any] = {}
+        failed_refs: list[str] = []
+        for _, data, failed in results:
+            embeddings.update(data)
+            failed_refs.extend(failed)
+        return status_code, embeddings, failed_refs
+
+    def _enqueue(self, image_refs: list[str]) -> "asyncio.Future[EmbeddingResult]":
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        if self._pending_size + len(image_refs) > self.max_batch_size:
+            self._flush(force=True)
+
+        self._pending.append((image_refs, future))
+        self._pending_size += len(image_refs)
+
+        if self._pending_size >= self.max_batch_size:
+            self._flush(force=True)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return future
+
+    def _flush(self, force: bool = False) -> None:
+        """
+        대기 중인 요청을 하나의 배치로 보냅니다.
+
+        Args:
+            force: True이면 처리 중인 배치 수와 관계없이 배치를 만듭니다 (배치가 가득 찬 경우).
+                GPU 서버 호출은 슬롯이 빌 때까지 기다립니다.
+
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        # 처리 중인 배치가 끝나면 _on_batch_done에서 다시 보냅니다.
+        if not force and len(self._inflight) >= self.max_inflight_batches:
+            return
+
+        batch, self._pending, self._pending_size = self._pending, [], 0
+        task = asyncio.create_task(self._dispatch(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._on_batch_done)
+
+    def _on_batch_done(self, task: asyncio.Task) -> None:
+        self._inflight.discard(task)
+        if self._pending and self._timer is None:
+            self._flush()
+
+    async def _dispatch(self, batch: list[tuple[list[str], asyncio.Future[EmbeddingResult]]]) -> None:
+        image_refs = list(dict.fromkeys(ref for refs, _ in batch for ref in refs))
+        GPU_EMBEDDING_BATCH_SIZE.observe(len(image_refs))
+        GPU_EMBEDDING_BATCH_REQUESTS.observe(len(batch))
+        logger.debug(f"[GPU_BATCH] 요청={len(batch)}, 이미지={len(image_refs)}")
+
+        try:
+            async with self._slots:
+                results = await self._request(batch, image_refs)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            # 종료 등으로 취소되어도 요청한 쪽이 끝없이 기다리지 않도록 실패 처리
+            error = RuntimeError("GPU 임베딩 배치가 취소되었습니다")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            raise
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _request(
+        self,
+        batch: list[tuple[list[str], asyncio.Future[EmbeddingResult]]],
+        image_refs: list[str],
+    ) -> list[EmbeddingResult]:
+        from app.config.app_config import get_config
+
+        async with get_config().gpu_client.stream(
+            "POST",
+            "/clip/embedding",
+            content=json_dumps({"images": image_refs}),
+            headers={
+                "Content-Type": "application/json",
+                "Accept": EMBEDDING_STREAM_MEDIA_TYPE,
+            },
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                return [(response.status_code, {}, []) for _ in batch]
+
+            data, failed = await self._read_response(response)
+            failed_set = set(failed)
+            return [
+                (
+                    200,
+                    {ref: data[ref] for ref in refs if ref in data},
+                    [ref for ref in refs if ref in failed_set],
+                )
+                for refs, _ in batch
+            ]
+
+    async def _read_response(self, response: httpx.Response) -> tuple[dict[str, Any], list[str]]:
+        """
+        GPU 서버 응답을 읽어 임베딩을 캐시에 저장합니다.
+
+        Returns:
+            Tuple[dict[str, Any], list[str]]: ref → 임베딩, 캐시 저장에 실패한 ref 목록
+
+        """
+        content_type = response.headers.get("content-type", "")
+        if content_type.startswith(EMBEDDING_STREAM_MEDIA_TYPE):
+            return await self._read_stream(response)
+
+        if not GPU_EMBEDDING_ALLOW_PICKLE:
+            raise ValueError(f"지원하지 않는 GPU 응답 형식: {content_type}")
+
+        # 스트리밍을 지원하지 않는 GPU 서버: 이벤트 루프를 막지 않도록 스레드에서 역직렬화
+        body = await response.aread()
+        loop = asyncio.get_running_loop()
+        result_obj = await loop.run_in_executor(None, pickle.loads, body)
+        data = result_obj.get("data", {})
+        failed = await set_cached_embeddings_bulk(data)
+        return data, failed
+
+    async def _read_stream(self, response: httpx.Response) -> tuple[dict[str, Any], list[str]]:
+        data: dict[str, Any] = {}
+        chunk: dict[str, Any] = {}
+        writes: list[asyncio.Task] = []
+
+        try:
+            async for ref, embedding in _iter_frames(response.aiter_bytes()):
+                data[ref] = embedding
+                chunk[ref] = embedding
+                if len(chunk) >= GPU_EMBEDDING_STREAM_CACHE_CHUNK:
+                    writes.append(asyncio.create_task(set_cached_embeddings_bulk(chunk)))
+                    chunk = {}
+        except BaseException:
+            # 스트림이 중간에 끊겨도 이미 받은 임베딩 저장은 끝까지 기다리고 결과를 회수
+            await asyncio.gather(*writes, return_exceptions=True)
+            raise
+
+        if chunk:
+            writes.append(asyncio.create_task(set_cached_embeddings_bulk(chunk)))
+
+        failed: list[str] = []
+        for failed_chunk in await asyncio.gather(*writes):
+            failed.extend(failed_chunk)
+        return data, failed
+
+
+async def _iter_frames(byte_stream: AsyncIterator[bytes]) -> AsyncIterator[tuple[str, Any]]:
+    """
+    스트리밍 응답 프레임을 (ref, float32 텐서)로 디코딩합니다. (포맷은 app.core.embedding_stream 참고)
+    """
+    async for ref, payload in iter_frame_payloads(byte_stream):
+        yield ref, decode_embedding(payload)
+
+
+_gpu_embedding_batcher: Optional[GpuEmbeddingBatcher] = None
+
+
+def get_gpu_embedding_batcher() -> GpuEmbeddingBatcher:
+    global _gpu_embedding_batcher
+    if _gpu_embedding_batcher is None:
+        _gpu_embedding_batcher = GpuEmbeddingBatcher()
+    return _gpu_embedding_batcher
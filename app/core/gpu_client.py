@@ -0,0 +1,327 @@
+import asyncio
+import importlib.util
+import logging
+import os
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+from app.core.circuit_breaker import CircuitBreaker, LatencyTracker
+from app.core.metrics import (
+    GPU_HEDGED_REQUESTS, GPU_REQUEST_LATENCY, GPU_REQUEST_QUEUE_DEPTH, GPU_REQUEST_QUEUE_WAIT,
+)
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+GPU_HTTP2 = os.getenv("GPU_HTTP2", "false").lower() == "true"
+GPU_MAX_CONNECTIONS = int(os.getenv("GPU_MAX_CONNECTIONS", "16"))
+GPU_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("GPU_MAX_KEEPALIVE_CONNECTIONS", "8"))
+GPU_CONNECT_TIMEOUT = float(os.getenv("GPU_CONNECT_TIMEOUT", "5"))
+GPU_READ_TIMEOUT = float(os.getenv("GPU_READ_TIMEOUT", "60"))
+GPU_WRITE_TIMEOUT = float(os.getenv("GPU_WRITE_TIMEOUT", "30"))
+# 커넥션 풀에서 빈 커넥션을 기다리는 최대 시간(초)
+GPU_POOL_TIMEOUT = float(os.getenv("GPU_POOL_TIMEOUT", "30"))
+# 서킷을 여는 연속 실패 횟수와 서킷을 연 뒤 시험 요청까지의 시간(초)
+GPU_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("GPU_CIRCUIT_FAILURE_THRESHOLD", "5"))
+GPU_CIRCUIT_RECOVERY_TIMEOUT = float(os.getenv("GPU_CIRCUIT_RECOVERY_TIMEOUT", "30"))
+# 헤지 요청 지연 시간 = 최근 응답 시간의 GPU_HEDGE_PERCENTILE 백분위수 (최소 GPU_HEDGE_MIN_DELAY초)
+GPU_HEDGE_PERCENTILE = float(os.getenv("GPU_HEDGE_PERCENTILE", "0.95"))
+GPU_HEDGE_MIN_DELAY = float(os.getenv("GPU_HEDGE_MIN_DELAY", "0.05"))
+
+
+@dataclass(frozen=True)
+class EndpointPolicy:
+    """
+    GPU 서버 엔드포인트별 동시 요청 수와 읽기 타임아웃입니다.
+
+    Attributes:
+        concurrency: 동시에 보낼 수 있는 최대 요청 수
+        read_timeout: 응답 읽기 타임아웃(초)
+        hedge: 응답이 늦으면 같은 요청을 한 번 더 보낼지 여부 (멱등 요청에만 사용)
+
+    """
+
+    concurrency: int
+    read_timeout: float
+    hedge: bool = False
+
+
+ENDPOINT_POLICIES = {
+    "/clip/embedding": EndpointPolicy(
+        concurrency=int(os.getenv("GPU_EMBEDDING_CONCURRENCY", "8")),
+        read_timeout=float(os.getenv("GPU_EMBEDDING_READ_TIMEOUT", str(GPU_READ_TIMEOUT))),
+        hedge=os.getenv("GPU_EMBEDDING_HEDGE", "false").lower() == "true",
+    ),
+    "/people/cluster": EndpointPolicy(
+        concurrency=int(os.getenv("GPU_PEOPLE_CONCURRENCY", "2")),
+        read_timeout=float(os.getenv("GPU_PEOPLE_READ_TIMEOUT", "300")),
+    ),
+}
+DEFAULT_ENDPOINT_POLICY = EndpointPolicy(concurrency=4, read_timeout=GPU_READ_TIMEOUT)
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class GpuClient:
+    """
+    GPU 서버 호출용 HTTP 클라이언트입니다.
+
+    커넥션 풀 크기와 connect/read/write/pool 타임아웃을 명시적으로 설정하고,
+    엔드포인트마다 별도의 세마포어로 동시 요청 수를 제한합니다. 큰 `/people/cluster`
+    요청이 커넥션을 모두 차지해 작은 `/clip/embedding` 요청이 밀리지 않도록
+    엔드포인트별 동시 요청 수의 합보다 큰 풀을 사용합니다. `GPU_HTTP2=true`이고
+    h2 패키지가 설치되어 있으면 HTTP/2로 하나의 커넥션에서 요청을 다중화합니다.
+
+    엔드포인트마다 서킷 브레이커를 두어 GPU 서버가 연속으로 실패하면 타임아웃까지
+    기다리지 않고 CircuitOpenError로 즉시 실패합니다. `hedge`가 켜진 엔드포인트는
+    최근 응답 시간의 p95가 지나도 응답 헤더가 오지 않으면 같은 요청을 한 번 더 보내고
+    먼저 도착한 응답을 사용합니다.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        http2: bool = GPU_HTTP2,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """
+        Args:
+            base_url: GPU 서버 주소
+            http2: HTTP/2 사용 여부 (h2 패키지가 없으면 HTTP/1.1 사용)
+            transport: httpx 전송 계층 (테스트용 가짜 GPU 서버 등, 기본값은 커넥션 풀)
+
+        """
+        if http2 and not _http2_available():
+            logger.warning("h2 패키지가 없어 GPU 클라이언트를 HTTP/1.1로 실행합니다.")
+            http2 = False
+
+        budget = sum(policy.concurrency for policy in ENDPOINT_POLICIES.values())
+        max_connections = max(GPU_MAX_CONNECTIONS, budget + DEFAULT_ENDPOINT_POLICY.concurrency)
+
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=GPU_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=httpx.Timeout(
+                connect=GPU_CONNECT_TIMEOUT,
+                read=GPU_READ_TIMEOUT,
+                write=GPU_WRITE_TIMEOUT,
+                pool=GPU_POOL_TIMEOUT,
+            ),
+            headers={"Content-Type": "application/json"},
+            transport=transport,
+        )
+        self._semaphores = {
+            path: asyncio.Semaphore(policy.concurrency)
+            for path, policy in ENDPOINT_POLICIES.items()
+        }
+        self._default_semaphore = asyncio.Semaphore(DEFAULT_ENDPOINT_POLICY.concurrency)
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._latencies: dict[str, LatencyTracker] = {}
+
+        logger.info(
+            "GPU 클라이언트 초기화 완료",
+            extra={"http2": http2, "max_connections": max_connections},
+        )
+
+    def _timeout(self, path: str) -> httpx.Timeout:
+        policy = ENDPOINT_POLICIES.get(path, DEFAULT_ENDPOINT_POLICY)
+        return httpx.Timeout(
+            connect=GPU_CONNECT_TIMEOUT,
+            read=policy.read_timeout,
+            write=GPU_WRITE_TIMEOUT,
+            pool=GPU_POOL_TIMEOUT,
+        )
+
+    @asynccontextmanager
+    async def _slot(self, path: str) -> AsyncIterator[None]:
+        """
+        엔드포인트의 동시 요청 슬롯을 얻고 대기열 길이·대기 시간·처리 시간을 기록합니다.
+        """
+        semaphore = self._semaphores.get(path, self._default_semaphore)
+
+        GPU_REQUEST_QUEUE_DEPTH.labels(path).inc()
+        queued_at = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        finally:
+            GPU_REQUEST_QUEUE_DEPTH.labels(path).dec()
+
+        started_at = time.perf_counter()
+        GPU_REQUEST_QUEUE_WAIT.labels(path).observe(started_at - queued_at)
+        try:
+            yield
+        finally:
+            semaphore.release()
+            GPU_REQUEST_LATENCY.labels(path).observe(time.perf_counter() - started_at)
+
+    def breaker(self, path: str) -> CircuitBreaker:
+        breaker = self._breakers.get(path)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                path, GPU_CIRCUIT_FAILURE_THRESHOLD, GPU_CIRCUIT_RECOVERY_TIMEOUT
+            )
+            self._breakers[path] = breaker
+        return breaker
+
+    def _hedge_delay(self, path: str) -> Optional[float]:
+        if not ENDPOINT_POLICIES.get(path, DEFAULT_ENDPOINT_POLICY).hedge:
+            return None
+        p95 = self._latencies.setdefault(path, LatencyTracker()).percentile(GPU_HEDGE_PERCENTILE)
+        if p95 is None:
+            return None
+        return max(p95, GPU_HEDGE_MIN_DELAY)
+
+    async def _attempt(
+        self, path: str, request: httpx.Request, stream: bool
+    ) -> tuple[httpx.Response, AsyncExitStack]:
+        """
+        엔드포인트 슬롯을 얻어 요청을 한 번 보냅니다. 반환된 스택을 닫으면 응답을 닫고 슬롯을 반환합니다.
+        """
+        stack = AsyncExitStack()
+        try:
+            await stack.enter_async_context(self._slot(path))
+            response = await self._client.send(request, stream=stream)
+        except BaseException:
+            await stack.aclose()
+            raise
+
+        stack.push_async_callback(response.aclose)
+        return response, stack
+
+    async def _send(
+        self, path: str, request: httpx.Request, stream: bool
+    ) -> tuple[httpx.Response, AsyncExitStack]:
+        """
+        요청을 보내고 응답 헤더까지 받습니다. 헤지 지연 시간이 지나면 같은 요청을 한 번 더 보냅니다.
+
+        헤지 요청도 자기 슬롯을 따로 얻으므로 엔드포인트 동시 요청 수 제한을 넘지 않습니다.
+        """
+        started_at = time.perf_counter()
+        delay = self._hedge_delay(path)
+        attempts = [asyncio.create_task(self._attempt(path, request, stream))]
+        winner: Optional[asyncio.Task] = None
+
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(attempts, timeout=delay)
+                if not done:
+                    GPU_HEDGED_REQUESTS.labels(path).inc()
+                    attempts.append(asyncio.create_task(self._attempt(path, request, stream)))
+
+            pending = set(attempts)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+        finally:
+            for task in attempts:
+                if task is not winner:
+                    task.cancel()
+            results = await asyncio.gather(*attempts, return_exceptions=True)
+            for task, result in zip(attempts, results):
+                if task is not winner and isinstance(result, tuple):
+                    await result[1].aclose()
+
+        if winner is None:
+            raise attempts[0].exception()
+
+        self._latencies.setdefault(path, LatencyTracker()).observe(time.perf_counter() - started_at)
+        return winner.result()
+
+    async def post(self, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        응답 본문을 모두 읽는 POST 요청을 보냅니다.
+
+        5xx 응답과 요청 중 발생한 모든 예외를 서킷 실패로 기록합니다. 취소된 요청은
+        실패로 세지 않고 시험 요청 자리만 반환합니다.
+
+        Raises:
+            CircuitOpenError: 엔드포인트 서킷이 열려 있는 경우
+
+        """
+        breaker = self.breaker(path)
+        breaker.before_request()
+
+        try:
+            kwargs.setdefault("timeout", self._timeout(path))
+            request = self._client.build_request("POST", path, **kwargs)
+            response, stack = await self._send(path, request, stream=False)
+            await stack.aclose()
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    @asynccontextmanager
+    async def stream(self, method: str, path: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """
+        응답을 스트리밍으로 읽는 요청을 보냅니다. 슬롯은 스트림을 닫을 때 반환됩니다.
+
+        성공 여부는 응답 본문 처리까지 끝난 뒤에 기록합니다. 5xx 응답이나 본문을 읽고
+        처리하는 중 발생한 예외는 서킷 실패로 기록하고, 취소된 경우에는 시험 요청 자리만
+        반환합니다.
+
+        Raises:
+            CircuitOpenError: 엔드포인트 서킷이 열려 있는 경우
+
+        """
+        breaker = self.breaker(path)
+        breaker.before_request()
+
+        try:
+            kwargs.setdefault("timeout", self._timeout(path))
+            request = self._client.build_request(method, path, **kwargs)
+            response, stack = await self._send(path, request, stream=True)
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+
+        succeeded: Optional[bool] = None
+        async with stack:
+            try:
+                yield response
+                succeeded = response.status_code < 500
+            except Exception:
+                succeeded = False
+                raise
+            finally:
+                if succeeded is None:
+                    breaker.release_probe()
+                elif succeeded:
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def create_gpu_client(base_url: Optional[str] = None) -> GpuClient:
+    """
+    GPU_SERVER_BASE_URL로 GPU 클라이언트를 생성합니다.
+    """
+    base_url = base_url or os.getenv("GPU_SERVER_BASE_URL")
+    if not base_url:
+        raise EnvironmentError("GPU_SERVER_BASE_URL이 .env 파일에 없습니다.")
+    return GpuClient(base_url)
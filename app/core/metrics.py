@@ -0,0 +1,170 @@
+"""
+Prometheus 커스텀 메트릭 정의 모듈입니다.
+
+prometheus_client 기본 레지스트리에 등록되므로 app/main.py의 Instrumentator가
+노출하는 /metrics 엔드포인트에 HTTP 메트릭과 함께 포함됩니다.
+"""
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from app.utils.logging_decorator import get_flow_stats
+
+# 프로세스 내 임베딩 LRU 캐시
+LOCAL_EMBEDDING_CACHE_HITS = Counter(
+    "embedding_local_cache_hits_total",
+    "프로세스 내 임베딩 캐시 적중 수",
+)
+LOCAL_EMBEDDING_CACHE_MISSES = Counter(
+    "embedding_local_cache_misses_total",
+    "프로세스 내 임베딩 캐시 미적중 수",
+)
+LOCAL_EMBEDDING_CACHE_EVICTIONS = Counter(
+    "embedding_local_cache_evictions_total",
+    "용량 초과 또는 TTL 만료로 제거된 임베딩 수",
+)
+LOCAL_EMBEDDING_CACHE_BYTES = Gauge(
+    "embedding_local_cache_bytes",
+    "프로세스 내 임베딩 캐시가 사용 중인 바이트 수",
+)
+
+# 임베딩 캐시 SCAN/UNLINK 스위퍼
+CACHE_SWEEP_KEYS_SCANNED = Counter(
+    "embedding_cache_sweep_keys_scanned_total",
+    "스위퍼가 SCAN으로 확인한 키 수",
+    ["pattern"],
+)
+CACHE_SWEEP_KEYS_UNLINKED = Counter(
+    "embedding_cache_sweep_keys_unlinked_total",
+    "스위퍼가 UNLINK로 삭제한 키 수",
+    ["pattern"],
+)
+CACHE_SWEEP_IN_PROGRESS = Gauge(
+    "embedding_cache_sweep_in_progress",
+    "진행 중인 스위프 여부 (1: 진행 중)",
+    ["pattern"],
+)
+
+# 임베딩 요청 single-flight
+GPU_EMBEDDING_IMAGES_SAVED = Counter(
+    "gpu_embedding_images_saved_total",
+    "GPU 서버로 보내지 않은 이미지 수 (cached: 이미 캐싱됨, inflight: 다른 요청이 처리 중)",
+    ["reason"],
+)
+GPU_EMBEDDING_REQUESTS_SAVED = Counter(
+    "gpu_embedding_requests_saved_total",
+    "GPU 서버 호출 없이 완료된 임베딩 요청 수",
+)
+
+# GPU 임베딩 마이크로 배처
+GPU_EMBEDDING_BATCH_SIZE = Histogram(
+    "gpu_embedding_batch_images",
+    "GPU 서버로 보낸 배치당 이미지 수",
+    buckets=(1, 8, 16, 32, 64, 128, 256, 512, 1024),
+)
+GPU_EMBEDDING_BATCH_REQUESTS = Histogram(
+    "gpu_embedding_batch_requests",
+    "배치 하나로 합쳐진 요청 수",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+
+# GPU 서버 HTTP 클라이언트
+GPU_REQUEST_QUEUE_DEPTH = Gauge(
+    "gpu_request_queue_depth",
+    "엔드포인트별 동시 요청 슬롯을 기다리는 요청 수",
+    ["endpoint"],
+)
+GPU_REQUEST_QUEUE_WAIT = Histogram(
+    "gpu_request_queue_wait_seconds",
+    "엔드포인트별 동시 요청 슬롯 대기 시간",
+    ["endpoint"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30),
+)
+GPU_REQUEST_LATENCY = Histogram(
+    "gpu_request_duration_seconds",
+    "엔드포인트별 GPU 서버 요청 처리 시간 (슬롯 대기 제외)",
+    ["endpoint"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+GPU_HEDGED_REQUESTS = Counter(
+    "gpu_hedged_requests_total",
+    "응답 지연으로 한 번 더 보낸 GPU 서버 요청 수",
+    ["endpoint"],
+)
+
+# GPU 서버 서킷 브레이커
+GPU_CIRCUIT_STATE = Gauge(
+    "gpu_circuit_state",
+    "엔드포인트별 서킷 상태 (0: CLOSED, 1: HALF_OPEN, 2: OPEN)",
+    ["endpoint"],
+)
+GPU_CIRCUIT_OPENED = Counter(
+    "gpu_circuit_opened_total",
+    "서킷이 열린 횟수",
+    ["endpoint"],
+)
+GPU_CIRCUIT_REJECTED = Counter(
+    "gpu_circuit_rejected_total",
+    "서킷이 열려 있어 즉시 실패한 요청 수",
+    ["endpoint"],
+)
+
+# Kafka 적응형 폴링
+KAFKA_INFLIGHT_MESSAGES = Gauge(
+    "kafka_inflight_messages",
+    "컨슈머가 처리 중인 메시지 수",
+    ["group"],
+)
+KAFKA_PAUSED_PARTITIONS = Gauge(
+    "kafka_paused_partitions",
+    "처리 중이거나 포화 상태로 pause된 파티션 수",
+    ["group"],
+)
+KAFKA_POLL_MAX_RECORDS = Gauge(
+    "kafka_poll_max_records",
+    "처리 시간에 따라 조정된 폴링당 최대 레코드 수",
+    ["group"],
+)
+
+# 중복/품질 파이프라인 공용 흑백 썸네일 캐시
+THUMBNAIL_CACHE_HITS = Counter(
+    "thumbnail_cache_hits_total",
+    "흑백 썸네일 캐시 적중 수 (inflight: 다른 요청이 디코딩 중인 썸네일 대기)",
+    ["reason"],
+)
+THUMBNAIL_CACHE_MISSES = Counter(
+    "thumbnail_cache_misses_total",
+    "흑백 썸네일 캐시 미적중 수 (다운로드·디코딩한 이미지 수)",
+)
+THUMBNAIL_CACHE_BYTES = Gauge(
+    "thumbnail_cache_bytes",
+    "흑백 썸네일 캐시가 사용 중인 바이트 수",
+)
+
+# 파이프라인 단계별 처리 시간 (app.core.stage_timer)
+PIPELINE_STAGE_SECONDS = Histogram(
+    "pipeline_stage_duration_seconds",
+    "파이프라인 단계별 처리 시간",
+    ["stage", "source", "size_bucket"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+
+# trace_flow 함수별 호출 통계 (스크레이프 시점에 메모리 집계값을 읽어 노출)
+class FlowStatsCollector:
+    def collect(self):
+        calls = CounterMetricFamily("flow_calls", "trace_flow 함수 호출 수", labels=["function"])
+        errors = CounterMetricFamily("flow_errors", "trace_flow 함수 예외 수", labels=["function"])
+        seconds = CounterMetricFamily("flow_seconds", "trace_flow 함수 누적 처리 시간", labels=["function"])
+        max_seconds = GaugeMetricFamily("flow_max_seconds", "trace_flow 함수 최대 처리 시간", labels=["function"])
+
+        for name, stat in get_flow_stats().items():
+            calls.add_metric([name], stat["calls"])
+            errors.add_metric([name], stat["errors"])
+            seconds.add_metric([name], stat["total_seconds"])
+            max_seconds.add_metric([name], stat["max_seconds"])
+
+        yield from (calls, errors, seconds, max_seconds)
+
+
+REGISTRY.register(FlowStatsCollector())
@@ -0,0 +1,92 @@
+"""
+이미지 ref → 64비트 pHash(8 bytes) Redis 저장소입니다.
+
+중복 검사 요청마다 모든 이미지를 다시 내려받아 해시하지 않도록, 계산한 pHash를
+`phash:v{PHASH_VERSION}:t{THUMBNAIL_LONG_SIDE}:{ref}` 키에 raw 8 bytes로 저장합니다.
+해시 계산 방식이 바뀌면 PHASH_VERSION을 올려 이전 값과 섞이지 않게 하고, 썸네일 크기가
+바뀌면 키가 자동으로 달라집니다.
+"""
+
+import logging
+import os
+
+import numpy as np
+from dotenv import load_dotenv
+
+from app.config.redis import get_redis
+from app.core.thumbnail_cache import THUMBNAIL_LONG_SIDE
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# v4: 긴 변 THUMBNAIL_DECODE_MIN_SIDE 이상으로 축소 디코딩한 뒤 INTER_AREA로 줄인 흑백 썸네일의 해시
+# (v3는 원본 해상도 디코딩 썸네일, v2는 최소 축소 디코딩 썸네일, v1은 원본 해상도 이미지의 해시)
+PHASH_VERSION = os.getenv("PHASH_VERSION", "4")
+PHASH_CACHE_TTL = int(os.getenv("PHASH_CACHE_TTL", str(30 * 24 * 3600)))
+PHASH_KEY_PREFIX = f"phash:v{PHASH_VERSION}:t{THUMBNAIL_LONG_SIDE}"
+PHASH_MGET_CHUNK_SIZE = int(os.getenv("PHASH_MGET_CHUNK_SIZE", "1024"))
+PHASH_NBYTES = 8
+
+
+def phash_key(image_ref: str) -> str:
+    return f"{PHASH_KEY_PREFIX}:{image_ref}"
+
+
+async def get_cached_phashes(
+    image_refs: list[str], chunk_size: int = PHASH_MGET_CHUNK_SIZE
+) -> dict[str, np.uint64]:
+    """
+    저장된 pHash를 MGET으로 조회합니다.
+
+    Args:
+        image_refs: 조회할 이미지 ref 목록
+        chunk_size: MGET 한 번에 조회할 키 수
+
+    Returns:
+        dict[str, np.uint64]: 저장된 이미지 ref → pHash (없는 ref는 제외)
+
+    """
+    from app.config.app_config import get_config
+    redis = get_redis()
+    semaphore = get_config().redis_semaphore
+
+    found: dict[str, np.uint64] = {}
+    for i in range(0, len(image_refs), chunk_size):
+        chunk = image_refs[i : i + chunk_size]
+        try:
+            async with semaphore:
+                raws = await redis.mget([phash_key(ref) for ref in chunk])
+        except Exception as e:
+            logger.error(f"[Redis PHASH MGET ERROR] {len(chunk)}개 키 조회 실패: {e}")
+            continue
+
+        for ref, raw in zip(chunk, raws):
+            if raw is not None and len(raw) == PHASH_NBYTES:
+                found[ref] = np.frombuffer(raw, dtype=np.uint64)[0]
+
+    return found
+
+
+async def set_cached_phashes(hashes: dict[str, np.uint64]) -> None:
+    """
+    pHash를 하나의 파이프라인(transaction 없음)으로 SET EX 저장합니다. 실패는 로그만 남깁니다.
+
+    Args:
+        hashes: 이미지 ref → pHash
+
+    """
+    if not hashes:
+        return
+
+    from app.config.app_config import get_config
+    redis = get_redis()
+    semaphore = get_config().redis_semaphore
+
+    try:
+        async with semaphore:
+            async with redis.pipeline(transaction=False) as pipe:
+                for ref, value in hashes.items():
+                    pipe.set(phash_key(ref), np.uint64(value).tobytes(), ex=PHASH_CACHE_TTL)
+                await pipe.execute(raise_on_error=False)
+    except Exception as e:
+        logger.error(f"[Redis PHASH SET ERROR] {len(hashes)}개 키 저장 실패: {e}")
@@ -0,0 +1,211 @@
+import fcntl
+import hashlib
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import numpy as np
+from dotenv import load_dotenv
+
+from app.config.settings import MODEL_NAME
+from app.model.aesthetic_regressor import MODEL_DIMENSIONS
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# 예: /dev/shm/ongi-embeddings (설정하지 않으면 공유 캐시를 사용하지 않습니다)
+SHARED_EMBEDDING_CACHE_PATH = os.getenv("SHARED_EMBEDDING_CACHE_PATH")
+SHARED_EMBEDDING_CACHE_SLOTS = int(os.getenv("SHARED_EMBEDDING_CACHE_SLOTS", "65536"))
+
+# 해시 충돌 시 탐색할 인접 슬롯 수
+PROBE_LENGTH = 8
+# seqlock 재시도 횟수
+READ_RETRIES = 3
+
+
+def _slot_dtype(dim: int) -> np.dtype:
+    return np.dtype([
+        ("seq", "<u4"),
+        ("expires_at", "<u4"),
+        ("key_hash", "<u8"),
+        ("vector", "<f4", (dim,)),
+    ])
+
+
+def _key_hash(key: str) -> int:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    # 0은 빈 슬롯 표시용으로 예약
+    return int.from_bytes(digest, "little") or 1
+
+
+class SharedEmbeddingStore:
+    """
+    gunicorn 워커 간에 공유되는 메모리 매핑 파일 기반 임베딩 저장소입니다.
+
+    파일은 고정 폭 슬롯 배열이며, 각 슬롯은 seq(seqlock) · 만료 시각 · 키 해시 ·
+    float32 벡터(모델 차원)로 구성됩니다. 키 해시로 시작 슬롯을 정하고
+    `PROBE_LENGTH`개 슬롯을 선형 탐색합니다. 쓰기는 flock으로 직렬화하고,
+    읽기는 잠금 없이 seq 값이 변하지 않았는지 확인합니다.
+    """
+
+    def __init__(self, path: str, dim: int, capacity: int, ttl: int) -> None:
+        """
+        Args:
+            path: 매핑 파일 경로 접두어 (실제 파일명에 차원과 슬롯 수가 붙습니다)
+            dim: 벡터 차원 (ViT-B/32: 512, ViT-L/14: 768)
+            capacity: 슬롯 수
+            ttl: 항목 유효 시간(초)
+
+        """
+        self.dim = dim
+        self.capacity = capacity
+        self.ttl = ttl
+        self.file_path = f"{path}.{dim}x{capacity}"
+
+        dtype = _slot_dtype(dim)
+        self._fd = os.open(self.file_path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._locked():
+            size = capacity * dtype.itemsize
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+
+        slots = np.memmap(self.file_path, dtype=dtype, mode="r+", shape=(capacity,))
+        self._seq = slots["seq"]
+        self._expires_at = slots["expires_at"]
+        self._key_hash = slots["key_hash"]
+        self._vector = slots["vector"]
+        self._slots = slots
+
+        logger.info(
+            "공유 임베딩 캐시 초기화 완료",
+            extra={"path": self.file_path, "dim": dim, "capacity": capacity},
+        )
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _probe(self, key_hash: int) -> range:
+        start = key_hash % self.capacity
+        return range(start, start + PROBE_LENGTH)
+
+    def _find(self, key_hash: int) -> Optional[int]:
+        for i in self._probe(key_hash):
+            idx = i % self.capacity
+            if self._key_hash[idx] == key_hash:
+                return idx
+        return None
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        키에 해당하는 벡터의 복사본을 반환합니다. 없거나 만료되었으면 None입니다.
+        """
+        key_hash = _key_hash(key)
+        idx = self._find(key_hash)
+        if idx is None:
+            return None
+
+        for _ in range(READ_RETRIES):
+            seq = int(self._seq[idx])
+            if seq & 1:
+                continue
+
+            vector = np.array(self._vector[idx])
+            expires_at = int(self._expires_at[idx])
+            stored_hash = int(self._key_hash[idx])
+
+            if int(self._seq[idx]) == seq:
+                break
+        else:
+            return None
+
+        if stored_hash != key_hash or expires_at <= time.time():
+            return None
+
+        return vector
+
+    def put_many(self, items: dict[str, np.ndarray]) -> None:
+        """
+        여러 벡터를 한 번의 잠금으로 저장합니다. 차원이 다른 벡터는 무시합니다.
+        """
+        expires_at = int(time.time()) + self.ttl
+        with self._locked():
+            for key, vector in items.items():
+                vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+                if vector.size != self.dim:
+                    continue
+
+                key_hash = _key_hash(key)
+                idx = self._find(key_hash)
+                if idx is None:
+                    idx = self._select_victim(key_hash)
+
+                self._seq[idx] += 1
+                self._vector[idx] = vector
+                self._expires_at[idx] = expires_at
+                self._key_hash[idx] = key_hash
+                self._seq[idx] += 1
+
+    def _select_victim(self, key_hash: int) -> int:
+        now = time.time()
+        victim, victim_expires = None, None
+        for i in self._probe(key_hash):
+            idx = i % self.capacity
+            expires = int(self._expires_at[idx])
+            if self._key_hash[idx] == 0 or expires <= now:
+                return idx
+            if victim_expires is None or expires < victim_expires:
+                victim, victim_expires = idx, expires
+        return victim
+
+    def delete(self, key: str) -> None:
+        with self._locked():
+            idx = self._find(_key_hash(key))
+            if idx is None:
+                return
+            self._seq[idx] += 1
+            self._key_hash[idx] = 0
+            self._seq[idx] += 1
+
+    def clear(self) -> None:
+        with self._locked():
+            self._seq += 1
+            self._key_hash[:] = 0
+            self._seq += 1
+
+    def close(self) -> None:
+        self._slots.flush()
+        os.close(self._fd)
+
+
+_shared_store: Optional[SharedEmbeddingStore] = None
+
+
+def init_shared_embedding_store(ttl: int) -> Optional[SharedEmbeddingStore]:
+    """
+    SHARED_EMBEDDING_CACHE_PATH가 설정된 경우 현재 모델 차원의 공유 저장소를 엽니다.
+    """
+    global _shared_store
+    if not SHARED_EMBEDDING_CACHE_PATH:
+        return None
+
+    dim = MODEL_DIMENSIONS[MODEL_NAME.value]
+    try:
+        _shared_store = SharedEmbeddingStore(
+            SHARED_EMBEDDING_CACHE_PATH, dim, SHARED_EMBEDDING_CACHE_SLOTS, ttl
+        )
+    except OSError as e:
+        logger.error(f"공유 임베딩 캐시 초기화 실패: {e}")
+        _shared_store = None
+
+    return _shared_store
+
+
+def get_shared_embedding_store() -> Optional[SharedEmbeddingStore]:
+    return _shared_store
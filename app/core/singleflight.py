@@ -0,0 +1,56 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class InFlightRegistry:
+    """
+    현재 처리 중인 키를 기록해 같은 키의 중복 작업을 막는 single-flight 레지스트리입니다.
+
+    `claim`으로 키를 선점한 요청만 실제 작업을 수행하고, 나머지 요청은 선점한
+    요청이 `resolve`할 때까지 Future를 기다립니다. Future 결과는 성공 여부(bool)입니다.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future[bool]] = {}
+
+    def claim(self, keys: list[str]) -> tuple[list[str], dict[str, "asyncio.Future[bool]"]]:
+        """
+        키를 선점합니다.
+
+        Args:
+            keys: 처리할 키 목록
+
+        Returns:
+            Tuple[list[str], dict[str, Future]]: 이번 요청이 선점한 키, 다른 요청이 처리 중인 키 → Future
+
+        """
+        loop = asyncio.get_running_loop()
+        owned: list[str] = []
+        waiting: dict[str, asyncio.Future[bool]] = {}
+
+        for key in keys:
+            future = self._inflight.get(key)
+            if future is not None:
+                waiting[key] = future
+                continue
+            self._inflight[key] = loop.create_future()
+            owned.append(key)
+
+        return owned, waiting
+
+    def resolve(self, key: str, succeeded: bool) -> None:
+        future = self._inflight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(succeeded)
+
+    def release(self, keys: list[str]) -> None:
+        """
+        아직 resolve되지 않은 선점 키를 실패로 처리하고 해제합니다.
+        """
+        for key in keys:
+            self.resolve(key, False)
+
+    def __len__(self) -> int:
+        return len(self._inflight)
@@ -0,0 +1,119 @@
+"""
+파이프라인 단계별 처리 시간 측정 모듈입니다.
+
+`stage_timer("gpu_call")` 컨텍스트 매니저(또는 `timed_stage` 데코레이터)로 감싼 구간의
+처리 시간을 `pipeline_stage_duration_seconds{stage, source, size_bucket}` 히스토그램에
+기록합니다. source(Kafka 토픽 또는 HTTP 경로)와 앨범 크기 구간은 요청 단위
+contextvars로 전달되므로 하위 함수에서 라벨을 넘길 필요가 없습니다.
+한 히스토그램에 서로 다른 단위가 섞이지 않도록 모든 단계는 이미지 단위가 아닌
+배치(요청) 단위로, 같은 작업을 한 번만 감싸서 기록합니다.
+STAGE_METRICS_ENABLED=false이면 공유 nullcontext를 반환하고 데코레이터는 원래 함수를
+그대로 반환합니다.
+"""
+
+import asyncio
+import os
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, ContextManager, TypeVar
+
+from dotenv import load_dotenv
+
+from app.core.metrics import PIPELINE_STAGE_SECONDS
+
+load_dotenv()
+
+STAGE_METRICS_ENABLED = os.getenv("STAGE_METRICS_ENABLED", "true").lower() == "true"
+
+# 측정 단계
+REDIS_FETCH = "redis_fetch"
+IMAGE_DOWNLOAD = "image_download"
+DECODE = "decode"
+COMPUTE = "compute"
+GPU_CALL = "gpu_call"
+KAFKA_PRODUCE = "kafka_produce"
+
+# (상한, 라벨) - 앨범 이미지 수 구간
+SIZE_BUCKETS = ((10, "1-10"), (50, "11-50"), (200, "51-200"), (1000, "201-1000"))
+
+_stage_source: ContextVar[str] = ContextVar("stage_source", default="unknown")
+_stage_size_bucket: ContextVar[str] = ContextVar("stage_size_bucket", default="unknown")
+_NOOP = nullcontext()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def size_bucket(size: int) -> str:
+    for upper, label in SIZE_BUCKETS:
+        if size <= upper:
+            return label
+    return f">{SIZE_BUCKETS[-1][0]}"
+
+
+def set_stage_source(source: str) -> None:
+    """
+    현재 요청의 source 라벨(Kafka 토픽 또는 HTTP 경로)을 설정합니다.
+    """
+    _stage_source.set(source)
+
+
+def set_stage_size(size: int) -> None:
+    """
+    현재 요청의 앨범 크기(이미지 수)를 설정합니다.
+    """
+    _stage_size_bucket.set(size_bucket(size))
+
+
+class _StageTimer:
+    __slots__ = ("stage", "started_at")
+
+    def __init__(self, stage: str) -> None:
+        self.stage = stage
+        self.started_at = 0.0
+
+    def __enter__(self) -> "_StageTimer":
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        PIPELINE_STAGE_SECONDS.labels(
+            self.stage, _stage_source.get(), _stage_size_bucket.get()
+        ).observe(time.perf_counter() - self.started_at)
+
+
+def stage_timer(stage: str) -> ContextManager[Any]:
+    """
+    with 블록의 처리 시간을 stage 라벨로 기록하는 컨텍스트 매니저를 반환합니다.
+    """
+    if not STAGE_METRICS_ENABLED:
+        return _NOOP
+    return _StageTimer(stage)
+
+
+def timed_stage(stage: str) -> Callable[[F], F]:
+    """
+    함수 전체의 처리 시간을 stage 라벨로 기록하는 데코레이터입니다. (동기/비동기 함수 모두 지원)
+    """
+
+    def decorator(func: F) -> F:
+        if not STAGE_METRICS_ENABLED:
+            return func
+
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with _StageTimer(stage):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore
+
+        @wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _StageTimer(stage):
+                return func(*args, **kwargs)
+
+        return sync_wrapper  # type: ignore
+
+    return decorator
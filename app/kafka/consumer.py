@@ -1,7 +1,7 @@
 import asyncio
 from loguru import logger
-from app.kafka.producer import create_kafka_producer
-from app.utils.kafka_utils import create_kafka_consumer, process_partition_batch
+from app.kafka.producer import KafkaProducerPool
+from app.utils.kafka_utils import AdaptivePoller, create_kafka_consumer, process_partition_batch
 from app.kafka.handler import (
     embedding as embedding_handler,
     people as people_handler,
@@ -19,7 +19,9 @@ from app.schemas.kafka import (
     quality as quality_schema,
     score as score_schema,
 )
-from app.config.kafka_config import KAFKA_BROKER_URL
+from app.config.kafka_config import (
+    KAFKA_BROKER_URL, KAFKA_HANDLER_CONCURRENCY_MAP, KAFKA_PRODUCER_POOL_SIZE,
+)
 
 ALL_TOPICS = [
     "album.ai.category.request",
@@ -40,35 +42,69 @@ MODEL_MAP = {
 }
 
 HANDLER_MAP = {
-    "album.ai.embedding.request": embedding_handler.handle,
-    "album.ai.people.request": people_handler.handle,
-    "album.ai.category.request": category_handler.handle,
-    "album.ai.duplicate.request": duplicate_handler.handle,
-    "album.ai.quality.request": quality_handler.handle,
-    "album.ai.score.request": score_handler.handle,
+    "album.ai.embedding.request": embedding_handler.handle_message,
+    "album.ai.people.request": people_handler.handle_message,
+    "album.ai.category.request": category_handler.handle_message,
+    "album.ai.duplicate.request": duplicate_handler.handle_message,
+    "album.ai.quality.request": quality_handler.handle_message,
+    "album.ai.score.request": score_handler.handle_message,
 }
 
 async def run_kafka_consumer(topic: str, group_id: str):
-    consumer = create_kafka_consumer([topic], group_id, KAFKA_BROKER_URL)
-    producer = create_kafka_producer(KAFKA_BROKER_URL)
+    consumer = create_kafka_consumer(group_id, KAFKA_BROKER_URL)
+    # 트랜잭션은 프로듀서당 하나씩만 열 수 있으므로 파티션 배치 커밋을 직렬화
+    producer_pool = KafkaProducerPool(KAFKA_BROKER_URL, 1)
+
+    async def process(tp, batch):
+        return await process_partition_batch(
+            tp, batch, producer_pool, HANDLER_MAP, MODEL_MAP, group_id
+        )
+
+    poller = AdaptivePoller(consumer, process, group_id)
+    consumer.subscribe([topic], listener=poller.rebalance_listener)
 
     await consumer.start()
-    await producer.start()
+    await producer_pool.start()
 
     logger.info(f"[Kafka] 컨슈머, 프로듀서 연결 성공 - 컨슈머 그룹: {group_id}")
 
     try:
-        while True:
-            messages = await consumer.getmany(timeout_ms=200)
-            
-            if messages:
-                logger.debug(f"[Kafka] getmany 결과: {[(tp.topic, len(batch)) for tp, batch in messages.items()]}")
-
-            tasks = [
-                process_partition_batch(tp, batch, producer, HANDLER_MAP, MODEL_MAP, group_id)
-                for tp, batch in messages.items() if batch
-            ]
-            await asyncio.gather(*tasks)
+        await poller.run()
+    finally:
+        await consumer.stop()
+        await producer_pool.stop()
+
+
+async def run_consolidated_kafka_consumer(group_id: str):
+    """
+    모든 요청 토픽을 하나의 컨슈머로 구독하고 토픽별 핸들러로 분배합니다.
+
+    토픽마다 컨슈머와 트랜잭션 프로듀서를 따로 두는 대신 컨슈머 하나와 공유
+    프로듀서 풀을 사용해 커넥션·하트비트·유휴 폴링을 줄입니다. 토픽별 동시 처리
+    한도(KAFKA_CONCURRENCY_<TOPIC>)는 같은 토픽의 모든 파티션이 공유합니다.
+    """
+    consumer = create_kafka_consumer(group_id, KAFKA_BROKER_URL)
+    producer_pool = KafkaProducerPool(KAFKA_BROKER_URL, KAFKA_PRODUCER_POOL_SIZE)
+    topic_semaphores = {
+        topic: asyncio.Semaphore(KAFKA_HANDLER_CONCURRENCY_MAP.get(topic, 1))
+        for topic in ALL_TOPICS
+    }
+
+    async def process(tp, batch):
+        return await process_partition_batch(
+            tp, batch, producer_pool, HANDLER_MAP, MODEL_MAP, group_id, topic_semaphores
+        )
+
+    poller = AdaptivePoller(consumer, process, group_id)
+    consumer.subscribe(ALL_TOPICS, listener=poller.rebalance_listener)
+
+    await consumer.start()
+    await producer_pool.start()
+
+    logger.info(f"[Kafka] 통합 컨슈머, 프로듀서 풀 연결 성공 - 컨슈머 그룹: {group_id}, 토픽 수: {len(ALL_TOPICS)}")
+
+    try:
+        await poller.run()
     finally:
         await consumer.stop()
-        await producer.stop()
+        await producer_pool.stop()
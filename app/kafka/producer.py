@@ -1,12 +1,46 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from aiokafka import AIOKafkaProducer
-import json
 import uuid
 
+from app.utils.codec import encode_value
+
 
 def create_kafka_producer(bootstrap_servers: str) -> AIOKafkaProducer:
     return AIOKafkaProducer(
         bootstrap_servers=bootstrap_servers,
         transactional_id=f"producer-{uuid.uuid4()}",
         acks="all",
-        value_serializer=lambda v: json.dumps(v).encode("utf-8")
+        value_serializer=encode_value
     )
+
+
+class KafkaProducerPool:
+    """
+    여러 파티션 배치가 나눠 쓰는 트랜잭션 프로듀서 풀입니다.
+
+    트랜잭션은 프로듀서당 하나만 열 수 있으므로 배치마다 프로듀서를 하나씩 빌려
+    쓰고, 풀 크기만큼의 배치만 동시에 커밋합니다.
+    """
+
+    def __init__(self, bootstrap_servers: str, size: int) -> None:
+        self._producers = [create_kafka_producer(bootstrap_servers) for _ in range(max(1, size))]
+        self._idle: asyncio.Queue[AIOKafkaProducer] = asyncio.Queue()
+
+    async def start(self) -> None:
+        for producer in self._producers:
+            await producer.start()
+            self._idle.put_nowait(producer)
+
+    async def stop(self) -> None:
+        for producer in self._producers:
+            await producer.stop()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AIOKafkaProducer]:
+        producer = await self._idle.get()
+        try:
+            yield producer
+        finally:
+            self._idle.put_nowait(producer)
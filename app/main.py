@@ -23,7 +23,10 @@ load_secrets_from_gcp()
 
 from app.api import api_router
 from app.config.app_config import get_config
+from app.core import metrics  # noqa: F401  커스텀 메트릭을 기본 레지스트리에 등록
 from app.middleware.error_handler import setup_exception_handler
+from app.middleware.stage_context import setup_stage_context
+from app.utils.codec import FastJSONResponse
 
 MAX_WORKERS = 8
 
@@ -50,11 +53,13 @@ async def lifespan(app: FastAPI):
 
     
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
 torch.set_num_threads(1)
 
 setup_exception_handler(app)
+setup_stage_context(app)
 
 app.include_router(api_router)
 
+# HTTP 메트릭 + app.core.metrics의 커스텀 메트릭을 /metrics로 노출
 Instrumentator().instrument(app).expose(app)
@@ -0,0 +1,17 @@
+from fastapi import FastAPI, Request
+
+from app.core.stage_timer import set_stage_source
+
+
+def setup_stage_context(app: FastAPI):
+    """
+    HTTP 요청 경로를 파이프라인 단계별 메트릭의 source 라벨로 설정하는 미들웨어를 등록합니다.
+
+    Args:
+        app (FastAPI): 미들웨어를 등록할 FastAPI 인스턴스
+
+    """
+    @app.middleware("http")
+    async def stage_context_middleware(request: Request, call_next):
+        set_stage_source(request.url.path)
+        return await call_next(request)
@@ -0,0 +1,181 @@
+"""
+앨범 이미지 분석 모듈입니다. (중복 검사·품질 평가 공용)
+
+이미지를 한 번만 내려받아 흑백 썸네일로 디코딩하고, 같은 썸네일에서 pHash와
+Laplacian 분산을 함께 계산합니다. 썸네일은 공용 캐시에 보관하고 pHash는 pHash
+저장소에 기록하므로, 같은 앨범의 중복 검사와 품질 평가가 디코딩을 공유합니다.
+
+썸네일 캐시와 디코딩 중 목록은 프로세스(워커)마다 따로 있으므로, 디코딩 공유는 같은
+워커에서 처리한 요청끼리만 이루어집니다. 다른 워커와는 pHash 저장소(Redis)만 공유합니다.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from app.core.metrics import THUMBNAIL_CACHE_HITS, THUMBNAIL_CACHE_MISSES
+from app.core.phash_store import set_cached_phashes
+from app.core.singleflight import InFlightRegistry
+from app.core.stage_timer import COMPUTE, DECODE, stage_timer
+from app.core.thumbnail_cache import (
+    THUMBNAIL_DECODE_MIN_SIDE,
+    THUMBNAIL_LONG_SIDE,
+    get_thumbnail_cache,
+)
+from app.utils.image_decode import decode_image_cv2
+
+logger = logging.getLogger(__name__)
+
+_inflight_thumbnails = InFlightRegistry()
+
+
+@dataclass
+class AlbumAnalysis:
+    """
+    이미지별 분석 결과입니다. (image_refs 순서)
+
+    Attributes:
+        image_refs: 분석한 이미지 목록
+        hashes: shape (N,) uint64 pHash
+        laplacian_vars: shape (N,) Laplacian 분산 (작을수록 흐린 이미지)
+
+    """
+
+    image_refs: list[str]
+    hashes: np.ndarray
+    laplacian_vars: np.ndarray
+
+
+def make_thumbnail(image: np.ndarray, long_side: int = THUMBNAIL_LONG_SIDE) -> np.ndarray:
+    """
+    흑백 이미지를 긴 변 long_side로 리사이즈합니다. (INTER_AREA)
+    """
+    h, w = image.shape
+    scale = long_side / max(h, w)
+    return cv2.resize(image, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+
+
+def analyze_thumbnails(thumbnails: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    썸네일마다 pHash와 Laplacian 분산을 한 번에 계산합니다.
+
+    Args:
+        thumbnails (list[np.ndarray]): 흑백 썸네일 목록
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (N,) uint64 pHash, (N,) float64 Laplacian 분산
+    """
+    hasher = cv2.img_hash.PHash_create()
+    hashes = np.empty(len(thumbnails), dtype=np.uint64)
+    laplacian_vars = np.empty(len(thumbnails), dtype=np.float64)
+
+    for k, thumbnail in enumerate(thumbnails):
+        hashes[k] = np.ascontiguousarray(hasher.compute(thumbnail), dtype=np.uint8).view(np.uint64)[0, 0]
+        laplacian_vars[k] = cv2.Laplacian(thumbnail, cv2.CV_64F).var()
+
+    return hashes, laplacian_vars
+
+
+def _decode_thumbnail(image_bytes: bytes) -> np.ndarray:
+    # 긴 변 THUMBNAIL_DECODE_MIN_SIDE 이상으로 축소 디코딩한 뒤 INTER_AREA로 썸네일 생성
+    # (Laplacian 임계값과 pHash eps 보정 근거는 tests/test_album_analysis.py 참고)
+    image = decode_image_cv2(image_bytes, "thumbnail", "GRAY", target_size=THUMBNAIL_DECODE_MIN_SIDE)
+    return make_thumbnail(image)
+
+
+async def _decode_thumbnails(image_refs: list[str], image_loader) -> dict[str, np.ndarray]:
+    """
+    이미지를 내려받아 썸네일로 만들고 캐시에 저장합니다.
+
+    다운로드와 디코딩(썸네일 리사이즈 포함)은 배치 단위로 한 번씩 기록합니다.
+    """
+    images_bytes = await image_loader.download_images(image_refs)
+
+    loop = asyncio.get_running_loop()
+    with stage_timer(DECODE):
+        thumbnails = await asyncio.gather(*(
+            loop.run_in_executor(None, _decode_thumbnail, image_bytes)
+            for image_bytes in images_bytes
+        ))
+
+    cache = get_thumbnail_cache()
+    for ref, thumbnail in zip(image_refs, thumbnails):
+        cache.put(ref, thumbnail)
+    THUMBNAIL_CACHE_MISSES.inc(len(image_refs))
+    return dict(zip(image_refs, thumbnails))
+
+
+async def load_gray_thumbnails(image_refs: list[str], image_loader) -> list[np.ndarray]:
+    """
+    흑백 썸네일을 캐시에서 읽고, 없는 이미지만 내려받아 디코딩합니다.
+
+    다른 요청이 디코딩 중인 이미지는 다시 내려받지 않고 그 요청의 완료를 기다립니다.
+
+    Args:
+        image_refs (list[str]): 이미지 ref 목록
+        image_loader: 이미지 로더 객체
+
+    Returns:
+        list[np.ndarray]: image_refs 순서의 흑백 썸네일 목록
+    """
+    cache = get_thumbnail_cache()
+    unique_refs = list(dict.fromkeys(image_refs))
+    thumbnails = {}
+    for ref in unique_refs:
+        thumbnail = cache.get(ref)
+        if thumbnail is not None:
+            thumbnails[ref] = thumbnail
+
+    missing = [ref for ref in unique_refs if ref not in thumbnails]
+    owned, waiting = _inflight_thumbnails.claim(missing)
+    THUMBNAIL_CACHE_HITS.labels("cached").inc(len(thumbnails))
+    THUMBNAIL_CACHE_HITS.labels("inflight").inc(len(waiting))
+
+    try:
+        if owned:
+            thumbnails.update(await _decode_thumbnails(owned, image_loader))
+            for ref in owned:
+                _inflight_thumbnails.resolve(ref, True)
+    finally:
+        _inflight_thumbnails.release(owned)
+
+    if waiting:
+        results = await asyncio.gather(*waiting.values())
+        retry = []
+        for ref, succeeded in zip(waiting, results):
+            thumbnail = cache.get(ref) if succeeded else None
+            if thumbnail is None:
+                # 디코딩한 요청이 실패했거나 그 사이 캐시에서 밀려난 경우
+                retry.append(ref)
+            else:
+                thumbnails[ref] = thumbnail
+        if retry:
+            thumbnails.update(await _decode_thumbnails(retry, image_loader))
+
+    return [thumbnails[ref] for ref in image_refs]
+
+
+async def analyze_album(image_refs: list[str], image_loader) -> AlbumAnalysis:
+    """
+    앨범 이미지의 pHash와 Laplacian 분산을 한 번의 디코딩으로 계산합니다.
+
+    계산한 pHash는 pHash 저장소에 기록해 이후 중복 검사 요청이 재사용합니다.
+
+    Args:
+        image_refs (list[str]): 이미지 ref 목록
+        image_loader: 이미지 로더 객체
+
+    Returns:
+        AlbumAnalysis: image_refs 순서의 분석 결과
+    """
+    thumbnails = await load_gray_thumbnails(image_refs, image_loader)
+
+    loop = asyncio.get_running_loop()
+    with stage_timer(COMPUTE):
+        hashes, laplacian_vars = await loop.run_in_executor(None, analyze_thumbnails, thumbnails)
+
+    await set_cached_phashes(dict(zip(image_refs, hashes)))
+    return AlbumAnalysis(image_refs=list(image_refs), hashes=hashes, laplacian_vars=laplacian_vars)
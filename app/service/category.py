@@ -4,12 +4,12 @@ from typing import Dict, List, Tuple, Optional
 
 import torch
 
-from app.utils.logging_decorator import log_exception, log_flow
+from app.utils.logging_decorator import log_exception, log_flow, trace_flow
 
 logger = logging.getLogger(__name__)
 
 
-@log_flow
+@trace_flow
 def compute_similarity(
     image_features: torch.Tensor,
     text_features: torch.Tensor,
@@ -35,7 +35,7 @@ def compute_similarity(
     return sims_matrix
 
 
-@log_flow
+@trace_flow
 def apply_tag_boosts(
     sims_matrix: torch.Tensor,
     categories: List[str],
@@ -62,7 +62,7 @@ def apply_tag_boosts(
     return sims_matrix
 
 
-@log_flow
+@trace_flow
 def select_topk_tags_per_image(
     sims_matrix: torch.Tensor,
     categories: List[str],
@@ -93,7 +93,7 @@ def select_topk_tags_per_image(
     return topk_info
 
 
-@log_flow
+@trace_flow
 def refine_categories_by_parent(
     topk_info: List[List[Tuple[str, float]]],
     parent_categories: Dict[str, List[str]],
@@ -128,7 +128,7 @@ def refine_categories_by_parent(
     return refined_topk_info
 
 
-@log_flow
+@trace_flow
 def compute_tag_representative_scores(
     topk_info: List[List[Tuple[str, float]]],
     categories: List[str],
@@ -164,7 +164,7 @@ def compute_tag_representative_scores(
     ]
 
 
-@log_flow
+@trace_flow
 def select_representative_categories(
     tag_representative_scores: List[Tuple[str, float]], k: int = 5
 ) -> List[Tuple[str, float]]:
@@ -185,7 +185,7 @@ def select_representative_categories(
     ]
 
 
-@log_flow
+@trace_flow
 def classify_images_by_representative_tags(
     topk_info: List[List[Tuple[str, float]]],
     representative_tags: List[Tuple[str, float]],
@@ -220,7 +220,7 @@ def classify_images_by_representative_tags(
     return dict(category_to_images)
 
 
-@log_flow
+@trace_flow
 def select_representative_tag_per_category(
     category_to_images: Dict[str, List[int]],
     topk_info: List[List[Tuple[str, float]]],
@@ -261,7 +261,7 @@ def select_representative_tag_per_category(
     return category_to_rep_tag
 
 
-@log_flow
+@trace_flow
 def reclassify_images_by_new_rep_tags(
     category_to_images: Dict[str, List[int]],
     category_to_rep_tag: Dict[str, Tuple[str, float]],
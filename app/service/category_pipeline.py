@@ -5,7 +5,8 @@ import logging
 from app.schemas.common.request import ImageConceptRequest
 from app.schemas.models.categories import CategoriesResponse, CategoriesMultiResponseData, CategoryCluster
 from app.config.app_config import get_config
-from app.core.cache import get_cached_embeddings_parallel
+from app.core.album_cache import get_album_embedding_matrix
+from app.core.stage_timer import COMPUTE, REDIS_FETCH, set_stage_size, stage_timer
 from app.service.category import categorize_images
 from app.utils.status_message import get_message_by_status
 
@@ -28,9 +29,12 @@ async def run_category_pipeline(req: ImageConceptRequest) -> tuple[int, Categori
 
         image_names = req.images
         concepts = req.concepts or []
+        set_stage_size(len(image_names))
 
-        # 임베딩 로딩
-        image_features, missing_keys = await get_cached_embeddings_parallel(image_names)
+        # 정규화된 임베딩 행렬 로딩 (albumId가 있으면 앨범 행렬 캐시 사용)
+        album_id = getattr(req, "albumId", None)
+        with stage_timer(REDIS_FETCH):
+            image_tensor, missing_keys = await get_album_embedding_matrix(album_id, image_names)
 
         if missing_keys:
             logger.warning(f"[EMBEDDING_REQUIRED] 누락된 임베딩: {missing_keys}")
@@ -41,14 +45,6 @@ async def run_category_pipeline(req: ImageConceptRequest) -> tuple[int, Categori
                 data=data.result()
             )
 
-        # 정규화
-        processed = [
-            torch.tensor(f, dtype=torch.float32) if isinstance(f, list) else f
-            for f in image_features
-        ]
-        image_tensor = torch.stack(processed)
-        image_tensor /= image_tensor.norm(dim=-1, keepdim=True)
-
         # 카테고리/임베딩 구성
         parent_categories = config.parent_categories
         parent_embeds = config.parent_embeds
@@ -72,7 +68,8 @@ async def run_category_pipeline(req: ImageConceptRequest) -> tuple[int, Categori
             refined_embeds_tensor.cpu(),
             refined_categories,
         )
-        categorized = await loop.run_in_executor(None, task_func)
+        with stage_timer(COMPUTE):
+            categorized = await loop.run_in_executor(None, task_func)
 
         # 응답 구성
         category_clusters = [
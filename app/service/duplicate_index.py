@@ -0,0 +1,251 @@
+"""
+앨범별 증분 중복 이미지 인덱스 모듈입니다.
+
+앨범의 pHash 배열과 eps 이웃 그래프의 연결 요소를 메모리에 보관하고, 새 사진이 추가되면
+새 해시만 기존 해시와 비교해 연결 요소를 갱신합니다. 사진이 삭제되면 남은 해시로
+연결 요소를 다시 계산합니다. min_samples=2인 DBSCAN 결과는
+eps 그래프의 연결 요소와 같으므로 전체를 다시 클러스터링한 결과와 같은 그룹을 반환합니다.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from dotenv import load_dotenv
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from app.service.hamming_index import find_hamming_pairs, popcount64
+
+load_dotenv()
+
+DUPLICATE_INDEX_MAX_ALBUMS = int(os.getenv("DUPLICATE_INDEX_MAX_ALBUMS", "512"))
+DUPLICATE_INDEX_TTL = int(os.getenv("DUPLICATE_INDEX_TTL", "3600"))
+
+# executor 스레드별로 재사용하는 버퍼 (동시에 실행되는 요청끼리 공유하지 않음)
+_buffers = threading.local()
+# 한 번에 XOR·popcount를 계산할 최대 행 수
+HAMMING_BLOCK_SIZE = 256
+# 스레드별 XOR 버퍼의 최대 원소 수 (uint64 4M개 = 32MB, 앨범이 크면 블록 행 수를 줄임)
+HAMMING_BUFFER_MAX_ELEMENTS = 4 * 1024 * 1024
+# 새 이미지가 이 수를 넘으면 블록 비교 대신 다중 인덱스 해싱으로 이웃 쌍을 찾음
+DENSE_MATRIX_MAX_IMAGES = 2048
+
+
+@dataclass
+class AlbumDuplicateIndex:
+    """
+    앨범 하나의 pHash와 eps 이웃 그래프 연결 요소입니다. 갱신 시 새 객체를 만듭니다.
+
+    Attributes:
+        image_refs: 행 순서와 같은 이미지 목록
+        positions: 이미지 → 행 인덱스
+        hashes: shape (N,) uint64 pHash
+        components: shape (N,) 연결 요소 번호
+        has_neighbor: shape (N,) eps 이내 이웃이 있는지 여부
+        eps: 이웃 판정에 사용한 최대 해밍 거리
+        expires_at: 만료 시각 (time.monotonic 기준)
+
+    """
+
+    image_refs: list[str]
+    positions: dict[str, int]
+    hashes: np.ndarray
+    components: np.ndarray
+    has_neighbor: np.ndarray
+    eps: int
+    expires_at: float = 0.0
+
+    @classmethod
+    def empty(cls, eps: int) -> "AlbumDuplicateIndex":
+        return cls(
+            image_refs=[],
+            positions={},
+            hashes=np.empty(0, dtype=np.uint64),
+            components=np.empty(0, dtype=np.int64),
+            has_neighbor=np.empty(0, dtype=bool),
+            eps=eps,
+        )
+
+    def extend(self, image_refs: list[str], hashes: np.ndarray) -> "AlbumDuplicateIndex":
+        """
+        새 이미지의 해시를 기존 해시와 비교해 연결 요소를 갱신한 새 인덱스를 반환합니다.
+
+        Args:
+            image_refs: 인덱스에 없는 새 이미지 목록 (중복 없음)
+            hashes: shape (M,) uint64 새 이미지 pHash
+
+        Returns:
+            AlbumDuplicateIndex: 새 이미지가 추가된 인덱스
+        """
+        n, m = len(self.image_refs), len(image_refs)
+        if m == 0:
+            return self
+
+        all_hashes = np.concatenate([self.hashes, hashes.astype(np.uint64, copy=False)])
+        i, j = _pairs_with_new(all_hashes, n, self.eps)
+
+        # 기존 연결 요소를 노드 하나로 축약한 그래프에 새 노드와 새 간선만 추가
+        _, old_labels = np.unique(self.components, return_inverse=True)
+        num_old = int(old_labels.max()) + 1 if n else 0
+        node_of = np.concatenate([old_labels, num_old + np.arange(m)])
+        graph = coo_matrix(
+            (np.ones(len(i), dtype=np.int8), (node_of[i], node_of[j])),
+            shape=(num_old + m, num_old + m),
+        ).tocsr()
+        _, merged = connected_components(graph, directed=False)
+
+        has_neighbor = np.concatenate([self.has_neighbor, np.zeros(m, dtype=bool)])
+        has_neighbor[i] = True
+        has_neighbor[j] = True
+
+        refs = self.image_refs + list(image_refs)
+        return AlbumDuplicateIndex(
+            image_refs=refs,
+            positions={**self.positions, **{ref: n + k for k, ref in enumerate(image_refs)}},
+            hashes=all_hashes,
+            components=merged[node_of],
+            has_neighbor=has_neighbor,
+            eps=self.eps,
+        )
+
+    def restrict(self, image_refs: set[str]) -> "AlbumDuplicateIndex":
+        """
+        image_refs에 있는 이미지만 남긴 새 인덱스를 반환합니다.
+
+        삭제된 이미지가 연결 요소를 이어 주고 있었을 수 있으므로, 남은 해시로 연결 요소를
+        다시 계산합니다. (해시는 재사용하므로 다시 내려받지 않음)
+
+        Args:
+            image_refs: 남길 이미지 집합 (인덱스에 없는 이미지는 무시)
+
+        Returns:
+            AlbumDuplicateIndex: 남은 이미지만 담은 인덱스
+        """
+        kept = [pos for pos, ref in enumerate(self.image_refs) if ref in image_refs]
+        if len(kept) == len(self.image_refs):
+            return self
+        return AlbumDuplicateIndex.empty(self.eps).extend(
+            [self.image_refs[pos] for pos in kept], self.hashes[kept]
+        )
+
+    def groups(self, image_refs: list[str]) -> list[list[str]]:
+        """
+        요청 이미지 순서대로 중복 그룹을 반환합니다. (이웃이 없는 이미지는 제외)
+        """
+        groups: dict[int, list[str]] = {}
+        for ref in image_refs:
+            pos = self.positions[ref]
+            if self.has_neighbor[pos]:
+                groups.setdefault(int(self.components[pos]), []).append(ref)
+        return list(groups.values())
+
+
+def _buffer(name: str, size: int, dtype: type) -> np.ndarray:
+    """
+    현재 스레드의 재사용 버퍼에서 size개 원소의 1차원 뷰를 반환합니다. 부족하면 새로 할당합니다.
+    """
+    buf = getattr(_buffers, name, None)
+    if buf is None or buf.size < size:
+        buf = np.empty(size, dtype=dtype)
+        setattr(_buffers, name, buf)
+    return buf[:size]
+
+
+def _pairs_with_new(all_hashes: np.ndarray, n: int, eps: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    인덱스 n 이후의 새 해시가 포함된 eps 이내 쌍 (i, j)을 찾습니다.
+
+    새 해시가 적으면 새 해시 × 전체 해시만 블록 단위로 비교하고 (O(M·N)),
+    많으면 다중 인덱스 해싱으로 전체 쌍을 찾은 뒤 새 해시가 포함된 쌍만 남깁니다.
+    블록 비교의 XOR·거리·비교 결과는 스레드별 버퍼에 기록해 블록마다 할당하지 않습니다.
+    """
+    total = len(all_hashes)
+    m = total - n
+    if m > DENSE_MATRIX_MAX_IMAGES:
+        i, j, _ = find_hamming_pairs(all_hashes, eps=eps)
+        keep = j >= n
+        return i[keep], j[keep]
+
+    block_size = max(1, min(HAMMING_BLOCK_SIZE, HAMMING_BUFFER_MAX_ELEMENTS // total))
+    capacity = min(block_size, m) * total
+    xor_buf = _buffer("xor", capacity, np.uint64)
+    dist_buf = _buffer("dist", capacity, np.uint8)
+    near_buf = _buffer("near", capacity, np.bool_)
+
+    rows, cols = [], []
+    for start in range(n, total, block_size):
+        stop = min(start + block_size, total)
+        shape = (stop - start, stop)
+        size = shape[0] * shape[1]
+        xor_block = xor_buf[:size].reshape(shape)
+        dist_block = dist_buf[:size].reshape(shape)
+        near_block = near_buf[:size].reshape(shape)
+
+        # 새 해시끼리는 한 번씩만 비교 (열 < 행)
+        np.bitwise_xor(all_hashes[start:stop, None], all_hashes[None, :stop], out=xor_block)
+        popcount64(xor_block, dist_block)
+        np.less_equal(dist_block, eps, out=near_block)
+        r, c = np.nonzero(near_block)
+        keep = c < r + start
+        rows.append(r[keep] + start)
+        cols.append(c[keep])
+
+    return np.concatenate(rows), np.concatenate(cols)
+
+
+class AlbumDuplicateIndexCache:
+    """
+    albumId별 중복 인덱스를 보관하는 LRU 캐시입니다.
+    """
+
+    def __init__(self, max_albums: int, ttl: int) -> None:
+        """
+        Args:
+            max_albums: 보관할 최대 앨범 수
+            ttl: 항목 유효 시간(초)
+
+        """
+        self.max_albums = max_albums
+        self.ttl = ttl
+        self._entries: OrderedDict[int, AlbumDuplicateIndex] = OrderedDict()
+
+    def get(self, album_id: int, eps: int) -> Optional[AlbumDuplicateIndex]:
+        entry = self._entries.get(album_id)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.monotonic() or entry.eps != eps:
+            self.invalidate(album_id)
+            return None
+
+        self._entries.move_to_end(album_id)
+        return entry
+
+    def put(self, album_id: int, entry: AlbumDuplicateIndex) -> None:
+        if self.max_albums <= 0:
+            return
+
+        entry.expires_at = time.monotonic() + self.ttl
+        self._entries.pop(album_id, None)
+        self._entries[album_id] = entry
+
+        while len(self._entries) > self.max_albums:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, album_id: int) -> None:
+        self._entries.pop(album_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_duplicate_index_cache = AlbumDuplicateIndexCache(DUPLICATE_INDEX_MAX_ALBUMS, DUPLICATE_INDEX_TTL)
+
+
+def get_duplicate_index_cache() -> AlbumDuplicateIndexCache:
+    return _duplicate_index_cache
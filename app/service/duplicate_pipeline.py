@@ -1,14 +1,76 @@
 import logging
-from functools import partial
-from typing import Tuple
+from typing import Optional, Tuple
+
+import numpy as np
 
 from app.schemas.common.request import ImageRequest
 from app.schemas.models.duplicate import DuplicateResponse, DuplicateMultiResponseData
-from app.service.duplicate import find_duplicate_groups
+from app.core.phash_store import get_cached_phashes
+from app.core.stage_timer import COMPUTE, REDIS_FETCH, set_stage_size, stage_timer
+from app.service.album_analysis import analyze_album
+from app.service.duplicate_index import AlbumDuplicateIndex, get_duplicate_index_cache
 from app.utils.status_message import get_message_by_status
 
 logger = logging.getLogger(__name__)
 
+# 축소 디코딩 썸네일(긴 변 300px)의 pHash 기준 값. 같은 사진의 재압축/리사이즈/밝기/
+# 블러/노이즈 변형은 4비트 이내(3% 크롭은 최대 13), 서로 다른 사진은 20비트 이상이라
+# 원본 해상도 pHash일 때의 10을 그대로 사용 (tests/test_album_analysis.py)
+DUPLICATE_EPS = 10
+
+
+async def _resolve_hashes(image_refs: list[str], config) -> dict[str, np.uint64]:
+    """
+    이미지의 pHash를 저장소에서 읽고, 없는 이미지만 내려받아 해시합니다.
+    """
+    if not image_refs:
+        return {}
+
+    with stage_timer(REDIS_FETCH):
+        stored = await get_cached_phashes(image_refs)
+    to_hash = [ref for ref in image_refs if ref not in stored]
+
+    computed: dict[str, np.uint64] = {}
+    if to_hash:
+        # 품질 평가와 공유하는 흑백 썸네일로 해시 (계산한 해시는 저장소에 기록됨)
+        analysis = await analyze_album(to_hash, config.image_loader)
+        logger.debug(
+            "[DUPLICATE_PIPELINE] 이미지 해시 완료",
+            extra={"hashed_images": len(to_hash), "cached_hashes": len(stored)},
+        )
+        computed = dict(zip(to_hash, analysis.hashes))
+
+    return {**stored, **computed}
+
+
+def _apply_changes(
+    index: AlbumDuplicateIndex,
+    requested: set[str],
+    new_refs: list[str],
+    new_hashes: np.ndarray,
+) -> AlbumDuplicateIndex:
+    return index.restrict(requested).extend(new_refs, new_hashes)
+
+
+async def _update_index(
+    index: Optional[AlbumDuplicateIndex], image_refs: list[str], config
+) -> AlbumDuplicateIndex:
+    """
+    앨범 인덱스에 요청 이미지를 반영합니다.
+
+    요청에 없는 기존 이미지는 인덱스에서 제거하고(남은 해시로 연결 요소 재계산),
+    인덱스에 없는 새 이미지만 해시해서 추가합니다.
+    """
+    base = index or AlbumDuplicateIndex.empty(DUPLICATE_EPS)
+    new_refs = [ref for ref in image_refs if ref not in base.positions]
+    hashes = await _resolve_hashes(new_refs, config)
+
+    new_hashes = np.array([hashes[ref] for ref in new_refs], dtype=np.uint64)
+    with stage_timer(COMPUTE):
+        return await config.loop.run_in_executor(
+            None, _apply_changes, base, set(image_refs), new_refs, new_hashes
+        )
+
 
 async def run_duplicate_pipeline(req: ImageRequest) -> Tuple[int, DuplicateResponse]:
     """
@@ -23,7 +85,6 @@ async def run_duplicate_pipeline(req: ImageRequest) -> Tuple[int, DuplicateRespo
     try:
         from app.config.app_config import get_config
         config = get_config()
-        loop = config.loop
         image_refs = req.images
 
         if not image_refs:
@@ -34,18 +95,19 @@ async def run_duplicate_pipeline(req: ImageRequest) -> Tuple[int, DuplicateRespo
                 data=None
             )
 
-        # 이미지 로드
-        image_loader = config.image_loader
-        images = await image_loader.load_images(image_refs, "GRAY")
+        set_stage_size(len(image_refs))
+        image_refs = list(dict.fromkeys(image_refs))
 
-        logger.debug(
-            "[DUPLICATE_PIPELINE] 이미지 로드 완료",
-            extra={"loaded_images": len(images)},
-        )
+        # 앨범 인덱스가 있으면 새 이미지만 해시해서 기존 그룹에 반영
+        album_id = getattr(req, "albumId", None)
+        index_cache = get_duplicate_index_cache()
+        index = index_cache.get(album_id, DUPLICATE_EPS) if album_id is not None else None
+
+        index = await _update_index(index, image_refs, config)
+        if album_id is not None:
+            index_cache.put(album_id, index)
 
-        # 중복 그룹 검색
-        task_func = partial(find_duplicate_groups, images, image_refs)
-        duplicate_groups = await loop.run_in_executor(None, task_func)
+        duplicate_groups = index.groups(image_refs)
 
         # 로그 출력
         total_duplicates = sum(len(group) for group in duplicate_groups)
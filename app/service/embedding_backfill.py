@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import os
+import uuid
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from app.config.redis import get_redis
+from app.core.cache import get_existing_embedding_refs
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+EMBEDDING_BACKFILL_BATCH_SIZE = int(os.getenv("EMBEDDING_BACKFILL_BATCH_SIZE", "256"))
+# 배치를 채우기 위해 첫 요청 이후 기다리는 시간(초)
+EMBEDDING_BACKFILL_LINGER = float(os.getenv("EMBEDDING_BACKFILL_LINGER", "1.0"))
+# 실패한 ref를 다시 시도하지 않도록 기억하는 최대 개수
+MAX_FAILED_REFS = 100_000
+
+# 락을 가진 워커가 TTL의 1/3마다 연장하므로, 워커가 죽으면 TTL 안에 다른 워커가 이어받음
+BACKFILL_LOCK_TTL = int(os.getenv("EMBEDDING_BACKFILL_LOCK_TTL", "60"))
+
+# 소유자 토큰이 같을 때만 연장·해제 (다른 워커가 이어받은 락을 건드리지 않음)
+_REFRESH_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class EmbeddingBackfiller:
+    """
+    fallback 네임스페이스에만 있는 이미지를 현재 네임스페이스로 재임베딩하는 백그라운드 작업입니다.
+
+    요청 처리 중 fallback에서 발견된 ref나 fallback 네임스페이스 전체 SCAN 결과를
+    모아 `batch_size`개씩 기존 `/clip/embedding` 파이프라인으로 보냅니다.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = EMBEDDING_BACKFILL_BATCH_SIZE,
+        linger: float = EMBEDDING_BACKFILL_LINGER,
+    ) -> None:
+        """
+        Args:
+            batch_size: GPU 서버로 한 번에 보낼 이미지 수
+            linger: 배치를 채우기 위해 기다리는 시간(초)
+
+        """
+        self.batch_size = batch_size
+        self.linger = linger
+        self._pending: dict[str, None] = {}
+        self._failed: set[str] = set()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info("[BACKFILL] 재임베딩 워커 시작")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            logger.info("[BACKFILL] 재임베딩 워커 종료")
+        self._task = None
+
+    def enqueue(self, refs: list[str]) -> None:
+        """
+        재임베딩할 ref를 등록합니다. 이미 대기 중이거나 실패한 ref는 무시합니다.
+        """
+        for ref in refs:
+            if ref not in self._failed:
+                self._pending.setdefault(ref, None)
+
+        if self._pending:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        from app.service.embedding_pipeline import embed_images_into_cache
+
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self.linger)
+
+            while self._pending:
+                batch = list(self._pending)[: self.batch_size]
+                for ref in batch:
+                    del self._pending[ref]
+
+                try:
+                    status_code, invalid_images = await embed_images_into_cache(batch)
+                except Exception:
+                    logger.exception("[BACKFILL] 재임베딩 배치 처리 중 예외 발생")
+                    continue
+
+                if len(self._failed) < MAX_FAILED_REFS:
+                    self._failed.update(invalid_images)
+
+                logger.info(
+                    f"[BACKFILL] 재임베딩 배치 완료: status={status_code}, "
+                    f"요청={len(batch)}, 실패={len(invalid_images)}, 대기={len(self._pending)}"
+                )
+
+            self._wakeup.clear()
+
+    async def backfill_namespace(self, namespace: str, scan_count: int = 1000) -> int:
+        """
+        fallback 네임스페이스의 ref 중 현재 네임스페이스에 없는 ref를 재임베딩 대상으로 등록합니다.
+
+        여러 워커가 동시에 같은 네임스페이스를 처리하지 않도록 Redis 락을 사용합니다.
+        락은 스캔한 ref의 재임베딩이 끝날 때까지 연장하며 유지하고 끝나면 해제합니다.
+        대기 중인 ref는 메모리에만 있으므로, 워커가 재시작되면 다음 실행이 네임스페이스를
+        다시 스캔해 아직 현재 네임스페이스에 없는 ref부터 이어서 처리합니다.
+
+        Args:
+            namespace: 재임베딩할 원본 네임스페이스 (예: "emb:ViT-B-32:v1")
+            scan_count: SCAN COUNT 힌트
+
+        Returns:
+            int: 등록한 ref 수 (락을 얻지 못하면 0)
+
+        """
+        redis = get_redis()
+        lock_key = f"{namespace}:__backfill_lock__"
+        token = uuid.uuid4().hex.encode("utf-8")
+        if not await redis.set(lock_key, token, nx=True, ex=BACKFILL_LOCK_TTL):
+            logger.info(f"[BACKFILL] 다른 워커가 '{namespace}' 재임베딩을 진행 중입니다.")
+            return 0
+
+        refresher = asyncio.create_task(self._refresh_lock(lock_key, token))
+        try:
+            enqueued = await self._scan_namespace(namespace, lock_key, scan_count)
+            await self._drain()
+        finally:
+            refresher.cancel()
+            try:
+                await redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+            except Exception as e:
+                logger.error(f"[BACKFILL] 락 해제 실패 (TTL 후 만료): {e}")
+
+        logger.info(f"[BACKFILL] '{namespace}'에서 {enqueued}개 ref 재임베딩 완료")
+        return enqueued
+
+    async def _scan_namespace(self, namespace: str, lock_key: str, scan_count: int) -> int:
+        redis = get_redis()
+        prefix = f"{namespace}:"
+        cursor = 0
+        enqueued = 0
+        while True:
+            cursor, keys = await redis.scan(cursor=cursor, match=f"{prefix}*", count=scan_count)
+            refs = [
+                key.decode("utf-8")[len(prefix):]
+                for key in keys
+                if key != lock_key.encode("utf-8")
+            ]
+            # 요청 처리 중 이미 현재 네임스페이스로 임베딩된 ref는 제외
+            existing = await get_existing_embedding_refs(refs)
+            refs = [ref for ref in refs if ref not in existing]
+            self.enqueue(refs)
+            enqueued += len(refs)
+
+            if cursor == 0:
+                break
+
+            # 대기열이 너무 길어지지 않도록 GPU 처리 속도에 맞춰 스캔
+            while len(self._pending) > self.batch_size * 4:
+                await asyncio.sleep(self.linger)
+
+        logger.info(f"[BACKFILL] '{namespace}'에서 {enqueued}개 ref 등록 완료")
+        return enqueued
+
+    async def _drain(self) -> None:
+        """
+        대기 중인 ref와 처리 중인 배치가 모두 끝날 때까지 기다립니다.
+        """
+        while self._pending or self._wakeup.is_set():
+            await asyncio.sleep(self.linger)
+
+    @staticmethod
+    async def _refresh_lock(lock_key: str, token: bytes) -> None:
+        redis = get_redis()
+        while True:
+            await asyncio.sleep(BACKFILL_LOCK_TTL / 3)
+            try:
+                if not await redis.eval(_REFRESH_LOCK_SCRIPT, 1, lock_key, token, BACKFILL_LOCK_TTL):
+                    logger.warning(f"[BACKFILL] 락을 잃었습니다: '{lock_key}'")
+                    return
+            except Exception as e:
+                logger.error(f"[BACKFILL] 락 연장 실패: {e}")
+
+
+_embedding_backfiller: Optional[EmbeddingBackfiller] = None
+
+
+def get_embedding_backfiller() -> EmbeddingBackfiller:
+    global _embedding_backfiller
+    if _embedding_backfiller is None:
+        _embedding_backfiller = EmbeddingBackfiller()
+    return _embedding_backfiller
@@ -1,13 +1,124 @@
-import pickle
+import asyncio
 import logging
-from typing import Tuple
+from typing import Optional, Tuple
 
+import torch
+
+from app.core.circuit_breaker import CircuitOpenError
+from app.core.metrics import GPU_EMBEDDING_IMAGES_SAVED, GPU_EMBEDDING_REQUESTS_SAVED
+from app.core.singleflight import InFlightRegistry
+from app.core.stage_timer import GPU_CALL, REDIS_FETCH, set_stage_size, stage_timer
 from app.schemas.common.request import ImageRequest
 from app.schemas.models.embedding import EmbeddingResponse, EmbeddingMultiResponseData
 from app.utils.status_message import get_message_by_status
 
 logger = logging.getLogger(__name__)
 
+# 워커 내에서 임베딩 중인 이미지 ref (HTTP/Kafka 공용)
+_inflight_embeddings = InFlightRegistry()
+
+
+async def _embed_owned_images(
+    image_refs: list[str], album_id: Optional[int]
+) -> Tuple[int, list[str]]:
+    """
+    선점한 이미지를 GPU 서버로 임베딩하고 캐시에 저장합니다.
+
+    Returns:
+        Tuple[int, list[str]]: 상태 코드, 실패한 이미지 목록
+
+    """
+    from app.core.album_cache import get_album_matrix_cache
+    from app.core.gpu_batcher import get_gpu_embedding_batcher
+
+    # 다른 요청과 합쳐 GPU 서버로 배치 요청 (결과는 수신 즉시 캐시에 저장됨)
+    with stage_timer(GPU_CALL):
+        status_code, result, failed_keys = await get_gpu_embedding_batcher().embed(image_refs)
+
+    if status_code != 200:
+        logger.error(f"[GPU FAIL] 상태 코드={status_code}")
+        return 500, list(image_refs)
+
+    invalid_images: list[str] = []
+    for filename in image_refs:
+        if filename not in result:
+            invalid_images.append(filename)
+
+    if failed_keys:
+        logger.error(f"[Redis SET ERROR] {len(failed_keys)}개 키 저장 실패: {failed_keys[:20]}")
+        invalid_images.extend(failed_keys)
+        return 500, invalid_images
+
+    # 이미 캐싱된 앨범 행렬이 있으면 새 행을 추가
+    if album_id is not None and result:
+        stored_refs = list(result)
+        vectors = torch.stack([
+            torch.as_tensor(result[ref], dtype=torch.float32) for ref in stored_refs
+        ])
+        get_album_matrix_cache().append(album_id, stored_refs, vectors)
+
+    return 201, invalid_images
+
+
+async def embed_images_into_cache(
+    image_refs: list[str], album_id: Optional[int] = None
+) -> Tuple[int, list[str]]:
+    """
+    이미지를 임베딩해 캐시에 저장합니다.
+
+    이미 캐시에 있는 이미지는 GPU 서버로 보내지 않고, 다른 요청이 임베딩 중인
+    이미지는 다시 보내지 않고 그 요청의 완료를 기다립니다.
+
+    Args:
+        image_refs: 이미지 ref 목록
+        album_id: 앨범 ID (있으면 앨범 행렬 캐시에 새 행을 추가)
+
+    Returns:
+        Tuple[int, list[str]]: 상태 코드, 실패한 이미지 목록
+
+    """
+    from app.core.cache import get_existing_embedding_refs
+
+    unique_refs = list(dict.fromkeys(image_refs))
+
+    # 1. 이미 캐싱된 이미지 제외
+    with stage_timer(REDIS_FETCH):
+        cached_refs = await get_existing_embedding_refs(unique_refs)
+    to_embed = [ref for ref in unique_refs if ref not in cached_refs]
+
+    # 2. 다른 요청이 임베딩 중인 이미지 제외
+    owned, waiting = _inflight_embeddings.claim(to_embed)
+
+    GPU_EMBEDDING_IMAGES_SAVED.labels("cached").inc(len(cached_refs))
+    GPU_EMBEDDING_IMAGES_SAVED.labels("inflight").inc(len(waiting))
+    if not owned:
+        GPU_EMBEDDING_REQUESTS_SAVED.inc()
+
+    logger.info(
+        f"[EMBEDDING_PIPELINE] 요청={len(unique_refs)}, 캐시됨={len(cached_refs)}, "
+        f"처리 중 대기={len(waiting)}, GPU 요청={len(owned)}"
+    )
+
+    status_code = 201
+    invalid_images: list[str] = []
+    try:
+        if owned:
+            status_code, invalid_images = await _embed_owned_images(owned, album_id)
+            failed = set(invalid_images)
+            for ref in owned:
+                _inflight_embeddings.resolve(ref, ref not in failed)
+    finally:
+        _inflight_embeddings.release(owned)
+
+    # 3. 다른 요청이 처리 중인 이미지 결과 대기
+    if waiting:
+        results = await asyncio.gather(*waiting.values())
+        invalid_images.extend(
+            ref for ref, succeeded in zip(waiting, results) if not succeeded
+        )
+
+    return status_code, invalid_images
+
 
 async def run_embedding_pipeline(req: ImageRequest) -> Tuple[int, EmbeddingResponse]:
     """
@@ -19,13 +130,9 @@ async def run_embedding_pipeline(req: ImageRequest) -> Tuple[int, EmbeddingRespo
     Returns:
         Tuple[int, EmbeddingResponse]: 상태 코드와 응답 모델
     """
-    from app.config.app_config import get_config
-    from app.core.cache import set_cached_embedding
     try:
-        config = get_config()
-        gpu_client = config.gpu_client
-
         image_list = req.images
+        set_stage_size(len(image_list or []))
         if not image_list:
             status_code = 400
             logger.warning("[EMBEDDING_PIPELINE] 입력 이미지 없음")
@@ -34,42 +141,17 @@ async def run_embedding_pipeline(req: ImageRequest) -> Tuple[int, EmbeddingRespo
                 data=None
             )
 
-        # GPU 서버 POST 요청
-        response = await gpu_client.post(
-            "/clip/embedding",
-            json={"images": image_list},
-            headers={"Content-Type": "application/json"},
+        status_code, invalid_images = await embed_images_into_cache(
+            image_list, getattr(req, "albumId", None)
         )
 
-        if response.status_code != 200:
-            logger.error(f"[GPU FAIL] 상태 코드={response.status_code}")
-            status_code = 500
+        if status_code != 201:
+            data = EmbeddingMultiResponseData(invalid_images=invalid_images)
             return status_code, EmbeddingResponse(
                 message=get_message_by_status(status_code),
-                data=None
+                data=data.result() if invalid_images else None
             )
 
-        result_obj = pickle.loads(await response.aread())
-
-        result: dict[str, list[float]] = result_obj.get("data", {})
-
-        invalid_images: list[str] = []
-        for filename in image_list:
-            if filename not in result:
-                invalid_images.append(filename)
-
-        for filename, feature in result.items():
-            try:
-                await set_cached_embedding(filename, feature)
-            except Exception as e:
-                logger.error(f"[Redis SET ERROR] key='{filename}' 실패: {e}", exc_info=True)
-                status_code = 500
-                data=EmbeddingMultiResponseData(invalid_images=invalid_images)
-                return status_code, EmbeddingResponse(
-                    message=get_message_by_status(status_code),
-                    data=data.result()
-                )
-            
         status_code = 201
         data = EmbeddingMultiResponseData(invalid_images=invalid_images)
         return status_code, EmbeddingResponse(
@@ -77,6 +159,14 @@ async def run_embedding_pipeline(req: ImageRequest) -> Tuple[int, EmbeddingRespo
             data=None
         )
 
+    except CircuitOpenError as e:
+        status_code = 503
+        logger.warning(f"[EMBEDDING_PIPELINE] GPU 서버 요청 차단: {e}")
+        return status_code, EmbeddingResponse(
+            message=get_message_by_status(status_code),
+            data=None
+        )
+
     except Exception:
         status_code = 500
         logger.exception("[INTERNAL_ERROR] 임베딩 파이프라인 처리 중 예외 발생")
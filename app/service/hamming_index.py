@@ -0,0 +1,120 @@
+"""
+64비트 pHash용 다중 인덱스 해싱(multi-index hashing) 모듈입니다.
+
+해시를 k개의 부분 문자열로 나누면, 해밍 거리가 eps 이하인 두 해시는 비둘기집 원리에 의해
+적어도 하나의 부분 문자열에서 거리 eps // k 이하입니다. 부분 문자열마다 정렬된 인덱스를 만들고
+거리 eps // k 이내의 키만 조회해 후보 쌍을 모은 뒤, 전체 64비트 해밍 거리로 검증합니다.
+N×N 거리 행렬을 만들지 않으므로 큰 앨범에서도 거의 선형 시간에 eps 이웃 그래프를 만듭니다.
+"""
+
+from itertools import combinations
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# 64비트를 나눌 부분 문자열 수 (16비트 × 4)
+MIH_SUBSTRINGS = 4
+# 한 번에 펼칠 후보 쌍 수 상한 (메모리 사용량 제한)
+MIH_MAX_PAIRS_PER_CHUNK = 4_000_000
+
+def popcount64(values: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    uint64 배열의 원소별 1비트 수를 uint8 배열로 반환합니다. (out이 있으면 out에 기록)
+    """
+    return np.bitwise_count(values, out=out)
+
+
+def _probe_masks(bits: int, radius: int) -> np.ndarray:
+    """
+    bits 비트 키에서 해밍 거리 radius 이내의 키를 만드는 XOR 마스크 목록을 반환합니다.
+    """
+    masks = [0]
+    for r in range(1, radius + 1):
+        for positions in combinations(range(bits), r):
+            masks.append(sum(1 << p for p in positions))
+    return np.array(masks, dtype=np.uint64)
+
+
+def _substrings(packed: np.ndarray, k: int) -> List[Tuple[np.ndarray, int]]:
+    """
+    uint64 해시를 k개의 (부분 키 배열, 비트 수)로 나눕니다.
+    """
+    result = []
+    start = 0
+    for t in range(k):
+        bits = 64 // k + (1 if t < 64 % k else 0)
+        mask = np.uint64((1 << bits) - 1)
+        result.append(((packed >> np.uint64(start)) & mask, bits))
+        start += bits
+    return result
+
+
+def _expand_ranges(lefts: np.ndarray, rights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    쿼리별 [left, right) 구간을 (쿼리 인덱스, 정렬 위치) 쌍으로 펼칩니다.
+    """
+    lengths = rights - lefts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    queries = np.repeat(np.arange(len(lefts)), lengths)
+    offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return queries, lefts[queries] + offsets
+
+
+def find_hamming_pairs(
+    packed: np.ndarray, eps: int = 10, k: int = MIH_SUBSTRINGS
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    해밍 거리가 eps 이하인 모든 해시 쌍 (i < j)을 찾습니다.
+
+    Args:
+        packed (np.ndarray): shape (N,) uint64 해시 배열
+        eps (int, optional): 최대 해밍 거리. Defaults to 10.
+        k (int, optional): 부분 문자열 수. Defaults to MIH_SUBSTRINGS.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (i, j, 거리) 배열
+    """
+    n = packed.shape[0]
+    radius = eps // k
+    found = []
+
+    for keys, bits in _substrings(packed, k):
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+
+        for mask in _probe_masks(bits, radius):
+            probe = keys ^ mask
+            lefts = np.searchsorted(sorted_keys, probe, side="left")
+            rights = np.searchsorted(sorted_keys, probe, side="right")
+
+            # 후보가 많으면 쿼리 구간을 나눠서 펼침
+            lengths = rights - lefts
+            cumulative = np.cumsum(lengths)
+            start = 0
+            while start < n:
+                base = cumulative[start - 1] if start else 0
+                stop = int(np.searchsorted(cumulative, base + MIH_MAX_PAIRS_PER_CHUNK, side="right"))
+                stop = min(max(stop, start + 1), n)
+
+                queries, positions = _expand_ranges(lefts[start:stop], rights[start:stop])
+                i = queries + start
+                j = order[positions]
+                keep = i < j
+                if keep.any():
+                    found.append(i[keep] * n + j[keep])
+                start = stop
+
+    if not found:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.uint8)
+
+    # 여러 부분 문자열에서 중복으로 나온 후보 제거 후 전체 거리로 검증
+    pair_keys = np.unique(np.concatenate(found))
+    i, j = np.divmod(pair_keys, n)
+    distances = popcount64(packed[i] ^ packed[j])
+    keep = distances <= eps
+    return i[keep], j[keep], distances[keep]
+
@@ -3,7 +3,7 @@ from typing import Dict, List, Any
 
 import torch
 
-from app.utils.logging_decorator import log_exception, log_flow
+from app.utils.logging_decorator import log_exception, log_flow, trace_flow
 from app.schemas.models.score import ScoreCategory, ScoreImage
 
 logger = logging.getLogger(__name__)
@@ -12,7 +12,8 @@ logger = logging.getLogger(__name__)
 @log_flow
 def score_each_category(
     categories: List[Any],
-    embedding_map: Dict[str, torch.Tensor],
+    image_features: torch.Tensor,
+    positions: Dict[str, int],
     regressor: torch.nn.Module,
 ) -> List[ScoreCategory]:
     """
@@ -20,7 +21,8 @@ def score_each_category(
 
     Args:
         categories: 카테고리 객체 리스트 (각 카테고리는 images 속성을 가짐)
-        embedding_map: 이미지 파일명을 키로, 임베딩을 값으로 하는 딕셔너리
+        image_features: [N, D] L2 정규화된 이미지 임베딩 행렬
+        positions: 이미지 파일명 → image_features 행 인덱스
         regressor: 하이라이트 점수를 예측하는 회귀 모델
 
     Returns:
@@ -46,13 +48,13 @@ def score_each_category(
             extra={"category": category.category, "image_count": len(category.images)},
         )
 
-        image_features = torch.stack([
-            embedding_map[image] for image in category.images
-        ])
-        image_features /= image_features.norm(dim=-1, keepdim=True)
+        indices = torch.tensor(
+            [positions[image] for image in category.images], dtype=torch.long
+        )
+        category_features = image_features[indices]
 
         scores = estimate_highlight_score(
-            image_features, category.images, regressor
+            category_features, category.images, regressor
         )
 
         scored_category = ScoreCategory(
@@ -70,7 +72,7 @@ def score_each_category(
     return scored_categories
 
 
-@log_flow
+@trace_flow
 def estimate_highlight_score(
     image_features: torch.Tensor,
     image_names: List[str],
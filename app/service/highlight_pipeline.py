@@ -3,7 +3,8 @@ from itertools import chain
 from functools import partial
 import logging
 
-from app.core.cache import get_cached_embeddings_parallel
+from app.core.album_cache import get_album_embedding_matrix
+from app.core.stage_timer import COMPUTE, REDIS_FETCH, set_stage_size, stage_timer
 from app.service.highlight import score_each_category
 from app.schemas.common.request import CategoryScoreRequest
 from app.schemas.models.score import ScoreResponse, ScoreMultiResponseData
@@ -32,9 +33,12 @@ async def run_highlight_pipeline(req: CategoryScoreRequest) -> Tuple[int, ScoreR
         all_images = list(
             chain.from_iterable(category.images for category in categories)
         )
+        set_stage_size(len(all_images))
 
-        # 임베딩 로딩
-        image_features, missing_keys = await get_cached_embeddings_parallel(all_images)
+        # 정규화된 임베딩 행렬 로딩 (albumId가 있으면 앨범 행렬 캐시 사용)
+        album_id = getattr(req, "albumId", None)
+        with stage_timer(REDIS_FETCH):
+            image_features, missing_keys = await get_album_embedding_matrix(album_id, all_images)
 
         if missing_keys:
             logger.warning(f"[EMBEDDING_REQUIRED] 누락된 임베딩: {missing_keys}")
@@ -46,20 +50,20 @@ async def run_highlight_pipeline(req: CategoryScoreRequest) -> Tuple[int, ScoreR
                 data=data.result()
             )
 
-        # 임베딩 맵
-        embedding_map = {
-            image: feature for image, feature in zip(all_images, image_features)
-        }
+        # 이미지 → 행 인덱스
+        positions = {image: i for i, image in enumerate(all_images)}
 
         # 점수 계산
         aesthetic_regressor = config.aesthetic_regressor
         task_func = partial(
             score_each_category,
             categories,
-            embedding_map,
+            image_features,
+            positions,
             aesthetic_regressor,
         )
-        scored_data = await loop.run_in_executor(None, task_func)
+        with stage_timer(COMPUTE):
+            scored_data = await loop.run_in_executor(None, task_func)
         data = ScoreMultiResponseData(score_category_clusters=scored_data)
 
         status_code = 201
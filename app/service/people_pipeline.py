@@ -1,7 +1,10 @@
 import logging
 
+from app.core.circuit_breaker import CircuitOpenError
+from app.core.stage_timer import GPU_CALL, set_stage_size, stage_timer
 from app.schemas.common.request import ImageRequest
 from app.schemas.models.people import PeopleResponse, PeopleMultiResponseData
+from app.utils.codec import encode_model
 from app.utils.status_message import get_message_by_status
 
 logger = logging.getLogger(__name__)
@@ -23,6 +26,7 @@ async def run_people_clustering_pipeline(req: ImageRequest) -> tuple[int, People
         config = get_config()
         gpu_client = config.gpu_client
         image_refs = req.images
+        set_stage_size(len(image_refs or []))
 
         if not image_refs:
             logger.warning("[PEOPLE_PIPELINE] 입력 이미지 없음")
@@ -35,11 +39,12 @@ async def run_people_clustering_pipeline(req: ImageRequest) -> tuple[int, People
         logger.info("[PIPELINE] 인물 클러스터링 요청 시작", extra={"total_images": len(req.images)})
 
 
-        response = await gpu_client.post(
-            "/people/cluster",
-            json=req.dict(),
-            headers={"Content-Type": "application/json"},
-        )
+        with stage_timer(GPU_CALL):
+            response = await gpu_client.post(
+                "/people/cluster",
+                content=encode_model(req),
+                headers={"Content-Type": "application/json"},
+            )
 
         if response.status_code != 200:
             logger.error(f"[GPU_ERROR] 상태 코드 {response.status_code}")
@@ -61,6 +66,14 @@ async def run_people_clustering_pipeline(req: ImageRequest) -> tuple[int, People
             data=data.result()
         )
     
+    except CircuitOpenError as e:
+        status_code = 503
+        logger.warning(f"[PEOPLE_PIPELINE] GPU 서버 요청 차단: {e}")
+        return status_code, PeopleResponse(
+            message=get_message_by_status(status_code),
+            data=None
+        )
+
     except Exception as e:
         status_code = 500
         return status_code, PeopleResponse(
@@ -1,13 +1,13 @@
 import logging
-from typing import Dict, List, Literal, Tuple
+from typing import Dict, List, Literal, Optional, Tuple
 
 import torch
 import torch.nn.functional as F
-import cv2
-import numpy as np
 
-from app.core.cache import get_cached_embeddings_parallel
-from app.utils.logging_decorator import log_exception, log_flow
+from app.core.album_cache import get_album_embedding_matrix
+from app.service.album_analysis import analyze_album
+from app.core.stage_timer import COMPUTE, REDIS_FETCH, stage_timer
+from app.utils.logging_decorator import log_exception, trace_flow
 from app.config.settings import MODEL_NAME
 
 logger = logging.getLogger(__name__)
@@ -20,7 +20,7 @@ DEFAULT_THRESHOLD_A = 0.483 if MODEL_NAME.value == 'ViT-L/14' else 0.488
 ResultType = Literal["both", "field_a_only", "combined_only", "neither"]
 
 
-@log_flow
+@trace_flow
 def compute_pairwise_score(
     image_features: torch.Tensor,
     text_pair: torch.Tensor,
@@ -53,7 +53,7 @@ def compute_pairwise_score(
     return result
 
 
-@log_flow
+@trace_flow
 def get_field_scores(
     image_features: torch.Tensor,
     text_features: torch.Tensor,
@@ -101,6 +101,7 @@ def get_field_scores(
 
 
 @log_exception
+@trace_flow
 def evaluate_dual_threshold(
     scores: List[Dict[str, float]],
     field_a: str,
@@ -175,6 +176,7 @@ async def get_clip_low_quality_images(
     image_refs: List[str],
     text_features: torch.Tensor,
     fields: List[str],
+    album_id: Optional[int] = None,
 ) -> Tuple[List[str], List[str]]:
     """
     'both'가 아닌 모든 결과를 저품질로 간주하고 해당 이미지 이름을 반환합니다.
@@ -183,6 +185,7 @@ async def get_clip_low_quality_images(
         image_refs: 이미지 이름 리스트
         text_features: 텍스트 임베딩 텐서
         fields: 필드 이름 리스트
+        album_id: 앨범 ID (있으면 앨범 행렬 캐시 사용)
 
     Returns:
         Tuple[List[str], List[str]]: 저품질 이미지 이름 리스트, 임베딩이 필요한 키 리스트
@@ -196,9 +199,8 @@ async def get_clip_low_quality_images(
     
     # 1. 이미지 임베딩 로드
 
-    print("quality 임베딩 로드 전")
-    image_features, missing_keys = await get_cached_embeddings_parallel(image_refs)
-    print("quality 임베딩 로드 후")
+    with stage_timer(REDIS_FETCH):
+        image_features, missing_keys = await get_album_embedding_matrix(album_id, image_refs)
 
     # 2. 임베딩이 없는 이미지 처리
     if missing_keys:
@@ -208,19 +210,17 @@ async def get_clip_low_quality_images(
         )
         return image_features, missing_keys
 
-    # 3. 이미지 임베딩 정규화
-    image_features = torch.stack(image_features)
-    image_features /= image_features.norm(dim=-1, keepdim=True)
-
-    scores = get_field_scores(image_features, text_features, fields)
-    results = evaluate_dual_threshold(
-        scores,
-        field_a="sharp",
-        field_b="good",
-        weight_b=DEFAULT_WEIGHT_B,
-        threshold_combined=DEFAULT_THRESHOLD_COMBINED,
-        threshold_a=DEFAULT_THRESHOLD_A,
-    )
+    # 3. 정규화된 이미지 임베딩으로 점수 계산
+    with stage_timer(COMPUTE):
+        scores = get_field_scores(image_features, text_features, fields)
+        results = evaluate_dual_threshold(
+            scores,
+            field_a="sharp",
+            field_b="good",
+            weight_b=DEFAULT_WEIGHT_B,
+            threshold_combined=DEFAULT_THRESHOLD_COMBINED,
+            threshold_a=DEFAULT_THRESHOLD_A,
+        )
 
     low_quality_images = [
         name for name, result in zip(image_refs, results) if result != "both"
@@ -237,46 +237,6 @@ async def get_clip_low_quality_images(
     return low_quality_images, missing_keys
 
 
-@log_exception
-def resize_for_laplacian(image: np.ndarray, target_long_side: int = 300):
-    """
-    긴 변을 기준으로 이미지 크기를 축소하여 Laplacian 분석용으로 리사이즈합니다.
-
-    Args:
-        image (np.ndarray): Grayscale 이미지
-        target_long_side (int): 기준 긴 변 픽셀 수 (default: 300)
-
-    Returns:
-        np.ndarray: 리사이즈된 Grayscale 이미지
-    """
-    h, w = image.shape
-    scale = target_long_side / max(h, w)
-    new_size = (int(w * scale), int(h * scale))
-    resized = cv2.resize(image, new_size, interpolation=cv2.INTER_AREA)
-    return resized
-
-
-@log_exception
-def laplacian_filter(
-    image: np.ndarray,
-    threshold: float = 80.0,
-    target_long_side: int = 300,
-) -> bool:
-    """
-    Laplacian을 사용하여 이미지의 품질을 평가합니다.
-
-    Args:
-        image (np.ndarray): Grayscale 이미지
-        threshold (float): Laplacian 임계값 (default: 80.0)
-        target_long_side (int): 기준 긴 변 픽셀 수 (default: 300)
-
-    Returns:
-        bool: 품질이 낮으면 True, 그렇지 않으면 False
-    """
-    resized_image = resize_for_laplacian(image, target_long_side)
-    laplacian_var = cv2.Laplacian(resized_image, cv2.CV_64F).var()
-    return laplacian_var < threshold
-
 @log_exception
 async def get_laplacian_low_quality_images(image_refs: List[str], image_loader, threshold: float = 80.0) -> List[str]:
     """
@@ -290,7 +250,12 @@ async def get_laplacian_low_quality_images(image_refs: List[str], image_loader,
     Returns:
         List[str]: 저품질 이미지 파일명 목록
     """
-    images = await image_loader.load_images(image_refs, 'GRAY')
-    laplacian_low_quality_images = [image_ref for image_ref, image in zip(image_refs, images) if laplacian_filter(image, threshold)]
+    # 중복 검사와 공유하는 흑백 썸네일(축소 디코딩 후 긴 변 300px)로 pHash와 함께 계산
+    analysis = await analyze_album(image_refs, image_loader)
+    laplacian_low_quality_images = [
+        image_ref
+        for image_ref, laplacian_var in zip(image_refs, analysis.laplacian_vars)
+        if laplacian_var < threshold
+    ]
 
     return laplacian_low_quality_images
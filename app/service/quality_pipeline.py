@@ -4,6 +4,7 @@ import asyncio
 import logging
 from typing import Tuple
 
+from app.core.stage_timer import set_stage_size
 from app.service.quality import get_clip_low_quality_images, get_laplacian_low_quality_images
 from app.schemas.common.request import ImageRequest
 from app.schemas.models.quality import QualityResponse, QualityMultiResponseData
@@ -27,12 +28,15 @@ async def run_quality_pipeline(req: ImageRequest) -> Tuple[int, QualityResponse]
         image_loader = config.image_loader
         text_features = config.quality_text_features
         fields = config.quality_fields
+        set_stage_size(len(image_refs))
 
         laplacian_task = asyncio.create_task(
             get_laplacian_low_quality_images(image_refs, image_loader, THRESHOLD)
         )
         clip_task = asyncio.create_task(
-            get_clip_low_quality_images(image_refs, text_features, fields)
+            get_clip_low_quality_images(
+                image_refs, text_features, fields, getattr(req, "albumId", None)
+            )
         )
 
         await asyncio.wait([laplacian_task, clip_task], return_when=asyncio.FIRST_COMPLETED)
@@ -0,0 +1,74 @@
+"""
+Kafka 메시지와 HTTP 응답의 JSON 직렬화/역직렬화 모듈입니다.
+
+pydantic 모델은 pydantic-core의 JSON 직렬화기/검증기로 중간 dict 없이 바로
+bytes ↔ 모델로 변환하고, 그 외 값은 orjson(설치된 경우) 또는 표준 json으로 처리합니다.
+"""
+
+import json
+from typing import Any, TypeVar
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def json_dumps(value: Any) -> bytes:
+    """
+    pydantic 모델이 아닌 값을 JSON bytes로 직렬화합니다.
+
+    표준 json과 같이 dict의 int 키(예: albumId별 맵)는 문자열 키로 변환합니다.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(raw: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def encode_model(model: BaseModel) -> bytes:
+    """
+    pydantic 모델을 dict로 변환하지 않고 바로 JSON bytes로 직렬화합니다.
+    """
+    return model.__pydantic_serializer__.to_json(model)
+
+
+def decode_model(model_cls: type[ModelT], raw: bytes | str) -> ModelT:
+    """
+    JSON bytes를 파싱과 동시에 pydantic 모델로 검증합니다.
+    """
+    return model_cls.model_validate_json(raw)
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Kafka 프로듀서 value_serializer: 모델은 바로 직렬화하고, bytes는 그대로 전송합니다.
+    """
+    if isinstance(value, BaseModel):
+        return encode_model(value)
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    return json_dumps(value)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    pydantic 모델을 content로 바로 받을 수 있는 JSON 응답입니다. FastAPI 기본 응답 클래스로 사용합니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return encode_model(content)
+        return json_dumps(content)
@@ -0,0 +1,68 @@
+"""
+인코딩된 이미지 바이트를 numpy 배열로 디코딩하는 모듈입니다.
+
+JPEG는 DCT 단계에서 1/2·1/4·1/8로 축소 디코딩할 수 있으므로, 작은 크기만 필요한
+경로(썸네일 등)는 target_size를 지정해 전체 해상도를 디코딩하지 않습니다.
+"""
+
+import io
+from typing import Optional
+
+import cv2
+import numpy as np
+from PIL import Image
+
+# 축소 디코딩 플래그: (축소 비율, GRAY 플래그, COLOR 플래그), 큰 비율부터 시도
+_REDUCED_DECODE_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_GRAYSCALE_8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_GRAYSCALE_4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_GRAYSCALE_2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+
+def _decode_flags(image_bytes: bytes, scale: str, target_size: Optional[int]) -> int:
+    """
+    긴 변이 target_size 이상으로 유지되는 가장 큰 축소 비율의 imdecode 플래그를 선택합니다.
+
+    이미지 크기는 PIL로 헤더만 읽어서 확인합니다.
+    """
+    full = cv2.IMREAD_GRAYSCALE if scale == 'GRAY' else cv2.IMREAD_COLOR
+    if not target_size:
+        return full
+
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as header:
+            long_side = max(header.size)
+    except Exception:
+        return full
+
+    for factor, gray_flag, color_flag in _REDUCED_DECODE_FLAGS:
+        if long_side // factor >= target_size:
+            return gray_flag if scale == 'GRAY' else color_flag
+    return full
+
+
+# 공통 디코더
+def decode_image_cv2(
+    image_bytes: bytes, label: str, scale: str = 'RGB', target_size: Optional[int] = None
+) -> np.ndarray:
+    """
+    이미지 바이트를 디코딩합니다.
+
+    Args:
+        image_bytes (bytes): 인코딩된 이미지
+        label (str): 로더 구분용 라벨
+        scale (str): RGB / GRAY
+        target_size (int, optional): 필요한 최소 긴 변 픽셀 수. 지정하면 이 크기 이상을
+            유지하는 범위에서 축소 디코딩합니다. (원본 비율 유지, 정확한 크기는 보장하지 않음)
+
+    Returns:
+        np.ndarray: 디코딩된 이미지
+    """
+    nparr = np.frombuffer(image_bytes, np.uint8)
+    flags = _decode_flags(image_bytes, scale, target_size)
+    img = cv2.imdecode(nparr, flags)
+    if scale == 'RGB':
+        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+
+    return img
@@ -5,13 +5,12 @@ from concurrent.futures import ThreadPoolExecutor
 
 import aiofiles
 import aioboto3
-import cv2
-import numpy as np
 from dotenv import load_dotenv
 from botocore.config import Config
 from gcloud.aio.storage import Storage
 
 from app.config.settings import ImageMode
+from app.core.stage_timer import IMAGE_DOWNLOAD, stage_timer
 
 load_dotenv()
 
@@ -60,42 +59,44 @@ AWS_ACCESS_KEY_ID: str = AWS_ACCESS_KEY_ID_raw
 AWS_SECRET_ACCESS_KEY: str = AWS_SECRET_ACCESS_KEY_raw
 AWS_REGION: str = AWS_REGION_raw
 
-# 공통 디코더
-def decode_image_cv2(image_bytes: bytes, label: str, scale: str = 'RGB') -> np.ndarray:
-    nparr = np.frombuffer(image_bytes, np.uint8)
-    flags = cv2.IMREAD_GRAYSCALE if scale == 'GRAY' else cv2.IMREAD_COLOR
-    img = cv2.imdecode(nparr, flags)
-    if scale == 'RGB':
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-
-    return img
-
 class BaseImageLoader(ABC):
     """
     이미지 로더의 추상 베이스 클래스.
 
-    모든 이미지 로더는 `load_images` 메서드를 구현해야 합니다.
+    모든 이미지 로더는 단일 이미지를 내려받는 `_download` 메서드를 구현해야 합니다.
+    `download_images`는 배치 전체를 병렬로 내려받고 다운로드 시간을 배치 단위로 한 번 기록합니다.
+    디코딩은 호출하는 쪽에서 필요한 크기에 맞춰 합니다. (app.utils.image_decode)
     """
 
+    label = "base"
+
     @abstractmethod
-    async def load_images(self, filenames: list[str], scale: list[str]) -> list[bytes]:
+    async def _download(self, filename: str) -> bytes:
+        """
+        단일 이미지의 인코딩된 바이트를 가져옵니다.
+        """
+        pass
+
+    async def download_images(self, filenames: list[str]) -> list[bytes]:
         """
-        주어진 이미지 파일 이름 리스트에 대해 이미지를 로드합니다.
+        이미지들을 병렬로 내려받습니다. (디코딩하지 않음)
 
         Args:
-            filenames (list[str]): 로드할 이미지 파일 이름 목록
-            scale: RGB / GRAY
+            filenames (list[str]): 이미지 파일 이름 목록
 
         Returns:
-            list[bytes]: 로드된 이미지 바이트 리스트
+            list[bytes]: filenames 순서의 인코딩된 이미지 바이트 리스트
 
         """
-        pass
+        with stage_timer(IMAGE_DOWNLOAD):
+            return list(await asyncio.gather(*(self._download(name) for name in filenames)))
 
 
 class LocalImageLoader(BaseImageLoader):
     """로컬 파일 시스템에서 이미지를 로드하는 클래스입니다."""
 
+    label = "local"
+
     def __init__(self, image_dir: str = LOCAL_IMG_PATH):
         """
         Args:
@@ -104,36 +105,27 @@ class LocalImageLoader(BaseImageLoader):
         """
         self.image_dir = image_dir
 
-    async def _load_single_image(self, filename: str, scale: list[str] = 'RGB') -> np.ndarray:
-        file_path = os.path.join(self.image_dir, filename)
-
-        # 1. 파일 비동기 I/O로 읽기
-        async with aiofiles.open(file_path, mode="rb") as f:
-            image_bytes = await f.read()
-
-        # 2. 디코딩은 스레드에서 실행
-        loop = asyncio.get_running_loop()
-        decoded_img = await loop.run_in_executor(None, decode_image_cv2, image_bytes, "local", scale)
-        return decoded_img
-
-    async def load_images(self, filenames: list[str], scale: list[str] = 'RGB') -> list[np.ndarray]:
+    async def _download(self, filename: str) -> bytes:
         """
-        비동기적으로 로컬 이미지들을 로드합니다.
+        로컬 파일을 비동기 I/O로 읽습니다.
 
         Args:
-            filenames (list[str]): 이미지 파일 이름 리스트
+            filename (str): 이미지 파일 이름
 
         Returns:
-            list[np.ndarray]: 로드된 이미지 리스트
+            bytes: 로드된 이미지 바이트
 
         """
-        tasks = [self._load_single_image(name, scale) for name in filenames]
-        return await asyncio.gather(*tasks)
+        file_path = os.path.join(self.image_dir, filename)
+        async with aiofiles.open(file_path, mode="rb") as f:
+            return await f.read()
 
 
 class GCSImageLoader(BaseImageLoader):
     """Google Cloud Storage(GCS)에서 이미지를 로드하는 클래스입니다."""
 
+    label = "gcs"
+
     def __init__(
         self, bucket_name: str = GCS_BUCKET_NAME, gcp_key: str = GCP_KEY
     ):
@@ -168,36 +160,12 @@ class GCSImageLoader(BaseImageLoader):
         )
         return image_bytes
 
-    async def _process_single_file(
-        self, filename: str, executor=None, scale: list[str]='RGB'
-    ) -> np.ndarray:
-        loop = asyncio.get_running_loop()
-        image_bytes = await self._download(filename)
-        decoded_img = await loop.run_in_executor(
-            executor, decode_image_cv2, image_bytes, "gcs", scale
-        )
-        return decoded_img
-
-    async def load_images(self, filenames: list[str], scale: list[str] = 'RGB') -> list[np.ndarray]:
-        """
-        비동기적으로 GCS에서 이미지를 병렬로 다운로드합니다.
-
-        Args:
-            filenames (list[str]): GCS 상의 이미지 파일 이름 리스트
-
-        Returns:
-            list[np.ndarray]: 로드된 이미지 리스트
-
-        """
-        #start = time.time()
-        tasks = [self._process_single_file(f, None, scale) for f in filenames]
-
-        result = await asyncio.gather(*tasks)
-        return result
 
 class S3ImageLoader(BaseImageLoader):
     """Amazon S3에서 이미지를 로드하는 클래스입니다."""
 
+    label = "s3"
+
     def __init__(
         self,
         bucket_name: str = S3_BUCKET_NAME,
@@ -253,29 +221,6 @@ class S3ImageLoader(BaseImageLoader):
         image_bytes = await response["Body"].read()
 
         return image_bytes
-    
-    async def _process_single_file(self, filename: str, scale: list[str] = 'RGB') -> np.ndarray:
-        loop = asyncio.get_running_loop()
-        image_bytes = await self._download(filename)
-        decoded = await loop.run_in_executor(
-            None, decode_image_cv2, image_bytes, "s3", scale
-        )
-        return decoded
-
-    async def load_images(self, filenames: list[str], scale: list[str] = 'RGB') -> list[np.ndarray]:
-        """
-        비동기적으로 S3에서 이미지를 병렬로 다운로드합니다.
-
-        Args:
-            filenames (list[str]): S3 내 이미지 파일 이름 리스트
-
-        Returns:
-            list[np.ndarray]: 로드된 이미지 바이트 리스트
-
-        """
-        tasks = [self._process_single_file(f, scale) for f in filenames]
-        result = await asyncio.gather(*tasks)
-        return result
 
 
 def get_image_loader(mode: ImageMode) -> BaseImageLoader:
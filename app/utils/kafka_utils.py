@@ -1,60 +1,490 @@
-import json
-from typing import Callable, Any
-from aiokafka import AIOKafkaConsumer
-from app.config.kafka_config import KAFKA_RESPONSE_TOPIC_MAP
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Any, Optional, TypeVar
+from aiokafka import AIOKafkaConsumer, ConsumerRebalanceListener
+from app.config.kafka_config import (
+    KAFKA_HANDLER_CONCURRENCY_MAP, KAFKA_MAX_INFLIGHT_MESSAGES, KAFKA_MAX_POLL_RECORDS,
+    KAFKA_MIN_POLL_RECORDS, KAFKA_POLL_TIMEOUT_MAX_MS, KAFKA_POLL_TIMEOUT_MIN_MS,
+    KAFKA_RESPONSE_TOPIC_MAP, KAFKA_RETRY_BACKOFF_MAX_MS, KAFKA_RETRY_BACKOFF_MIN_MS,
+    KAFKA_REVOKE_DRAIN_SECONDS, KAFKA_TARGET_BATCH_SECONDS,
+)
+from app.core.metrics import KAFKA_INFLIGHT_MESSAGES, KAFKA_PAUSED_PARTITIONS, KAFKA_POLL_MAX_RECORDS
+from app.core.stage_timer import KAFKA_PRODUCE, set_stage_source, stage_timer
+from app.schemas.common.response import BaseResponse
+from app.schemas.kafka.base import KafkaResponseWrapper
+from app.utils.codec import decode_model, json_loads
+from app.utils.status_message import get_message_by_status
 
-def create_kafka_consumer(topics: list[str], group_id: str, bootstrap_servers: str) -> AIOKafkaConsumer:
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+def create_kafka_consumer(group_id: str, bootstrap_servers: str) -> AIOKafkaConsumer:
+    """
+    수동 커밋 컨슈머를 생성합니다. 토픽은 리밸런스 리스너와 함께 `subscribe`로 구독합니다.
+    """
     return AIOKafkaConsumer(
-        *topics,
         bootstrap_servers=bootstrap_servers,
         group_id=group_id,
         enable_auto_commit=False,
         auto_offset_reset="earliest",
-        value_deserializer=lambda v: json.loads(v.decode("utf-8")),
+        # value는 bytes 그대로 받아 process_partition_batch에서 모델로 바로 검증
         isolation_level="read_committed",
-        max_poll_records=100
+        max_poll_records=KAFKA_MAX_POLL_RECORDS
+    )
+
+class SkippedMessageError(Exception):
+    """
+    같은 키의 앞선 메시지가 실패해 처리하지 않은 메시지를 나타냅니다.
+    """
+
+
+class KeyOrderedExecutor:
+    """
+    같은 키의 메시지는 순서대로, 다른 키의 메시지는 최대 concurrency개까지 동시에 처리하는 실행기입니다.
+
+    같은 앨범에 대한 요청이 뒤바뀌지 않도록 키별로 앞선 메시지가 끝난 뒤 다음 메시지를
+    시작합니다. 앞선 메시지가 실패하면 같은 키의 뒤 메시지는 처리하지 않습니다(재전달 대상).
+    처리가 끝날 때마다 앞에서부터 연속으로 성공한 메시지까지의 다음 오프셋을
+    `committed_offset`으로 갱신하므로, 트랜잭션에는 완전히 끝난 메시지의 오프셋만 커밋됩니다.
+    """
+
+    def __init__(self, concurrency: int, semaphore: Optional[asyncio.Semaphore] = None) -> None:
+        """
+        Args:
+            concurrency: 동시에 처리할 최대 메시지 수 (1이면 순차 처리)
+            semaphore: 여러 배치가 공유하는 동시 처리 한도 (있으면 concurrency 대신 사용)
+
+        """
+        self.concurrency = max(1, concurrency)
+        self.semaphore = semaphore
+        self.committed_offset: Optional[int] = None
+        self._offsets: list[int] = []
+        self._succeeded: dict[int, bool] = {}
+        self._cursor = 0
+
+    async def run(
+        self,
+        records: list[Any],
+        items: list[T],
+        keys: list[Optional[str]],
+        func: Callable[[T], Awaitable[R]],
+    ) -> list[R | BaseException]:
+        """
+        메시지를 처리하고 입력 순서대로 결과(실패 시 예외)를 반환합니다.
+
+        Args:
+            records: Kafka 레코드 목록 (오프셋 추적용)
+            items: 레코드별 처리 대상
+            keys: 레코드별 순서 보장 키 (None이면 순서를 보장하지 않음)
+            func: 처리 함수
+
+        Returns:
+            list[R | BaseException]: 처리 결과 또는 예외
+
+        """
+        semaphore = self.semaphore or asyncio.Semaphore(self.concurrency)
+        self._offsets = [record.offset for record in records]
+        self._succeeded = {}
+        self._cursor = 0
+        self.committed_offset = self._offsets[0] if self._offsets else None
+
+        tails: dict[str, asyncio.Task] = {}
+        tasks: list[asyncio.Task] = []
+        for offset, item, key in zip(self._offsets, items, keys):
+            previous = tails.get(key) if key is not None else None
+            task = asyncio.create_task(self._run_one(offset, item, func, previous, semaphore))
+            if key is not None:
+                tails[key] = task
+            tasks.append(task)
+
+        return list(await asyncio.gather(*tasks, return_exceptions=True))
+
+    async def _run_one(
+        self,
+        offset: int,
+        item: T,
+        func: Callable[[T], Awaitable[R]],
+        previous: Optional[asyncio.Task],
+        semaphore: asyncio.Semaphore,
+    ) -> R:
+        try:
+            if previous is not None:
+                try:
+                    await previous
+                except BaseException:
+                    raise SkippedMessageError(f"offset={offset}: 같은 키의 앞선 메시지 실패")
+
+            async with semaphore:
+                result = await func(item)
+        except BaseException:
+            self._mark_done(offset, succeeded=False)
+            raise
+
+        self._mark_done(offset, succeeded=True)
+        return result
+
+    def _mark_done(self, offset: int, succeeded: bool) -> None:
+        self._succeeded[offset] = succeeded
+        while self._cursor < len(self._offsets):
+            if not self._succeeded.get(self._offsets[self._cursor], False):
+                break
+            self._cursor += 1
+            self.committed_offset = self._offsets[self._cursor - 1] + 1
+
+    @property
+    def completed_count(self) -> int:
+        """
+        앞에서부터 연속으로 성공한 메시지 수
+        """
+        return self._cursor
+
+
+def _decode_request(model_cls: Any, record: Any) -> Optional[Any]:
+    """
+    레코드 값을 요청 모델로 검증합니다. 잘못된 메시지면 None을 반환합니다.
+    """
+    try:
+        return decode_model(model_cls, record.value)
+    except Exception as e:
+        logger.warning(f"[INVALID] {record.topic} offset={record.offset} 메시지 검증 실패: {e}")
+        return None
+
+
+def _invalid_request_response(record: Any) -> KafkaResponseWrapper[BaseResponse]:
+    """
+    검증에 실패한 메시지에 대한 400 응답을 만듭니다. (다시 읽지 않고 커밋해 파티션이 막히지 않게 함)
+    """
+    try:
+        payload = json_loads(record.value)
+    except Exception:
+        payload = None
+    if not isinstance(payload, dict):
+        payload = {}
+
+    task_id = payload.get("taskId")
+    album_id = payload.get("albumId")
+    status_code = 400
+    return KafkaResponseWrapper[BaseResponse](
+        taskId=task_id if isinstance(task_id, str) and task_id else "unknown",
+        albumId=album_id if isinstance(album_id, int) and not isinstance(album_id, bool) else -1,
+        statusCode=status_code,
+        body=BaseResponse(message=get_message_by_status(status_code), data=None),
     )
 
-async def process_partition_batch(tp, batch, producer, handler_map: dict, model_map: dict, group_id: str):
+
+def _ordering_key(record: Any, message: Any) -> Optional[str]:
+    if record.key:
+        return record.key.decode()
+    album_id = getattr(message, "albumId", None)
+    return f"album:{album_id}" if album_id is not None else None
+
+
+async def process_partition_batch(
+    tp, batch, producer_pool, handler_map: dict, model_map: dict, group_id: str,
+    topic_semaphores: Optional[dict[str, asyncio.Semaphore]] = None,
+) -> Optional[int]:
+    """
+    파티션 배치를 처리하고 응답과 오프셋을 하나의 트랜잭션으로 커밋합니다.
+
+    트랜잭션 프로듀서는 핸들러 처리가 끝난 뒤 커밋하는 동안에만 producer_pool에서 빌립니다.
+    topic_semaphores가 있으면 같은 토픽의 여러 파티션 배치가 토픽별 동시 처리 한도를 공유합니다.
+
+    Returns:
+        Optional[int]: 다음에 읽어야 할 오프셋 (배치 전체를 커밋했으면 마지막 오프셋 + 1,
+            핸들러/모델이 없으면 None)
+
+    """
     topic = tp.topic
     handler: Callable = handler_map.get(topic)
     model_cls: Any = model_map.get(topic)
     if not handler or not model_cls:
         print(f"[{topic}] 핸들러 또는 모델 없음")
-        return
+        return None
 
-    data_batch = [model_cls(**msg.value) for msg in batch]
     keys = [msg.key.decode() if msg.key else None for msg in batch]
     response_topic = KAFKA_RESPONSE_TOPIC_MAP[topic]
 
-    txn_started = False
+    # 배치 처리 태스크의 컨텍스트에 설정하면 메시지별 핸들러 태스크에 복사됨
+    set_stage_source(topic)
+
+    async def handle(item: tuple[Any, Optional[Any]]) -> Any:
+        record, message = item
+        if message is None:
+            return _invalid_request_response(record)
+        return await handler(message)
+
     try:
-        result_list = await handler(data_batch)
+        # 검증에 실패한 메시지는 400 응답으로 처리해 다른 메시지와 함께 커밋
+        data_batch = [(msg, _decode_request(model_cls, msg)) for msg in batch]
+
+        # 같은 키(앨범)는 순서대로, 다른 키는 동시에 처리 (응답 순서는 요청 순서와 동일)
+        executor = KeyOrderedExecutor(
+            KAFKA_HANDLER_CONCURRENCY_MAP.get(topic, 1),
+            (topic_semaphores or {}).get(topic),
+        )
+        outcomes = await executor.run(
+            batch,
+            data_batch,
+            [_ordering_key(msg, data) for msg, data in data_batch],
+            handle,
+        )
+
+        completed = executor.completed_count
+        result_list = outcomes[:completed]
+        failed = [
+            (msg.offset, outcome) for msg, outcome in zip(batch, outcomes)
+            if isinstance(outcome, BaseException)
+        ]
+        if failed:
+            logger.warning(
+                f"[{topic}] 처리 실패 메시지 {len(failed)}개, "
+                f"오프셋 {executor.committed_offset}부터 재처리: {failed[:5]}"
+            )
 
         # 로깅
         request_count = len(batch)
         response_count = len(result_list)
         print(f"[{topic}] ✅ 요청 메시지 수: {request_count}, 응답 메시지 수: {response_count}")
 
-        if request_count != response_count:
-            print(f"[{topic}] ⚠️ 요청과 응답 메시지 수가 다릅니다! (요청={request_count}, 응답={response_count})")
+        if completed == 0:
+            return batch[0].offset
 
+        with stage_timer(KAFKA_PRODUCE):
+            async with producer_pool.acquire() as producer:
+                txn_started = False
+                try:
+                    await producer.begin_transaction()
+                    txn_started = True
 
-        await producer.begin_transaction()
-        txn_started = True
-
-        for result, key in zip(result_list, keys):
-            await producer.send(
-                topic=response_topic,
-                key=key.encode() if key else None,
-                value=result.dict()
-            )
+                    for result, key in zip(result_list, keys):
+                        await producer.send(
+                            topic=response_topic,
+                            key=key.encode() if key else None,
+                            value=result
+                        )
 
-        offsets = {tp: batch[-1].offset + 1}
-        await producer.send_offsets_to_transaction(offsets, group_id)
-        await producer.commit_transaction()
+                    # 연속으로 끝난 메시지까지만 커밋
+                    offsets = {tp: executor.committed_offset}
+                    await producer.send_offsets_to_transaction(offsets, group_id)
+                    await producer.commit_transaction()
+                except BaseException:
+                    # 리밸런스로 취소된 경우에도 열린 트랜잭션을 중단
+                    if txn_started:
+                        await producer.abort_transaction()
+                    raise
+        return executor.committed_offset
 
     except Exception as e:
-        if txn_started:
-            await producer.abort_transaction()
-        print(f"[{topic}] ❌ 트랜잭션 처리 중 에러: {e}")
\ No newline at end of file
+        print(f"[{topic}] ❌ 트랜잭션 처리 중 에러: {e}")
+        return batch[0].offset
+
+
+class _RevokeListener(ConsumerRebalanceListener):
+    """
+    파티션 회수 시 AdaptivePoller의 처리 중인 배치를 정리하는 리밸런스 리스너입니다.
+    """
+
+    def __init__(self, poller: "AdaptivePoller") -> None:
+        self.poller = poller
+
+    async def on_partitions_revoked(self, revoked) -> None:
+        await self.poller.on_partitions_revoked(revoked)
+
+    async def on_partitions_assigned(self, assigned) -> None:
+        pass
+
+
+class AdaptivePoller:
+    """
+    파티션 배치를 백그라운드로 처리하면서 폴링을 계속하는 적응형 폴링 루프입니다.
+
+    - 처리 중인 배치가 있는 파티션은 pause해 같은 파티션의 다음 배치가 앞서지 않게 하고,
+      처리가 끝나면 (필요하면 커밋하지 못한 오프셋으로 seek한 뒤) resume합니다.
+      커밋하지 못한 메시지를 다시 읽을 때는 연속 실패 횟수에 따라 지수적으로 늘어나는
+      시간(`KAFKA_RETRY_BACKOFF_MIN_MS` ~ `KAFKA_RETRY_BACKOFF_MAX_MS`) 동안 파티션을 쉬게 합니다.
+    - 리밸런스로 파티션을 회수당하면 `rebalance_listener`가 해당 파티션의 처리 중인 배치를
+      최대 `KAFKA_REVOKE_DRAIN_SECONDS`초 기다린 뒤 취소하고 재시도 상태를 버리므로,
+      더 이상 담당하지 않는 파티션의 오프셋을 커밋하지 않습니다. 컨슈머는
+      `consumer.subscribe(topics, listener=poller.rebalance_listener)`로 구독해야 합니다.
+    - 처리 중인 메시지가 `max_inflight_messages`에 도달하면 모든 파티션을 pause한 채
+      폴링만 계속해 컨슈머 그룹에서 빠지지 않으면서 메모리 사용을 제한합니다.
+    - 토픽별 메시지당 처리 시간의 EWMA로 한 번에 가져올 레코드 수를 정해 배치 하나가
+      `target_batch_seconds` 안에 끝나도록 하고, 가져올 메시지가 없으면 폴링 타임아웃을 늘립니다.
+    """
+
+    EWMA_ALPHA = 0.2
+
+    def __init__(
+        self,
+        consumer: AIOKafkaConsumer,
+        process: Callable[[Any, list], Awaitable[Optional[int]]],
+        group_id: str,
+        max_inflight_messages: int = KAFKA_MAX_INFLIGHT_MESSAGES,
+        target_batch_seconds: float = KAFKA_TARGET_BATCH_SECONDS,
+        revoke_drain_seconds: float = KAFKA_REVOKE_DRAIN_SECONDS,
+    ) -> None:
+        """
+        Args:
+            consumer: Kafka 컨슈머 (run 전에 시작)
+            process: 파티션 배치 처리 함수 (다음에 읽을 오프셋 반환)
+            group_id: 컨슈머 그룹 (메트릭 라벨)
+            max_inflight_messages: 동시에 처리 중일 수 있는 최대 메시지 수
+            target_batch_seconds: 배치 하나의 목표 처리 시간(초)
+            revoke_drain_seconds: 파티션 회수 시 처리 중인 배치를 기다리는 최대 시간(초)
+
+        """
+        self.consumer = consumer
+        self.process = process
+        self.group_id = group_id
+        self.max_inflight_messages = max_inflight_messages
+        self.target_batch_seconds = target_batch_seconds
+        self.revoke_drain_seconds = revoke_drain_seconds
+        self.rebalance_listener = _RevokeListener(self)
+        self._inflight: dict[Any, asyncio.Task] = {}
+        self._retry_failures: dict[Any, int] = {}
+        self._retry_after: dict[Any, float] = {}
+        self._inflight_messages = 0
+        self._per_message_seconds: dict[str, float] = {}
+        self._timeout_ms = KAFKA_POLL_TIMEOUT_MIN_MS
+        self._drained = asyncio.Event()
+
+    async def run(self) -> None:
+        try:
+            while True:
+                self._apply_backpressure()
+                max_records = self._max_records()
+                messages = await self.consumer.getmany(
+                    timeout_ms=self._timeout_ms, max_records=max_records
+                )
+
+                batches = [(tp, batch) for tp, batch in messages.items() if batch]
+                if batches:
+                    logger.debug(f"[Kafka] getmany 결과: {[(tp.topic, len(batch)) for tp, batch in batches]}")
+                    self._timeout_ms = KAFKA_POLL_TIMEOUT_MIN_MS
+                elif not self._inflight:
+                    # 유휴 상태: 폴링 간격을 늘려 불필요한 요청을 줄임
+                    self._timeout_ms = min(self._timeout_ms * 2, KAFKA_POLL_TIMEOUT_MAX_MS)
+
+                for tp, batch in batches:
+                    self._dispatch(tp, batch)
+
+                if self._inflight_messages >= self.max_inflight_messages:
+                    # 포화 상태: 처리 중인 배치가 하나 끝날 때까지 대기 (최대 폴링 타임아웃)
+                    self._drained.clear()
+                    try:
+                        await asyncio.wait_for(
+                            self._drained.wait(), KAFKA_POLL_TIMEOUT_MAX_MS / 1000
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            tasks = list(self._inflight.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _dispatch(self, tp: Any, batch: list) -> None:
+        self.consumer.pause(tp)
+        self._inflight_messages += len(batch)
+        KAFKA_INFLIGHT_MESSAGES.labels(self.group_id).set(self._inflight_messages)
+
+        started_at = time.perf_counter()
+        task = asyncio.create_task(self.process(tp, batch))
+        task.add_done_callback(lambda t: self._on_done(tp, batch, started_at, t))
+        self._inflight[tp] = task
+
+    def _on_done(self, tp: Any, batch: list, started_at: float, task: asyncio.Task) -> None:
+        self._inflight.pop(tp, None)
+        self._inflight_messages -= len(batch)
+        KAFKA_INFLIGHT_MESSAGES.labels(self.group_id).set(self._inflight_messages)
+        self._drained.set()
+
+        if task.cancelled():
+            return
+
+        elapsed = time.perf_counter() - started_at
+        previous = self._per_message_seconds.get(tp.topic)
+        sample = elapsed / len(batch)
+        self._per_message_seconds[tp.topic] = (
+            sample if previous is None
+            else self.EWMA_ALPHA * sample + (1 - self.EWMA_ALPHA) * previous
+        )
+
+        next_offset = batch[0].offset if task.exception() is not None else task.result()
+        if next_offset is None or next_offset > batch[-1].offset:
+            self._retry_failures.pop(tp, None)
+            return
+        if tp not in self.consumer.assignment():
+            # 리밸런스로 파티션을 잃었으면 새 담당 컨슈머가 커밋된 오프셋부터 읽음
+            return
+
+        # 커밋하지 못한 메시지부터 다시 읽되, 바로 다시 실패하지 않도록 잠시 쉬었다가 resume
+        failures = self._retry_failures.get(tp, 0) + 1 if next_offset == batch[0].offset else 1
+        self._retry_failures[tp] = failures
+        delay_ms = min(KAFKA_RETRY_BACKOFF_MIN_MS * 2 ** (failures - 1), KAFKA_RETRY_BACKOFF_MAX_MS)
+        self._retry_after[tp] = time.monotonic() + delay_ms / 1000
+        logger.warning(
+            f"[Kafka] {tp.topic}-{tp.partition} 오프셋 {next_offset}부터 {delay_ms}ms 후 재처리 "
+            f"(연속 실패 {failures}회)"
+        )
+        self.consumer.seek(tp, next_offset)
+
+    async def on_partitions_revoked(self, revoked) -> None:
+        """
+        회수되는 파티션의 처리 중인 배치를 기다리거나 취소하고 재시도 상태를 버립니다.
+
+        리밸런스는 이 메서드가 끝난 뒤에 진행되므로, 여기서 끝난 배치의 커밋은 아직
+        파티션을 담당하는 동안 이루어집니다.
+        """
+        revoked = set(revoked)
+        tasks = [task for tp, task in self._inflight.items() if tp in revoked]
+        if tasks:
+            logger.info(f"[Kafka] 파티션 회수: 처리 중인 배치 {len(tasks)}개 정리")
+            _, pending = await asyncio.wait(tasks, timeout=self.revoke_drain_seconds)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for tp in revoked:
+            self._retry_failures.pop(tp, None)
+            self._retry_after.pop(tp, None)
+
+    def _apply_backpressure(self) -> None:
+        assigned = self.consumer.assignment()
+        now = time.monotonic()
+        for tp in [tp for tp, until in self._retry_after.items() if until <= now]:
+            del self._retry_after[tp]
+
+        if self._inflight_messages >= self.max_inflight_messages:
+            want_paused = set(assigned)
+        else:
+            want_paused = (set(self._inflight) | set(self._retry_after)) & assigned
+
+        paused = self.consumer.paused()
+        to_pause = want_paused - paused
+        to_resume = (paused - want_paused) & assigned
+        if to_pause:
+            self.consumer.pause(*to_pause)
+        if to_resume:
+            self.consumer.resume(*to_resume)
+
+        KAFKA_PAUSED_PARTITIONS.labels(self.group_id).set(len(want_paused))
+
+    def _max_records(self) -> int:
+        topics = {tp.topic for tp in self.consumer.assignment()}
+        slowest = max(
+            (self._per_message_seconds.get(topic, 0.0) for topic in topics), default=0.0
+        )
+        if slowest <= 0:
+            max_records = KAFKA_MAX_POLL_RECORDS
+        else:
+            max_records = int(self.target_batch_seconds / slowest)
+
+        # 남은 처리 여유보다 많이 가져오지 않음
+        capacity = max(self.max_inflight_messages - self._inflight_messages, KAFKA_MIN_POLL_RECORDS)
+        max_records = max(KAFKA_MIN_POLL_RECORDS, min(max_records, KAFKA_MAX_POLL_RECORDS, capacity))
+        KAFKA_POLL_MAX_RECORDS.labels(self.group_id).set(max_records)
+        return max_records
@@ -1,13 +1,24 @@
 import asyncio
+import logging
+import os
+import random
+import threading
+import time
 from collections.abc import Callable
 from functools import wraps
-from typing import ParamSpec, TypeVar
+from typing import Optional, ParamSpec, TypeVar
 
+from dotenv import load_dotenv
 from loguru import logger
 
+load_dotenv()
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# 호출 로그를 남길 비율 (0이면 집계만 하고 호출 로그는 남기지 않음)
+TRACE_FLOW_SAMPLE_RATE = float(os.getenv("TRACE_FLOW_SAMPLE_RATE", "0"))
+
 
 def log_exception(func: Callable[P, R]) -> Callable[P, R]:
     """예외 발생 시 자동으로 로깅하는 데코레이터"""
@@ -69,3 +80,115 @@ def log_flow(func: Callable[P, R]) -> Callable[P, R]:
             raise
 
     return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper  # type: ignore
+
+
+class FlowStat:
+    """
+    trace_flow로 감싼 함수 하나의 호출 수·실패 수·누적/최대 처리 시간입니다.
+    executor 스레드에서도 호출되므로 갱신은 락으로 보호합니다.
+    """
+
+    __slots__ = ("calls", "errors", "total_seconds", "max_seconds", "_lock")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, elapsed: float, failed: bool) -> None:
+        with self._lock:
+            self.calls += 1
+            self.total_seconds += elapsed
+            if elapsed > self.max_seconds:
+                self.max_seconds = elapsed
+            if failed:
+                self.errors += 1
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "total_seconds": self.total_seconds,
+                "max_seconds": self.max_seconds,
+            }
+
+
+_flow_stats: dict[str, FlowStat] = {}
+
+
+def get_flow_stats() -> dict[str, dict[str, float]]:
+    """
+    trace_flow로 집계한 함수별 호출 통계를 반환합니다.
+
+    Returns:
+        dict[str, dict[str, float]]: {함수 경로: {calls, errors, total_seconds, max_seconds}}
+    """
+    return {name: stat.snapshot() for name, stat in list(_flow_stats.items())}
+
+
+def trace_flow(
+    func: Optional[Callable[P, R]] = None, *, sample_rate: Optional[float] = None
+) -> Callable[P, R]:
+    """
+    자주 호출되는 함수용 저비용 플로우 추적 데코레이터
+
+    함수가 속한 모듈의 로거에 DEBUG가 켜져 있지 않으면 원래 함수를 바로 호출합니다.
+    켜져 있으면 호출마다 로그를 남기는 대신 호출 수와 처리 시간을 메모리에 집계하고
+    (get_flow_stats, /metrics의 flow_* 메트릭으로 조회), sample_rate 비율의 호출만
+    DEBUG 로그를 남깁니다. 레벨은 호출 시점에 확인하므로 로깅 설정 순서와 무관합니다.
+    예외는 집계만 하므로, 예외 로그가 필요한 함수는 log_exception과 함께 사용합니다.
+
+    Args:
+        func: 감쌀 함수 (`@trace_flow`와 `@trace_flow(sample_rate=...)` 모두 지원)
+        sample_rate: 호출 로그 샘플링 비율 (기본값: TRACE_FLOW_SAMPLE_RATE)
+
+    """
+    rate = TRACE_FLOW_SAMPLE_RATE if sample_rate is None else sample_rate
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        flow_logger = logging.getLogger(func.__module__)
+        name = f"{func.__module__}.{func.__qualname__}"
+        stat = _flow_stats.setdefault(name, FlowStat())
+
+        def finish(started_at: float, failed: bool) -> None:
+            elapsed = time.perf_counter() - started_at
+            stat.record(elapsed, failed)
+            if not failed and rate and random.random() < rate:
+                flow_logger.debug(f"{func.__name__} 함수 성공 ({elapsed * 1000:.2f}ms)")
+
+        @wraps(func)
+        def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not flow_logger.isEnabledFor(logging.DEBUG):
+                return func(*args, **kwargs)
+
+            started_at = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                finish(started_at, True)
+                raise
+            finish(started_at, False)
+            return result
+
+        @wraps(func)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not flow_logger.isEnabledFor(logging.DEBUG):
+                return await func(*args, **kwargs)  # type: ignore
+
+            started_at = time.perf_counter()
+            try:
+                result = await func(*args, **kwargs)  # type: ignore
+            except Exception:
+                finish(started_at, True)
+                raise
+            finish(started_at, False)
+            return result  # type: ignore
+
+        return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper  # type: ignore
+
+    if func is not None:
+        return decorator(func)
+    return decorator  # type: ignore
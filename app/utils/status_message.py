@@ -3,7 +3,8 @@ _STATUS_MESSAGES = {
     400: "invalid_request",
     403: "unauthorized_server",
     428: "embedding_required",
-    500: "internal_server_error"
+    500: "internal_server_error",
+    503: "gpu_server_unavailable"
 }
 
 def get_message_by_status(status_code: int) -> str:
@@ -15,6 +15,9 @@ timeout = 0
 keepalive = 10
 
 
+# 워커 간 임베딩 공유 캐시는 SHARED_EMBEDDING_CACHE_PATH(예: /dev/shm/ongi-embeddings)로 활성화
+# (app/core/shared_cache.py 참고)
+
 # preload로 COW 기반 메모리 최적화
 preload_app = True
 
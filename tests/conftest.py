@@ -0,0 +1,60 @@
+import asyncio
+import os
+
+import httpx
+import pytest
+
+# 모듈 import 시 검사하는 Redis 환경 변수 (테스트는 실제 Redis에 연결하지 않음)
+os.environ.setdefault("REDIS_HOST", "localhost")
+os.environ.setdefault("REDIS_PORT", "6379")
+os.environ.setdefault("REDIS_DB", "0")
+
+
+class FakeGpuServer:
+    """
+    httpx MockTransport로 동작하는 GPU 서버 대역입니다.
+
+    테스트마다 `handler`(request → Response 코루틴)를 바꿔 지연, 5xx, 끊긴 스트림 등을 흉내 냅니다.
+    """
+
+    def __init__(self) -> None:
+        self.handler = self.ok
+        self.requests: list[httpx.Request] = []
+        self.active = 0
+        self.max_active = 0
+        self.transport = httpx.MockTransport(self._handle)
+
+    @staticmethod
+    async def ok(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True})
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            return await self.handler(request)
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def fake_gpu_server() -> FakeGpuServer:
+    return FakeGpuServer()
+
+
+@pytest.fixture
+async def gpu_client(fake_gpu_server):
+    from app.core.gpu_client import GpuClient
+
+    client = GpuClient("http://gpu", http2=False, transport=fake_gpu_server.transport)
+    yield client
+    await client.aclose()
+
+
+async def wait_until(predicate, timeout: float = 1.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("조건을 만족하지 못했습니다.")
+        await asyncio.sleep(0.001)
@@ -0,0 +1,105 @@
+"""
+썸네일 경로(축소 디코딩 → INTER_AREA 300px)의 보정 테스트입니다.
+
+1/f 스펙트럼(자연 이미지와 같은 통계)을 가진 합성 사진으로, 축소 디코딩이 원본 해상도
+디코딩 대비 Laplacian 임계값(80.0) 판정을 바꾸지 않는지와, 썸네일 pHash에서도
+DUPLICATE_EPS가 같은 사진의 변형과 다른 사진을 구분하는지 확인합니다.
+"""
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from app.core.thumbnail_cache import THUMBNAIL_DECODE_MIN_SIDE, THUMBNAIL_LONG_SIDE
+from app.service.album_analysis import _decode_thumbnail, analyze_thumbnails, make_thumbnail
+from app.service.duplicate_pipeline import DUPLICATE_EPS
+from app.utils.image_decode import decode_image_cv2
+
+LAPLACIAN_THRESHOLD = 80.0
+
+
+def natural_image(h: int, w: int, beta: float, blur: float, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    fy = np.fft.fftfreq(h)[:, None]
+    fx = np.fft.rfftfreq(w)[None, :]
+    freq = np.sqrt(fx**2 + fy**2)
+    freq[0, 0] = 1.0
+    spectrum = (rng.normal(size=freq.shape) + 1j * rng.normal(size=freq.shape)) / freq ** (beta / 2)
+    image = np.fft.irfft2(spectrum, s=(h, w))
+    image = np.clip((image - image.mean()) / image.std() * 50 + 128, 0, 255).astype(np.uint8)
+    if blur:
+        image = cv2.GaussianBlur(image, (0, 0), blur)
+    return image
+
+
+def encode(image: np.ndarray, quality: int = 90) -> bytes:
+    return cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])[1].tobytes()
+
+
+def full_thumbnail(image_bytes: bytes) -> np.ndarray:
+    return make_thumbnail(decode_image_cv2(image_bytes, "test", "GRAY"))
+
+
+def laplacian_var(thumbnail: np.ndarray) -> float:
+    return analyze_thumbnails([thumbnail])[1][0]
+
+
+def phash(thumbnail: np.ndarray) -> int:
+    return int(analyze_thumbnails([thumbnail])[0][0])
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def test_thumbnail_decode_is_reduced():
+    image_bytes = encode(natural_image(3000, 4000, 2.0, 0, 0))
+
+    decoded = decode_image_cv2(image_bytes, "test", "GRAY", target_size=THUMBNAIL_DECODE_MIN_SIDE)
+
+    assert THUMBNAIL_DECODE_MIN_SIDE <= max(decoded.shape) < 4000
+    assert max(_decode_thumbnail(image_bytes).shape) == THUMBNAIL_LONG_SIDE
+
+
+@pytest.mark.parametrize("size", [(2400, 3200), (1080, 1920), (900, 1200)])
+def test_reduced_decode_keeps_laplacian_threshold(size):
+    h, w = size
+    compared = 0
+    for beta in (1.6, 2.4):
+        for blur in (4, 8, 16):
+            image_bytes = encode(natural_image(h, w, beta, blur * max(h, w) / 4000, seed=int(beta * 10)))
+            full = laplacian_var(full_thumbnail(image_bytes))
+            reduced = laplacian_var(_decode_thumbnail(image_bytes))
+
+            if 20 < full < 400:
+                compared += 1
+                assert 0.9 <= reduced / full <= 1.05
+            assert (full < LAPLACIAN_THRESHOLD) == (reduced < LAPLACIAN_THRESHOLD)
+
+    assert compared > 0
+
+
+def test_phash_eps_separates_variants_from_distinct_images():
+    originals, variant_distances = [], []
+    for seed, (h, w) in enumerate([(1500, 2000), (1080, 1920), (2400, 3200)]):
+        for beta in (1.8, 2.4):
+            image = natural_image(h, w, beta, 0, seed * 10 + int(beta * 10))
+            base = phash(_decode_thumbnail(encode(image)))
+            originals.append(base)
+
+            noisy = image + np.random.default_rng(seed).normal(0, 6, image.shape)
+            variants = [
+                encode(image, quality=60),
+                encode(cv2.resize(image, (w // 2, h // 2), interpolation=cv2.INTER_AREA)),
+                encode(cv2.convertScaleAbs(image, alpha=1.0, beta=15)),
+                encode(cv2.GaussianBlur(image, (0, 0), 2)),
+                encode(np.clip(noisy, 0, 255).astype(np.uint8)),
+            ]
+            variant_distances += [hamming(base, phash(_decode_thumbnail(v))) for v in variants]
+
+    distinct = [
+        hamming(a, b) for i, a in enumerate(originals) for b in originals[i + 1:]
+    ]
+    assert max(variant_distances) <= DUPLICATE_EPS
+    assert min(distinct) > DUPLICATE_EPS
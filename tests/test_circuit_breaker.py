@@ -0,0 +1,118 @@
+import pytest
+
+from app.core import circuit_breaker
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState, LatencyTracker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", fake)
+    return fake
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.before_request()
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("test-open", failure_threshold=3, recovery_timeout=10)
+
+    for _ in range(2):
+        breaker.before_request()
+        breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_request()
+    assert error.value.retry_after == pytest.approx(10)
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker("test-reset", failure_threshold=2, recovery_timeout=10)
+
+    breaker.before_request()
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_success()
+    breaker.before_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_allows_single_probe(clock):
+    breaker = CircuitBreaker("test-probe", failure_threshold=1, recovery_timeout=10)
+    _open(breaker)
+
+    clock.now += 10
+    breaker.before_request()
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_probe_success_closes(clock):
+    breaker = CircuitBreaker("test-close", failure_threshold=1, recovery_timeout=10)
+    _open(breaker)
+
+    clock.now += 10
+    breaker.before_request()
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    breaker.before_request()
+    breaker.before_request()
+
+
+def test_probe_failure_reopens(clock):
+    breaker = CircuitBreaker("test-reopen", failure_threshold=3, recovery_timeout=10)
+    _open(breaker)
+
+    clock.now += 10
+    breaker.before_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    clock.now += 5
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_released_probe_lets_next_request_probe(clock):
+    breaker = CircuitBreaker("test-release", failure_threshold=1, recovery_timeout=10)
+    _open(breaker)
+
+    clock.now += 10
+    breaker.before_request()
+    breaker.release_probe()
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.before_request()
+
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker(window=100, min_samples=10)
+    for i in range(9):
+        tracker.observe(i)
+    assert tracker.percentile(0.95) is None
+
+    for i in range(9, 100):
+        tracker.observe(i)
+    assert tracker.percentile(0.95) == 95
+    assert tracker.percentile(1.0) == 99
@@ -0,0 +1,31 @@
+import json
+
+import numpy as np
+
+from app.utils import codec
+from app.utils.codec import FastJSONResponse, json_dumps, json_loads
+
+
+def test_int_keys_are_serialized_like_stdlib_json():
+    value = {1: "a", 2: {3: [1, 2]}}
+
+    assert json_loads(json_dumps(value)) == json.loads(json.dumps(value))
+
+
+def test_fallback_without_orjson_matches(monkeypatch):
+    value = {10: 1.5, "x": None}
+    expected = json_loads(json_dumps(value))
+
+    monkeypatch.setattr(codec, "orjson", None)
+
+    assert json.loads(json_dumps(value)) == expected
+
+
+def test_numpy_values_are_serialized():
+    assert json_loads(json_dumps({"v": np.arange(3, dtype=np.float32)})) == {"v": [0.0, 1.0, 2.0]}
+
+
+def test_response_renders_int_keyed_dict():
+    response = FastJSONResponse({7: "album"})
+
+    assert json.loads(response.body) == {"7": "album"}
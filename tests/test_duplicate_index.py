@@ -0,0 +1,122 @@
+import numpy as np
+
+from app.service import duplicate_index
+from app.service.duplicate_index import AlbumDuplicateIndex
+from app.service.hamming_index import popcount64
+
+EPS = 10
+
+
+def brute_force_groups(refs: list[str], hashes: np.ndarray, eps: int = EPS) -> list[set[str]]:
+    """
+    eps 그래프의 연결 요소(이웃이 있는 이미지만)를 union-find로 직접 계산합니다.
+    """
+    parent = list(range(len(refs)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    distances = popcount64(hashes[:, None] ^ hashes[None, :])
+    has_neighbor = set()
+    for i, j in zip(*np.nonzero(np.triu(distances <= eps, k=1))):
+        parent[find(int(i))] = find(int(j))
+        has_neighbor.update((int(i), int(j)))
+
+    groups: dict[int, set[str]] = {}
+    for k in has_neighbor:
+        groups.setdefault(find(k), set()).add(refs[k])
+    return sorted(groups.values(), key=sorted)
+
+
+def normalize(groups: list[list[str]]) -> list[set[str]]:
+    return sorted((set(group) for group in groups), key=sorted)
+
+
+def make_album(seed: int, centers: int = 12, per_center: int = 5) -> tuple[list[str], np.ndarray]:
+    rng = np.random.default_rng(seed)
+    hashes = []
+    for center in rng.integers(0, 2**64, size=centers, dtype=np.uint64):
+        for _ in range(per_center):
+            flips = rng.choice(64, size=rng.integers(0, 12), replace=False)
+            hashes.append(center ^ np.uint64(sum(1 << int(b) for b in flips)))
+    order = rng.permutation(len(hashes))
+    hashes = np.array(hashes, dtype=np.uint64)[order]
+    return [f"img-{k}.jpg" for k in range(len(hashes))], hashes
+
+
+def test_incremental_extend_matches_from_scratch():
+    refs, hashes = make_album(0)
+    index = AlbumDuplicateIndex.empty(EPS)
+    for start in range(0, len(refs), 7):
+        index = index.extend(refs[start : start + 7], hashes[start : start + 7])
+
+    assert normalize(index.groups(refs)) == brute_force_groups(refs, hashes)
+
+
+def test_extend_merges_components_through_new_bridge():
+    a = np.uint64(0)
+    b = np.uint64((1 << 16) - 1)  # a와 거리 16
+    bridge = np.uint64((1 << 8) - 1)  # a, b와 각각 거리 8
+    index = AlbumDuplicateIndex.empty(EPS).extend(
+        ["a", "a2", "b", "b2"], np.array([a, a ^ np.uint64(1), b, b ^ np.uint64(1)])
+    )
+    assert normalize(index.groups(["a", "a2", "b", "b2"])) == [{"a", "a2"}, {"b", "b2"}]
+
+    index = index.extend(["bridge"], np.array([bridge]))
+
+    assert normalize(index.groups(["a", "a2", "b", "b2", "bridge"])) == [
+        {"a", "a2", "b", "b2", "bridge"}
+    ]
+
+
+def test_bulk_extend_uses_mih_and_matches(monkeypatch):
+    monkeypatch.setattr(duplicate_index, "DENSE_MATRIX_MAX_IMAGES", 8)
+    refs, hashes = make_album(1)
+
+    index = AlbumDuplicateIndex.empty(EPS).extend(refs[:20], hashes[:20]).extend(refs[20:], hashes[20:])
+
+    assert normalize(index.groups(refs)) == brute_force_groups(refs, hashes)
+
+
+def test_restrict_splits_components_when_bridge_is_removed():
+    a, b, bridge = np.uint64(0), np.uint64((1 << 16) - 1), np.uint64((1 << 8) - 1)
+    index = AlbumDuplicateIndex.empty(EPS).extend(["a", "b", "bridge"], np.array([a, b, bridge]))
+    assert normalize(index.groups(["a", "b", "bridge"])) == [{"a", "b", "bridge"}]
+
+    restricted = index.restrict({"a", "b"})
+
+    assert restricted.image_refs == ["a", "b"]
+    assert restricted.groups(["a", "b"]) == []
+
+
+def test_restrict_matches_from_scratch_and_keeps_unchanged_index():
+    refs, hashes = make_album(2)
+    index = AlbumDuplicateIndex.empty(EPS).extend(refs, hashes)
+    kept = [ref for k, ref in enumerate(refs) if k % 3]
+    kept_hashes = hashes[[k for k in range(len(refs)) if k % 3]]
+
+    restricted = index.restrict(set(kept))
+
+    assert normalize(restricted.groups(kept)) == brute_force_groups(kept, kept_hashes)
+    assert index.restrict(set(refs)) is index
+
+
+def test_groups_follow_request_order():
+    index = AlbumDuplicateIndex.empty(EPS).extend(
+        ["x", "y", "z", "solo"],
+        np.array([0, 1, 3, (1 << 64) - 1], dtype=np.uint64),
+    )
+
+    assert index.groups(["z", "x", "solo", "y"]) == [["z", "x", "y"]]
+
+
+def test_small_work_buffer_splits_blocks(monkeypatch):
+    monkeypatch.setattr(duplicate_index, "HAMMING_BUFFER_MAX_ELEMENTS", 64)
+    refs, hashes = make_album(3)
+
+    index = AlbumDuplicateIndex.empty(EPS).extend(refs[:30], hashes[:30]).extend(refs[30:], hashes[30:])
+
+    assert normalize(index.groups(refs)) == brute_force_groups(refs, hashes)
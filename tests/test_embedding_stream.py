@@ -0,0 +1,84 @@
+import struct
+
+import httpx
+import pytest
+
+from app.core.embedding_stream import (
+    EMBEDDING_STREAM_MEDIA_TYPE,
+    END_OF_STREAM,
+    encode_frame,
+    iter_embedding_frames,
+    iter_frame_payloads,
+)
+
+ITEMS = [
+    ("a.jpg", b"OE" + bytes(range(30))),
+    ("앨범/사진.png", b"OE" + b"\x01" * 514),
+    ("empty", b""),
+]
+
+
+def _fake_gpu_server(body: bytes, piece_size: int) -> httpx.MockTransport:
+    """
+    스트리밍 응답을 piece_size bytes씩 나눠 보내는 GPU 서버 대역입니다.
+    """
+
+    async def pieces():
+        for i in range(0, len(body), piece_size):
+            yield body[i : i + piece_size]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["accept"] == EMBEDDING_STREAM_MEDIA_TYPE
+        return httpx.Response(
+            200,
+            headers={"content-type": EMBEDDING_STREAM_MEDIA_TYPE},
+            content=pieces(),
+        )
+
+    return httpx.MockTransport(handler)
+
+
+async def _read_all(body: bytes, piece_size: int) -> list[tuple[str, bytes]]:
+    transport = _fake_gpu_server(body, piece_size)
+    async with httpx.AsyncClient(transport=transport, base_url="http://gpu") as client:
+        async with client.stream(
+            "POST",
+            "/clip/embedding",
+            headers={"Accept": EMBEDDING_STREAM_MEDIA_TYPE},
+        ) as response:
+            return [item async for item in iter_frame_payloads(response.aiter_bytes())]
+
+
+@pytest.mark.parametrize("piece_size", [1, 3, 7, 64, 1 << 16])
+async def test_stream_round_trip_through_http(piece_size):
+    body = b"".join(iter_embedding_frames(ITEMS))
+
+    assert await _read_all(body, piece_size) == ITEMS
+
+
+async def test_bytes_after_terminator_are_ignored():
+    body = b"".join(iter_embedding_frames(ITEMS[:1])) + b"garbage"
+
+    assert await _read_all(body, 5) == ITEMS[:1]
+
+
+async def test_stream_truncated_on_frame_boundary_raises():
+    body = b"".join(encode_frame(ref, payload) for ref, payload in ITEMS)
+
+    with pytest.raises(ValueError):
+        await _read_all(body, 8)
+
+
+async def test_stream_truncated_mid_frame_raises():
+    body = b"".join(iter_embedding_frames(ITEMS))
+    cut = len(encode_frame(*ITEMS[0])) + 5
+
+    with pytest.raises(ValueError):
+        await _read_all(body[:cut], 4)
+
+
+def test_frame_layout():
+    frame = encode_frame("ab", b"xyz")
+
+    assert frame == struct.pack("<I", 7) + struct.pack("<H", 2) + b"ab" + b"xyz"
+    assert END_OF_STREAM == b"\x00\x00\x00\x00"
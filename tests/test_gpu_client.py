@@ -0,0 +1,144 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core import gpu_client as gpu_client_module
+from app.core.circuit_breaker import CircuitOpenError, CircuitState, LatencyTracker
+from app.core.gpu_client import EndpointPolicy, GpuClient
+from tests.conftest import wait_until
+
+PATH = "/clip/embedding"
+
+
+def _half_open(client: GpuClient, path: str = PATH):
+    """
+    서킷을 연 뒤 바로 시험 요청을 받을 수 있는 상태로 만듭니다.
+    """
+    breaker = client.breaker(path)
+    breaker.recovery_timeout = 0
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    return breaker
+
+
+async def test_server_errors_open_circuit(gpu_client, fake_gpu_server):
+    async def fail(request):
+        return httpx.Response(503)
+
+    fake_gpu_server.handler = fail
+    breaker = gpu_client.breaker(PATH)
+
+    for _ in range(breaker.failure_threshold):
+        response = await gpu_client.post(PATH, json={})
+        assert response.status_code == 503
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        await gpu_client.post(PATH, json={})
+    assert len(fake_gpu_server.requests) == breaker.failure_threshold
+
+
+async def test_cancelled_probe_is_released(gpu_client, fake_gpu_server):
+    async def hang(request):
+        await asyncio.sleep(3600)
+
+    breaker = _half_open(gpu_client)
+    fake_gpu_server.handler = hang
+    task = asyncio.create_task(gpu_client.post(PATH, json={}))
+    await wait_until(lambda: fake_gpu_server.active == 1)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    fake_gpu_server.handler = fake_gpu_server.ok
+    response = await gpu_client.post(PATH, json={})
+    assert response.status_code == 200
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_slot_error_is_recorded(gpu_client, monkeypatch):
+    def broken_slot(path):
+        raise RuntimeError("slot")
+
+    breaker = _half_open(gpu_client)
+    monkeypatch.setattr(gpu_client, "_slot", broken_slot)
+
+    with pytest.raises(RuntimeError):
+        await gpu_client.post(PATH, json={})
+
+    assert breaker.state == CircuitState.OPEN
+
+
+async def test_stream_success_is_recorded_after_body(gpu_client):
+    breaker = _half_open(gpu_client)
+
+    async with gpu_client.stream("POST", PATH, json={}) as response:
+        await response.aread()
+        assert breaker.state == CircuitState.HALF_OPEN
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_stream_body_error_is_recorded(gpu_client):
+    breaker = _half_open(gpu_client)
+
+    with pytest.raises(ValueError):
+        async with gpu_client.stream("POST", PATH, json={}):
+            raise ValueError("truncated stream")
+
+    assert breaker.state == CircuitState.OPEN
+
+    # 시험 요청 자리가 반환되어 다음 요청이 다시 시험 요청이 됨
+    async with gpu_client.stream("POST", PATH, json={}):
+        pass
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_stream_releases_slot(gpu_client):
+    semaphore = gpu_client._semaphores[PATH]
+    available = semaphore._value
+
+    async with gpu_client.stream("POST", PATH, json={}):
+        assert semaphore._value == available - 1
+
+    assert semaphore._value == available
+
+
+@pytest.mark.parametrize(
+    "concurrency, expected_body, expected_requests",
+    [(1, "slow", 1), (2, "fast", 2)],
+)
+async def test_hedge_takes_its_own_slot(
+    monkeypatch, fake_gpu_server, concurrency, expected_body, expected_requests
+):
+    monkeypatch.setitem(
+        gpu_client_module.ENDPOINT_POLICIES,
+        "/hedge",
+        EndpointPolicy(concurrency=concurrency, read_timeout=5, hedge=True),
+    )
+
+    async def first_slow(request):
+        if len(fake_gpu_server.requests) == 1:
+            await asyncio.sleep(0.3)
+            return httpx.Response(200, text="slow")
+        return httpx.Response(200, text="fast")
+
+    fake_gpu_server.handler = first_slow
+    client = GpuClient("http://gpu", http2=False, transport=fake_gpu_server.transport)
+    tracker = LatencyTracker(min_samples=1)
+    tracker.observe(0.01)
+    client._latencies["/hedge"] = tracker
+
+    try:
+        response = await client.post("/hedge", json={})
+    finally:
+        await client.aclose()
+
+    # 슬롯이 하나뿐이면 헤지 요청은 슬롯을 기다리다 취소되어 서버에 도달하지 않음
+    assert response.text == expected_body
+    assert len(fake_gpu_server.requests) == expected_requests
+    assert fake_gpu_server.max_active == expected_requests
+    assert client._semaphores["/hedge"]._value == concurrency
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from app.service import hamming_index
+from app.service.hamming_index import find_hamming_pairs, popcount64
+
+
+def brute_force_pairs(packed: np.ndarray, eps: int) -> set[tuple[int, int]]:
+    distances = popcount64(packed[:, None] ^ packed[None, :])
+    i, j = np.nonzero(np.triu(distances <= eps, k=1))
+    return set(zip(i.tolist(), j.tolist()))
+
+
+def clustered_hashes(rng: np.random.Generator, centers: int, per_center: int) -> np.ndarray:
+    """
+    중심 해시마다 비트 몇 개를 뒤집은 해시를 만들어 eps 근처 거리의 쌍이 많이 생기게 합니다.
+    """
+    base = rng.integers(0, 2**64, size=centers, dtype=np.uint64)
+    hashes = []
+    for center in base:
+        for _ in range(per_center):
+            flips = rng.choice(64, size=rng.integers(0, 9), replace=False)
+            mask = np.uint64(sum(1 << int(b) for b in flips))
+            hashes.append(center ^ mask)
+    return np.array(hashes, dtype=np.uint64)
+
+
+@pytest.mark.parametrize(
+    "eps, k", [(0, 4), (3, 4), (7, 4), (10, 4), (12, 4), (5, 2), (8, 3), (10, 3)]
+)
+def test_mih_matches_brute_force(eps, k):
+    rng = np.random.default_rng(eps * 10 + k)
+    packed = clustered_hashes(rng, centers=40, per_center=6)
+
+    i, j, distances = find_hamming_pairs(packed, eps=eps, k=k)
+
+    assert set(zip(i.tolist(), j.tolist())) == brute_force_pairs(packed, eps)
+    assert np.array_equal(distances, popcount64(packed[i] ^ packed[j]))
+    assert np.all(i < j)
+
+
+def test_mih_finds_identical_hashes():
+    packed = np.array([5, 5, 5, 1 << 63], dtype=np.uint64)
+
+    i, j, distances = find_hamming_pairs(packed, eps=0)
+
+    assert set(zip(i.tolist(), j.tolist())) == {(0, 1), (0, 2), (1, 2)}
+    assert not distances.any()
+
+
+def test_mih_splits_candidate_chunks(monkeypatch):
+    monkeypatch.setattr(hamming_index, "MIH_MAX_PAIRS_PER_CHUNK", 7)
+    rng = np.random.default_rng(0)
+    packed = clustered_hashes(rng, centers=10, per_center=8)
+
+    i, j, _ = find_hamming_pairs(packed, eps=10)
+
+    assert set(zip(i.tolist(), j.tolist())) == brute_force_pairs(packed, 10)
+
+
+
+def test_popcount_matches_bin_count():
+    rng = np.random.default_rng(1)
+    values = rng.integers(0, 2**64, size=(16, 8), dtype=np.uint64)
+    expected = np.array([[bin(int(v)).count("1") for v in row] for row in values], dtype=np.uint8)
+
+    out = np.empty(values.shape, dtype=np.uint8)
+    assert popcount64(values, out) is out
+    assert np.array_equal(out, expected)
@@ -0,0 +1,302 @@
+import asyncio
+import json
+from collections import namedtuple
+from contextlib import asynccontextmanager
+
+import pytest
+from aiokafka.structs import TopicPartition
+
+from app.schemas.kafka.base import KafkaRequest
+from app.utils import kafka_utils
+from app.utils.kafka_utils import (
+    AdaptivePoller,
+    KeyOrderedExecutor,
+    SkippedMessageError,
+    process_partition_batch,
+)
+
+TOPIC = "album.ai.duplicate.request"
+TP = TopicPartition(TOPIC, 0)
+Record = namedtuple("Record", "topic partition offset key value")
+
+
+def _records(values, start=100):
+    return [
+        Record(TOPIC, 0, start + i, None, value if isinstance(value, bytes) else json.dumps(value).encode())
+        for i, value in enumerate(values)
+    ]
+
+
+# ---------------------------------------------------------------- KeyOrderedExecutor
+
+
+async def test_same_key_runs_in_order_and_other_keys_overlap():
+    events = []
+    running = 0
+    max_running = 0
+
+    async def func(item):
+        nonlocal running, max_running
+        key, index, delay = item
+        running += 1
+        max_running = max(max_running, running)
+        events.append(("start", key, index))
+        await asyncio.sleep(delay)
+        events.append(("end", key, index))
+        running -= 1
+        return index
+
+    items = [("a", 0, 0.03), ("b", 1, 0.01), ("a", 2, 0.0), ("b", 3, 0.0), ("a", 4, 0.0)]
+    executor = KeyOrderedExecutor(concurrency=4)
+    results = await executor.run(_records(items), items, [key for key, _, _ in items], func)
+
+    assert results == [0, 1, 2, 3, 4]
+    assert max_running >= 2
+    # 같은 키는 앞 메시지가 끝난 뒤에 다음 메시지 시작
+    a_events = [(kind, index) for kind, key, index in events if key == "a"]
+    assert a_events == [("start", 0), ("end", 0), ("start", 2), ("end", 2), ("start", 4), ("end", 4)]
+    b_events = [(kind, index) for kind, key, index in events if key == "b"]
+    assert b_events == [("start", 1), ("end", 1), ("start", 3), ("end", 3)]
+    assert executor.committed_offset == 105
+    assert executor.completed_count == 5
+
+
+async def test_failure_skips_later_messages_of_same_key_and_stops_watermark():
+    async def func(item):
+        if item == "a-fail":
+            raise RuntimeError("boom")
+        await asyncio.sleep(0)
+        return item
+
+    items = ["a-ok", "a-fail", "b-ok", "a-skipped", "b-ok2"]
+    keys = ["a", "a", "b", "a", "b"]
+    executor = KeyOrderedExecutor(concurrency=2)
+    results = await executor.run(_records(items), items, keys, func)
+
+    assert results[0] == "a-ok"
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == "b-ok"
+    assert isinstance(results[3], SkippedMessageError)
+    assert results[4] == "b-ok2"
+    # 101에서 실패했으므로 100까지만 커밋
+    assert executor.completed_count == 1
+    assert executor.committed_offset == 101
+
+
+async def test_watermark_waits_for_slow_earlier_message():
+    release = asyncio.Event()
+    watermarks = []
+
+    async def func(item):
+        if item == 0:
+            await release.wait()
+        return item
+
+    executor = KeyOrderedExecutor(concurrency=3)
+    items = [0, 1, 2]
+    task = asyncio.create_task(executor.run(_records(items), items, ["x", "y", "z"], func))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    watermarks.append(executor.committed_offset)
+
+    release.set()
+    await task
+    watermarks.append(executor.committed_offset)
+
+    # 뒤 메시지가 먼저 끝나도 앞 메시지가 끝나기 전에는 커밋 오프셋이 움직이지 않음
+    assert watermarks == [100, 103]
+
+
+async def test_shared_semaphore_limits_concurrency():
+    semaphore = asyncio.Semaphore(1)
+    running = 0
+    max_running = 0
+
+    async def func(item):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    items = list(range(4))
+    await KeyOrderedExecutor(8, semaphore).run(_records(items), items, [None] * 4, func)
+
+    assert max_running == 1
+
+
+# ---------------------------------------------------------------- process_partition_batch
+
+
+class FakeProducer:
+    def __init__(self, fail_commit=False):
+        self.fail_commit = fail_commit
+        self.sent = []
+        self.offsets = []
+        self.committed = 0
+        self.aborted = 0
+
+    async def begin_transaction(self):
+        pass
+
+    async def send(self, topic, key, value):
+        self.sent.append(value)
+
+    async def send_offsets_to_transaction(self, offsets, group_id):
+        self.offsets.append(offsets)
+
+    async def commit_transaction(self):
+        if self.fail_commit:
+            raise RuntimeError("commit failed")
+        self.committed += 1
+
+    async def abort_transaction(self):
+        self.aborted += 1
+
+
+class FakeProducerPool:
+    def __init__(self, producer):
+        self.producer = producer
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.producer
+
+
+async def _echo(message):
+    return {"taskId": message.taskId, "albumId": message.albumId, "statusCode": 200}
+
+
+async def test_malformed_record_is_answered_with_400_and_committed():
+    producer = FakeProducer()
+    batch = _records([
+        {"taskId": "t1", "albumId": 1},
+        {"taskId": "t2"},
+        b"not json",
+        {"taskId": "t4", "albumId": 4},
+    ])
+
+    next_offset = await process_partition_batch(
+        TP, batch, FakeProducerPool(producer), {TOPIC: _echo}, {TOPIC: KafkaRequest}, "group"
+    )
+
+    assert next_offset == 104
+    assert producer.offsets == [{TP: 104}]
+    assert producer.sent[0]["taskId"] == "t1"
+    assert producer.sent[1].statusCode == 400
+    assert producer.sent[1].taskId == "t2"
+    assert producer.sent[1].albumId == -1
+    assert producer.sent[2].statusCode == 400
+    assert producer.sent[2].taskId == "unknown"
+    assert producer.sent[3]["taskId"] == "t4"
+
+
+async def test_failed_commit_aborts_and_returns_first_offset():
+    producer = FakeProducer(fail_commit=True)
+    batch = _records([{"taskId": "t1", "albumId": 1}])
+
+    next_offset = await process_partition_batch(
+        TP, batch, FakeProducerPool(producer), {TOPIC: _echo}, {TOPIC: KafkaRequest}, "group"
+    )
+
+    assert next_offset == 100
+    assert producer.aborted == 1
+
+
+# ---------------------------------------------------------------- AdaptivePoller
+
+
+class FakeConsumer:
+    def __init__(self, assigned):
+        self.assigned = set(assigned)
+        self._paused = set()
+        self.seeks = []
+
+    def assignment(self):
+        return set(self.assigned)
+
+    def paused(self):
+        return set(self._paused)
+
+    def pause(self, *tps):
+        self._paused.update(tps)
+
+    def resume(self, *tps):
+        self._paused.difference_update(tps)
+
+    def seek(self, tp, offset):
+        self.seeks.append((tp, offset))
+
+
+async def _finished(value):
+    return value
+
+
+async def test_failed_batch_is_retried_with_growing_backoff(monkeypatch):
+    monkeypatch.setattr(kafka_utils, "KAFKA_RETRY_BACKOFF_MIN_MS", 100)
+    monkeypatch.setattr(kafka_utils, "KAFKA_RETRY_BACKOFF_MAX_MS", 250)
+    consumer = FakeConsumer([TP])
+    poller = AdaptivePoller(consumer, None, "group")
+    batch = _records([{}, {}])
+    delays = []
+
+    for _ in range(3):
+        task = asyncio.ensure_future(_finished(100))
+        await task
+        before = kafka_utils.time.monotonic()
+        poller._on_done(TP, batch, before, task)
+        delays.append(round(poller._retry_after[TP] - before, 2))
+        poller._apply_backpressure()
+        assert TP in consumer.paused()
+
+    assert consumer.seeks == [(TP, 100)] * 3
+    assert delays == [0.1, 0.2, 0.25]
+
+    # 배치 전체를 커밋하면 실패 횟수 초기화, 대기 시간이 지나면 resume
+    task = asyncio.ensure_future(_finished(102))
+    await task
+    poller._on_done(TP, batch, kafka_utils.time.monotonic(), task)
+    poller._retry_after[TP] = 0
+    poller._apply_backpressure()
+    assert TP not in poller._retry_failures
+    assert TP not in consumer.paused()
+
+
+async def test_revoked_partition_drains_or_cancels_inflight_batches():
+    other = TopicPartition(TOPIC, 1)
+    consumer = FakeConsumer([TP, other])
+    finished = []
+    cancelled = []
+
+    async def process(tp, batch):
+        try:
+            await asyncio.sleep(0.01 if tp == TP else 3600)
+            finished.append(tp)
+            return batch[-1].offset + 1
+        except asyncio.CancelledError:
+            cancelled.append(tp)
+            raise
+
+    poller = AdaptivePoller(consumer, process, "group", revoke_drain_seconds=0.2)
+    poller._retry_failures[other] = 3
+    poller._retry_after[other] = float("inf")
+    poller._dispatch(TP, _records([{}]))
+    poller._dispatch(other, _records([{}]))
+
+    await poller.rebalance_listener.on_partitions_revoked({TP, other})
+
+    assert finished == [TP]
+    assert cancelled == [other]
+    assert poller._inflight == {}
+    assert poller._retry_failures == {}
+    assert poller._retry_after == {}
+    assert consumer.seeks == []
+
+
+@pytest.mark.parametrize("value", [b"[]", b'{"taskId": 1, "albumId": true}'])
+def test_invalid_request_response_defaults(value):
+    record = _records([value])[0]
+
+    response = kafka_utils._invalid_request_response(record)
+
+    assert (response.taskId, response.albumId, response.statusCode) == ("unknown", -1, 400)
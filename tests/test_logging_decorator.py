@@ -0,0 +1,36 @@
+import logging
+
+import pytest
+
+from app.utils.logging_decorator import get_flow_stats, trace_flow
+
+
+@trace_flow
+def double(value: int) -> int:
+    if value < 0:
+        raise ValueError("negative")
+    return value * 2
+
+
+FLOW_NAME = f"{__name__}.double"
+
+
+def test_trace_flow_is_bare_call_without_debug(caplog):
+    caplog.set_level(logging.INFO, logger=__name__)
+    before = get_flow_stats()[FLOW_NAME]["calls"]
+
+    assert double(2) == 4
+    assert get_flow_stats()[FLOW_NAME]["calls"] == before
+
+
+def test_trace_flow_aggregates_when_debug_enabled(caplog):
+    caplog.set_level(logging.DEBUG, logger=__name__)
+    before = get_flow_stats()[FLOW_NAME]
+
+    assert double(3) == 6
+    with pytest.raises(ValueError):
+        double(-1)
+
+    after = get_flow_stats()[FLOW_NAME]
+    assert after["calls"] == before["calls"] + 2
+    assert after["errors"] == before["errors"] + 1